@@ -1,7 +1,8 @@
 # apis/deps.py
-from typing import Generator
+from typing import Generator, AsyncGenerator
 
 from bots.english_bot import english_bot
+from utils.async_mysql_connector import AsyncMySQLConnector
 from utils.mysql_connector import MySQLConnector
 
 
@@ -13,5 +14,13 @@ def get_db() -> Generator:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator:
+    db = AsyncMySQLConnector()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
 def get_bot() -> english_bot:
     return english_bot
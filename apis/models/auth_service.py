@@ -3,7 +3,7 @@ from typing import Optional
 
 from passlib.context import CryptContext
 
-from utils.mysql_connector import MySQLConnector
+from utils.async_mysql_connector import AsyncMySQLConnector
 from .user import User
 
 pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
@@ -11,12 +11,12 @@ pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 
 class AuthService:
     def __init__(self):
-        self.db = MySQLConnector()
+        self.db = AsyncMySQLConnector()
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         return pwd_context.verify(plain_password, hashed_password)
 
-    def authenticate_user(self, email: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """사용자 인증
 
         Args:
@@ -26,7 +26,7 @@ class AuthService:
         Returns:
             Optional[User]: 인증된 사용자 정보 또는 None
         """
-        results = self.db.select(
+        results = await self.db.select(
             table="user",
             where={"email": email, "is_active": "Y"}
         )
@@ -4,8 +4,8 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from utils.auth import get_current_user
-from utils.mysql_connector import MySQLConnector
-from ..deps import get_db
+from utils.async_mysql_connector import AsyncMySQLConnector
+from ..deps import get_async_db
 from ..models.answer import Answer, AnswerCreate, AnswerUpdate
 
 router = APIRouter(prefix="/api/v1/answers", tags=["answers"])
@@ -14,7 +14,7 @@ router = APIRouter(prefix="/api/v1/answers", tags=["answers"])
 @router.get("/counts")
 async def get_answers_counts(
         talk_ids: str = Query(..., description="콤마로 구분된 talk_id 목록"),
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """현재 페이지의 답변 개수 일괄 조회"""
     try:
@@ -35,7 +35,7 @@ async def get_answers_counts(
             GROUP BY talk_id
         """
 
-        results = db.execute_raw_query(query)
+        results = await db.fetch_all(query)
 
         counts = {row['talk_id']: row['answer_count'] for row in results}
         return [
@@ -56,7 +56,7 @@ async def get_answers_counts(
 @router.get("/{talk_id}", response_model=List[Answer])
 async def get_answers(
         talk_id: int,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """답변 목록 조회"""
     query = """
@@ -66,7 +66,7 @@ async def get_answers(
         WHERE talk_id = %(talk_id)s
         ORDER BY answer_id
     """
-    return db.execute_raw_query(query, {'talk_id': talk_id})
+    return await db.fetch_all(query, {'talk_id': talk_id})
 
 
 # 생성/수정/삭제는 인증 필요
@@ -74,13 +74,13 @@ async def get_answers(
 async def create_answer(
         answer: AnswerCreate,
         current_user=Depends(get_current_user),
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """답변 생성"""
     data = answer.dict()
-    result = db.insert('answer', data)
+    result = await db.insert('answer', data)
 
-    created = db.execute_raw_query(
+    created = await db.fetch_all(
         """
         SELECT answer_id, talk_id, eng_sentence, kor_sentence, update_at
         FROM answer 
@@ -100,11 +100,11 @@ async def update_answer(
         answer_id: int,
         answer: AnswerUpdate,
         current_user=Depends(get_current_user),
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """답변 수정"""
     data = answer.dict()
-    result = db.update(
+    result = await db.update(
         'answer',
         data,
         {'answer_id': answer_id}
@@ -113,7 +113,7 @@ async def update_answer(
     if result['affected_rows'] == 0:
         raise HTTPException(status_code=404, detail="Answer not found")
 
-    updated = db.execute_raw_query(
+    updated = await db.fetch_all(
         """
         SELECT answer_id, talk_id, eng_sentence, kor_sentence, update_at
         FROM answer 
@@ -132,10 +132,10 @@ async def update_answer(
 async def delete_answer(
         answer_id: int,
         current_user=Depends(get_current_user),
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """답변 삭제"""
-    result = db.delete('answer', {'answer_id': answer_id})
+    result = await db.delete('answer', {'answer_id': answer_id})
     if result['affected_rows'] == 0:
         raise HTTPException(status_code=404, detail="Answer not found")
     return {"message": "Answer deleted"}
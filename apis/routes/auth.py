@@ -35,7 +35,7 @@ async def login(user_data: UserLogin):
         HTTPException: 인증 실패 시
     """
     auth_service = AuthService()
-    user = auth_service.authenticate_user(user_data.email, user_data.password)
+    user = await auth_service.authenticate_user(user_data.email, user_data.password)
 
     if not user:
         raise HTTPException(
@@ -2,9 +2,10 @@
 import logging
 
 from fastapi import APIRouter, HTTPException
+from starlette.concurrency import run_in_threadpool
 
 from bots.english_bot import english_bot
-from utils.mysql_connector import MySQLConnector
+from utils.async_mysql_connector import AsyncMySQLConnector
 from utils.scheduler import message_scheduler
 
 # 로거 설정
@@ -58,17 +59,15 @@ async def send_message_now():
                 detail="Bot is not running. Please start the bot first."
             )
 
-        # 데이터 존재 여부 체크
-        db = MySQLConnector()
-        count_result = db.execute_raw_query("""
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN cycle_number IS NULL OR cycle_number = 0 THEN 1 ELSE 0 END) as available
-            FROM small_talk
-        """)
-
-        total = count_result[0]['total']
-        available = count_result[0]['available']
+        # 데이터 존재 여부 체크 (덱 상태로 확인하고, 덱이 아직 없을 때만 COUNT 실행)
+        deck_status = await run_in_threadpool(english_bot.get_deck_status)
+        if deck_status:
+            total = deck_status['deck_size']
+            available = deck_status['remaining']
+        else:
+            db = AsyncMySQLConnector()
+            count_result = await db.fetch_one("SELECT COUNT(*) as total FROM small_talk")
+            total = available = count_result['total']
 
         if total == 0:
             raise HTTPException(
@@ -76,19 +75,14 @@ async def send_message_now():
                 detail="No messages found in database. Please add some messages first."
             )
 
-        if available == 0:
-            raise HTTPException(
-                status_code=400,
-                detail=f"All {total} messages have been sent in current cycle. Consider resetting the cycle."
-            )
-
-        current_cycle = english_bot.get_current_cycle()
+        # EnglishBot은 스케줄러 스레드와 공유하는 동기 객체이므로 스레드풀에서 실행
+        current_cycle = await run_in_threadpool(english_bot.get_current_cycle)
         logger.info(f"Current cycle: {current_cycle}, Total messages: {total}, Available messages: {available}")
 
-        result = english_bot.process_messages()
+        result = await run_in_threadpool(english_bot.process_messages)
 
         if result:
-            new_cycle = english_bot.get_current_cycle()
+            new_cycle = await run_in_threadpool(english_bot.get_current_cycle)
             return {
                 "status": "success",
                 "message": "Message sent successfully",
@@ -121,8 +115,8 @@ async def get_bot_status():
     try:
         status = {
             "is_running": english_bot.is_running(),
-            "current_cycle": english_bot.get_current_cycle(),
-            "last_message_time": english_bot.get_last_message_time(),
+            "current_cycle": await run_in_threadpool(english_bot.get_current_cycle),
+            "last_message_time": await run_in_threadpool(english_bot.get_last_message_time),
             "scheduler": {
                 "is_running": message_scheduler.is_running(),
                 "jobs": message_scheduler.get_jobs() if message_scheduler.is_running() else []
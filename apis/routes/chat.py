@@ -1,24 +1,28 @@
 # apis/routes/chat.py
-import asyncio
 import logging
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from starlette.responses import Response
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
 
 from apis.models.chat import (
     ChatHistoryResponse,
     ConversationResponse,
     ChatStreamRequest
 )
-from bots.openai_bot import OpenAIBot
+from bots.openai_bot import get_openai_bot
 from chat.chat_manager import ChatManager
+from chat.constants import MAX_HISTORY_PER_CONV, STREAM_ERROR_MARKER
 from chat.exceptions import (
     ChatBaseException,
     DatabaseError,
     ConversationNotFound,
-    OpenAIError
+    OpenAIError,
+    OpenAITimeout,
+    RateLimitTimeout
 )
+from chat.write_behind import get_chat_write_behind
 from utils.auth import get_current_user, User
 
 logger = logging.getLogger(__name__)
@@ -27,7 +31,6 @@ router = APIRouter(prefix="/api/v1/chat", tags=["chat"])
 
 # 싱글톤 인스턴스 생성
 _chat_manager = None
-_openai_bot = None
 
 
 def get_chat_manager():
@@ -37,13 +40,6 @@ def get_chat_manager():
     return _chat_manager
 
 
-def get_openai_bot():
-    global _openai_bot
-    if _openai_bot is None:
-        _openai_bot = OpenAIBot()
-    return _openai_bot
-
-
 @router.get("/conversations", response_model=List[ConversationResponse])
 async def get_user_conversations(
         current_user: User = Depends(get_current_user)
@@ -53,20 +49,9 @@ async def get_user_conversations(
         chat_manager = get_chat_manager()
         logger.debug(f"Fetching conversations for user: {current_user.user_id}")
 
-        # 비동기로 실행
-        loop = asyncio.get_running_loop()
-        try:
-            conversations = await loop.run_in_executor(
-                None,
-                chat_manager.get_user_conversations,
-                current_user.user_id
-            )
-            logger.info(f"Found {len(conversations) if conversations else 0} conversations")
-            return conversations or []
-
-        except Exception as e:
-            logger.error(f"Error in run_in_executor: {str(e)}", exc_info=True)
-            raise
+        conversations = await chat_manager.get_user_conversations(current_user.user_id)
+        logger.info(f"Found {len(conversations) if conversations else 0} conversations")
+        return conversations or []
 
     except ChatBaseException as e:
         logger.error(f"Chat error: {str(e)}")
@@ -91,9 +76,18 @@ async def get_user_conversations(
 @router.get("/history/{conversation_id}", response_model=List[ChatHistoryResponse])
 async def get_chat_history(
         conversation_id: str,
+        before: Optional[int] = Query(default=None, ge=1, description="이 chat_history_id 이전 메시지 조회 (과거 페이지)"),
+        after: Optional[int] = Query(default=None, ge=0, description="이 chat_history_id 이후 메시지 조회 (증분 동기화)"),
+        limit: int = Query(default=MAX_HISTORY_PER_CONV, ge=1, le=MAX_HISTORY_PER_CONV),
         current_user: User = Depends(get_current_user)
 ):
-    """대화 내역 조회"""
+    """대화 내역 조회 (오래된 순, before/after 커서로 페이지 이동)"""
+    if before is not None and after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="before and after cannot be used together"
+        )
+
     try:
         chat_manager = get_chat_manager()
 
@@ -105,15 +99,12 @@ async def get_chat_history(
                 detail="You don't have permission to access this conversation"
             )
 
-        # 대화 내역 조회: get_chat_history는 동기 함수이므로 run_in_executor를 사용
-        loop = asyncio.get_running_loop()
-        history = await loop.run_in_executor(
-            None,
-            chat_manager.get_chat_history,
-            conversation_id
-        )
+        # 대화 내역 조회
+        history = await chat_manager.get_chat_history(conversation_id, before=before, after=after, limit=limit)
         return history
 
+    except HTTPException:
+        raise
     except ConversationNotFound as e:
         logger.warning(f"Conversation not found: {conversation_id}")
         raise HTTPException(
@@ -180,11 +171,15 @@ async def stream_chat(
         message: ChatStreamRequest,
         current_user: User = Depends(get_current_user)
 ):
-    """채팅 응답 생성 및 저장"""
+    """
+    채팅 응답 스트리밍 및 저장
+
+    스트리밍 도중 OpenAI 오류로 응답이 끊기면 본문 끝에 STREAM_ERROR_MARKER와 사유를 붙이고 메시지는 저장하지 않는다.
+    """
     try:
         chat_manager = get_chat_manager()
 
-        # 1. 대화 ID가 있는 경우 존재 및 권한 확인
+        # 1. 대화 ID가 있는 경우 존재 및 권한 확인, 새 대화면 OpenAI 호출 전에 대화 개수 한도 확인
         conversation_id = message.conversation_id
         if conversation_id:
             try:
@@ -199,45 +194,128 @@ async def stream_chat(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Conversation not found"
                 )
+        else:
+            await chat_manager.check_conversation_limit(current_user.user_id)
+            # 새 대화는 응답 헤더로 ID를 먼저 보내야 하므로 ID만 예약하고,
+            # 대화 행은 응답이 끝난 뒤 첫 메시지와 한 트랜잭션으로 만든다 (실패한 스트림은 빈 대화를 남기지 않음)
+            conversation_id = await chat_manager.reserve_conversation_id()
 
-        # 2. OpenAI 응답 생성
+        # 2. OpenAI 응답 스트림 시작
+        # 첫 조각을 미리 받아서 OpenAI 오류는 스트리밍 시작 전에 HTTP 오류로 반환
         bot = get_openai_bot()
-        response = await bot.generate_stream(
+        stream = bot.stream_response(
             user_message=message.content,
             user_id=current_user.user_id,
-            conversation_id=conversation_id
+            conversation_id=message.conversation_id  # 기존 대화면 이전 맥락 포함 (봇 대화 캐시도 봇이 갱신)
         )
-
-        # 3. 메시지 저장 (새 대화 생성 포함)
         try:
-            result = await chat_manager.save_message(
-                user_id=current_user.user_id,
-                user_message=message.content,
-                bot_response=response,
-                conversation_id=message.conversation_id
-            )
-            # 새 대화가 생성된 경우 conversation_id를 가져옴
-            conversation_id = result.get('conversation_id') or message.conversation_id
-        except Exception as e:
-            logger.error(f"Failed to save message: {str(e)}")
-            # 메시지 저장 실패는 사용자 응답에 영향을 주지 않도록 함
-            pass
-
-        # 4. 응답 반환
-        return Response(
-            content=response,
-            media_type="text/plain",
+            first_chunk = await stream.__anext__()
+        except StopAsyncIteration:
+            await stream.aclose()
+            raise OpenAIError("Empty response from OpenAI")
+        except BaseException:
+            # 응답을 반환하지 못하면 OpenAI 스트림 정리 (사용자 동시 실행 슬롯 반환)
+            await stream.aclose()
+            raise
+
+        parts = [first_chunk]
+        state = {"completed": False}
+
+        async def relay():
+            yield first_chunk
+            try:
+                async for chunk in stream:
+                    parts.append(chunk)
+                    yield chunk
+                state["completed"] = True
+            except OpenAIError as e:
+                # 잘린 응답과 완료된 응답을 클라이언트가 구분할 수 있도록 본문 끝에 오류 표시
+                logger.error(f"OpenAI error during streaming: {str(e)}")
+                yield f"{STREAM_ERROR_MARKER} {str(e)}"
+            finally:
+                # 클라이언트 연결이 끊기면 OpenAI 스트림도 정리
+                await stream.aclose()
+
+        async def persist():
+            # 3. 스트림이 끝난 뒤 메시지 저장 및 대화 캐시 갱신
+            if not state["completed"]:
+                logger.warning(f"Stream did not complete, skip saving message: {conversation_id}")
+                return
+
+            response = "".join(parts)
+            try:
+                if not message.conversation_id:
+                    # 새 대화는 예약한 ID로 대화 행과 첫 메시지를 한 트랜잭션에서 저장
+                    await chat_manager.save_message(
+                        user_id=current_user.user_id,
+                        user_message=message.content,
+                        bot_response=response,
+                        new_conversation_id=conversation_id
+                    )
+                    await bot.update_conversation_cache(conversation_id, message.content, response)
+                    return
+
+                # 기존 대화는 write-behind 큐에 넣어 일괄 저장 (워커가 없으면 바로 저장)
+                queued = await get_chat_write_behind().submit(
+                    user_id=current_user.user_id,
+                    conversation_id=conversation_id,
+                    user_message=message.content,
+                    bot_response=response
+                )
+                if not queued:
+                    await chat_manager.save_message(
+                        user_id=current_user.user_id,
+                        user_message=message.content,
+                        bot_response=response,
+                        conversation_id=conversation_id
+                    )
+            except Exception as e:
+                logger.error(f"Failed to save message: {str(e)}")
+
+        return StreamingResponse(
+            relay(),
+            media_type="text/plain; charset=utf-8",
             headers={
-                'X-Conversation-ID': str(conversation_id) if conversation_id else ''
-            }
+                'X-Conversation-ID': str(conversation_id),
+                'Cache-Control': 'no-cache',
+                'X-Accel-Buffering': 'no'  # 프록시 버퍼링 비활성화
+            },
+            background=BackgroundTask(persist)
         )
 
+    except HTTPException:
+        raise
+    except RateLimitTimeout as e:
+        logger.warning(f"OpenAI rate limit wait timed out: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e)
+        )
+    except OpenAITimeout as e:
+        logger.error(f"OpenAI response deadline exceeded: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=str(e)
+        )
     except OpenAIError as e:
         logger.error(f"OpenAI error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
         )
+    except DatabaseError as e:
+        logger.error(f"Database error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+    except ChatBaseException as e:
+        # 대화 개수 한도 등
+        logger.warning(f"Chat error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error in stream_chat: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -35,10 +35,10 @@ async def get_chat_settings(
 
     try:
         manager = get_settings_manager()
-        settings = manager.get_user_settings(current_user.user_id)
+        settings = await manager.get_user_settings(current_user.user_id)
         if not settings:
             # 기본 설정 생성 및 반환
-            settings = manager.update_user_settings(
+            settings = await manager.update_user_settings(
                 current_user.user_id,
                 ChatSettingRequest().dict()
             )
@@ -74,7 +74,7 @@ async def update_chat_settings(
 
     try:
         manager = get_settings_manager()
-        updated_settings = manager.update_user_settings(
+        updated_settings = await manager.update_user_settings(
             current_user.user_id,
             settings.dict(exclude_unset=True)
         )
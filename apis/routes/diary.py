@@ -22,7 +22,7 @@ async def get_diaries(
 ):
     """일기 목록 조회"""
     service = DiaryService()
-    return service.get_diaries(page, size)
+    return await service.get_diaries(page, size)
 
 
 @router.post("", response_model=DiaryResponse)
@@ -40,7 +40,7 @@ async def create_diary(
             detail="Diary body cannot be empty"
         )
 
-    existing = service.get_diary_by_date(diary.date)
+    existing = await service.get_diary_by_date(diary.date)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -48,7 +48,7 @@ async def create_diary(
         )
 
     diary_data = diary.model_dump()
-    return service.create_diary(diary_data)
+    return await service.create_diary(diary_data)
 
 
 @router.get("/date/{date}", response_model=DiaryResponse)
@@ -59,7 +59,7 @@ async def get_diary_by_date(
 ):
     """날짜로 일기 조회"""
     service = DiaryService()
-    diary = service.get_diary_by_date(date)
+    diary = await service.get_diary_by_date(date)
     if not diary:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -76,7 +76,7 @@ async def get_diary(
 ):
     """특정 일기 조회"""
     service = DiaryService()
-    diary = service.get_diary(diary_id)
+    diary = await service.get_diary(diary_id)
     if not diary:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -93,7 +93,7 @@ async def update_diary(
         current_user: User = Depends(get_current_user)
 ):
     service = DiaryService()
-    existing = service.get_diary(diary_id)
+    existing = await service.get_diary(diary_id)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -109,7 +109,7 @@ async def update_diary(
             # 문자열을 date 객체로 변환
             date_obj = date.fromisoformat(diary.date)
             # 중복 체크
-            existing_diary = service.get_diary_by_date(date_obj)
+            existing_diary = await service.get_diary_by_date(date_obj)
             if existing_diary and existing_diary.diary_id != diary_id:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -125,7 +125,7 @@ async def update_diary(
     if diary.feedback is not None:
         update_data["feedback"] = diary.feedback
 
-    return service.update_diary(diary_id, update_data)
+    return await service.update_diary(diary_id, update_data)
 
 
 @router.delete("/{diary_id}")
@@ -136,14 +136,14 @@ async def delete_diary(
 ):
     """일기 삭제"""
     service = DiaryService()
-    existing = service.get_diary(diary_id)
+    existing = await service.get_diary(diary_id)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Diary not found"
         )
 
-    success = service.delete_diary(diary_id)
+    success = await service.delete_diary(diary_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -161,7 +161,7 @@ async def generate_feedback(
 ):
     """AI를 사용하여 일기 피드백 생성"""
     service = DiaryService()
-    diary = service.get_diary(diary_id)
+    diary = await service.get_diary(diary_id)
     if not diary:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -172,4 +172,4 @@ async def generate_feedback(
     feedback = await analyzer.analyze_diary(diary.body)
 
     # 피드백 업데이트
-    return service.update_feedback(diary_id, feedback)
+    return await service.update_feedback(diary_id, feedback)
@@ -1,9 +1,9 @@
 # apis/routrs/grammar.py
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from apis.deps import get_db
+from apis.deps import get_async_db
 from apis.models.grammar import Grammar, GrammarCreate, GrammarUpdate, GrammarResponse
-from utils.mysql_connector import MySQLConnector
+from utils.async_mysql_connector import AsyncMySQLConnector
 
 router = APIRouter(prefix="/api/v1/grammar", tags=["grammar"])
 
@@ -11,23 +11,23 @@ router = APIRouter(prefix="/api/v1/grammar", tags=["grammar"])
 @router.post("/", response_model=Grammar)
 async def create_grammar(
         grammar: GrammarCreate,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """문법 생성"""
     try:
-        db.begin_transaction()
+        await db.begin_transaction()
         grammar_data = grammar.dict(exclude_unset=True)
-        result = db.insert('grammar', grammar_data)
+        result = await db.insert('grammar', grammar_data)
         grammar_id = result['id']
 
-        created = db.execute_raw_query(
+        created = await db.fetch_all(
             "SELECT * FROM grammar WHERE grammar_id = %(grammar_id)s",
             {'grammar_id': grammar_id}
         )
-        db.commit_transaction()
+        await db.commit_transaction()
         return created[0]
     except Exception as e:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise HTTPException(
             status_code=500,
             detail=f"문법 생성 실패: {str(e)}"
@@ -38,12 +38,12 @@ async def create_grammar(
 async def get_grammars(
         skip: int = Query(default=0, ge=0),
         limit: int = Query(default=100, le=100),
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """문법 목록 조회"""
     try:
         # 전체 데이터 수 조회
-        total = db.execute_raw_query("SELECT COUNT(*) as total FROM grammar")[0]['total']
+        total = (await db.fetch_all("SELECT COUNT(*) as total FROM grammar"))[0]['total']
         total_pages = (total + limit - 1) // limit
 
         # 데이터 조회
@@ -52,7 +52,7 @@ async def get_grammars(
             ORDER BY create_at DESC
             LIMIT %(limit)s OFFSET %(skip)s
         """
-        items = db.execute_raw_query(query, {'limit': limit, 'skip': skip})
+        items = await db.fetch_all(query, {'limit': limit, 'skip': skip})
 
         page = (skip // limit) + 1
 
@@ -75,10 +75,10 @@ async def get_grammars(
 @router.get("/{grammar_id}", response_model=Grammar)
 async def get_grammar(
         grammar_id: int,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """문법 상세 조회"""
-    result = db.execute_raw_query(
+    result = await db.fetch_all(
         "SELECT * FROM grammar WHERE grammar_id = %(grammar_id)s",
         {'grammar_id': grammar_id}
     )
@@ -91,13 +91,13 @@ async def get_grammar(
 async def update_grammar(
         grammar_id: int,
         grammar: GrammarUpdate,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """문법 수정"""
     try:
-        db.begin_transaction()
+        await db.begin_transaction()
 
-        exists = db.execute_raw_query(
+        exists = await db.fetch_all(
             "SELECT grammar_id FROM grammar WHERE grammar_id = %(grammar_id)s",
             {'grammar_id': grammar_id}
         )
@@ -108,20 +108,20 @@ async def update_grammar(
         if not update_data:
             raise HTTPException(status_code=400, detail="수정할 내용이 없습니다")
 
-        db.update('grammar', update_data, {'grammar_id': grammar_id})
+        await db.update('grammar', update_data, {'grammar_id': grammar_id})
 
-        updated = db.execute_raw_query(
+        updated = await db.fetch_all(
             "SELECT * FROM grammar WHERE grammar_id = %(grammar_id)s",
             {'grammar_id': grammar_id}
         )
 
-        db.commit_transaction()
+        await db.commit_transaction()
         return updated[0]
     except HTTPException:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise
     except Exception as e:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise HTTPException(
             status_code=500,
             detail=f"문법 수정 실패: {str(e)}"
@@ -131,31 +131,31 @@ async def update_grammar(
 @router.delete("/{grammar_id}")
 async def delete_grammar(
         grammar_id: int,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """문법 삭제"""
     try:
-        db.begin_transaction()
+        await db.begin_transaction()
 
-        exists = db.execute_raw_query(
+        exists = await db.fetch_all(
             "SELECT grammar_id FROM grammar WHERE grammar_id = %(grammar_id)s",
             {'grammar_id': grammar_id}
         )
         if not exists:
             raise HTTPException(status_code=404, detail="문법을 찾을 수 없습니다")
 
-        db.execute_raw_query(
+        await db.execute(
             "DELETE FROM grammar WHERE grammar_id = %(grammar_id)s",
             {'grammar_id': grammar_id}
         )
 
-        db.commit_transaction()
+        await db.commit_transaction()
         return {"status": "success", "message": "문법이 성공적으로 삭제되었습니다"}
     except HTTPException:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise
     except Exception as e:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise HTTPException(
             status_code=500,
             detail=f"문법 삭제 실패: {str(e)}"
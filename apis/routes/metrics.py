@@ -0,0 +1,83 @@
+# apis/routes/metrics.py
+import logging
+
+from fastapi import APIRouter, HTTPException
+
+from bots.model_router import get_call_metrics
+from bots.rate_limiter import get_rate_limiter
+from chat.write_behind import get_chat_write_behind
+from utils.async_mysql_connector import get_async_pool_stats
+from utils.cache_manager import get_cache_manager
+from utils.mysql_pool import get_pool
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1/metrics", tags=["metrics"])
+
+
+@router.get("/db-pool")
+async def get_db_pool_stats():
+    """MySQL 커넥션 풀 통계 조회 (동기/비동기 풀)"""
+    try:
+        return {
+            "sync": get_pool().stats(),
+            "async": get_async_pool_stats()
+        }
+    except Exception as e:
+        logger.error(f"Failed to get db pool stats: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get db pool stats: {str(e)}"
+        )
+
+
+@router.get("/cache")
+async def get_cache_stats():
+    """캐시 통계 조회 (키 계열별 적중률, Redis 지연, 직렬화 시간, 값 크기, L1 상태)"""
+    try:
+        return get_cache_manager().stats()
+    except Exception as e:
+        logger.error(f"Failed to get cache stats: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get cache stats: {str(e)}"
+        )
+
+
+@router.get("/chat-writes")
+async def get_chat_write_stats():
+    """채팅 메시지 write-behind 큐 통계 조회 (대기 중인 메시지, 일괄 저장/spill 건수)"""
+    try:
+        return get_chat_write_behind().stats()
+    except Exception as e:
+        logger.error(f"Failed to get chat write stats: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get chat write stats: {str(e)}"
+        )
+
+
+@router.get("/openai-limits")
+async def get_openai_limit_stats():
+    """OpenAI 호출 제한기 통계 조회 (모델별 대기열 길이, 대기 시간, 시간 초과 수)"""
+    try:
+        return get_rate_limiter().stats()
+    except Exception as e:
+        logger.error(f"Failed to get openai limit stats: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get openai limit stats: {str(e)}"
+        )
+
+
+@router.get("/openai-calls")
+async def get_openai_call_stats():
+    """OpenAI 호출 시도 통계 조회 (모델별 성공/실패 원인, 재시도/모델 전환 수, 시도 지연과 첫 토큰 지연)"""
+    try:
+        return get_call_metrics().stats()
+    except Exception as e:
+        logger.error(f"Failed to get openai call stats: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get openai call stats: {str(e)}"
+        )
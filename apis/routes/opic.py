@@ -2,16 +2,16 @@ from typing import Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from apis.deps import get_db
+from apis.deps import get_async_db
 from apis.models.opic import Opic, OpicCreate, OpicUpdate, OpicResponse, SectionType
-from utils.mysql_connector import MySQLConnector
+from utils.async_mysql_connector import AsyncMySQLConnector
 
 router = APIRouter(prefix="/api/v1/opic", tags=["opic"])
 
 
 @router.get("/count", response_model=Dict[str, int])
 async def get_opics_count(
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ) -> Dict[str, int]:
     """오픽 서베이 전체 개수 조회"""
     try:
@@ -23,7 +23,7 @@ async def get_opics_count(
                 SUM(CASE WHEN section = 'Role-Play' THEN 1 ELSE 0 END) as role_play_count
             FROM opic
         """
-        result = db.execute_raw_query(query)[0]
+        result = (await db.fetch_all(query))[0]
         return {
             "total": result['total'],
             "general_topics_count": result['general_topics_count'],
@@ -39,23 +39,23 @@ async def get_opics_count(
 @router.post("/", response_model=Opic)
 async def create_opic(
         opic: OpicCreate,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """오픽 서베이 생성"""
     try:
-        db.begin_transaction()
+        await db.begin_transaction()
         opic_data = opic.dict(exclude_unset=True)
-        result = db.insert('opic', opic_data)
+        result = await db.insert('opic', opic_data)
         opic_id = result['id']
 
-        created = db.execute_raw_query(
+        created = await db.fetch_all(
             "SELECT * FROM opic WHERE opic_id = %(opic_id)s",
             {'opic_id': opic_id}
         )
-        db.commit_transaction()
+        await db.commit_transaction()
         return created[0]
     except Exception as e:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise HTTPException(
             status_code=500,
             detail=f"오픽 서베이 생성 실패: {str(e)}"
@@ -67,7 +67,7 @@ async def get_opics(
         page: int = Query(default=1, ge=1),
         size: int = Query(default=10, le=100),
         section: Optional[SectionType] = Query(None, description="섹션별 필터링"),
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """오픽 서베이 목록 조회 (페이지네이션)"""
     try:
@@ -80,7 +80,7 @@ async def get_opics(
             count_query += " WHERE section = %(section)s"
             count_params['section'] = section.value
 
-        total = db.execute_raw_query(count_query, count_params)[0]['total']
+        total = (await db.fetch_all(count_query, count_params))[0]['total']
         total_pages = (total + size - 1) // size
         offset = (page - 1) * size
 
@@ -99,7 +99,7 @@ async def get_opics(
             LIMIT %(limit)s OFFSET %(offset)s
         """
 
-        items = db.execute_raw_query(query, params)
+        items = await db.fetch_all(query, params)
 
         return {
             "items": items,
@@ -120,10 +120,10 @@ async def get_opics(
 @router.get("/{opic_id}", response_model=Opic)
 async def get_opic(
         opic_id: int,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """오픽 서베이 상세 조회"""
-    result = db.execute_raw_query(
+    result = await db.fetch_all(
         "SELECT * FROM opic WHERE opic_id = %(opic_id)s",
         {'opic_id': opic_id}
     )
@@ -136,13 +136,13 @@ async def get_opic(
 async def update_opic(
         opic_id: int,
         opic: OpicUpdate,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """오픽 서베이 수정"""
     try:
-        db.begin_transaction()
+        await db.begin_transaction()
 
-        exists = db.execute_raw_query(
+        exists = await db.fetch_all(
             "SELECT opic_id FROM opic WHERE opic_id = %(opic_id)s",
             {'opic_id': opic_id}
         )
@@ -153,20 +153,20 @@ async def update_opic(
         if not update_data:
             raise HTTPException(status_code=400, detail="수정할 내용이 없습니다")
 
-        db.update('opic', update_data, {'opic_id': opic_id})
+        await db.update('opic', update_data, {'opic_id': opic_id})
 
-        updated = db.execute_raw_query(
+        updated = await db.fetch_all(
             "SELECT * FROM opic WHERE opic_id = %(opic_id)s",
             {'opic_id': opic_id}
         )
 
-        db.commit_transaction()
+        await db.commit_transaction()
         return updated[0]
     except HTTPException:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise
     except Exception as e:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise HTTPException(
             status_code=500,
             detail=f"오픽 서베이 수정 실패: {str(e)}"
@@ -176,31 +176,31 @@ async def update_opic(
 @router.delete("/{opic_id}")
 async def delete_opic(
         opic_id: int,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """오픽 서베이 삭제"""
     try:
-        db.begin_transaction()
+        await db.begin_transaction()
 
-        exists = db.execute_raw_query(
+        exists = await db.fetch_all(
             "SELECT opic_id FROM opic WHERE opic_id = %(opic_id)s",
             {'opic_id': opic_id}
         )
         if not exists:
             raise HTTPException(status_code=404, detail="오픽 서베이를 찾을 수 없습니다")
 
-        db.execute_raw_query(
+        await db.execute(
             "DELETE FROM opic WHERE opic_id = %(opic_id)s",
             {'opic_id': opic_id}
         )
 
-        db.commit_transaction()
+        await db.commit_transaction()
         return {"status": "success", "message": "오픽 서베이가 성공적으로 삭제되었습니다"}
     except HTTPException:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise
     except Exception as e:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise HTTPException(
             status_code=500,
             detail=f"오픽 서베이 삭제 실패: {str(e)}"
@@ -31,7 +31,7 @@ async def get_prompt_templates(
     logger.info(f"Fetching prompt templates for user {current_user.user_id}")
     try:
         manager = get_prompt_manager()
-        templates = manager.get_all_templates()
+        templates = await manager.get_all_templates()
         return templates
     except DatabaseError as e:
         logger.error(f"Database error in get_prompt_templates: {str(e)}")
@@ -56,7 +56,7 @@ async def get_prompt_template_by_id(
     logger.info(f"Fetching prompt template {template_id} for user {current_user.user_id}")
     try:
         manager = get_prompt_manager()
-        template = manager.get_template_by_id(template_id)
+        template = await manager.get_template_by_id(template_id)
         if not template:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -93,7 +93,7 @@ async def create_prompt_template(
 
     try:
         manager = get_prompt_manager()
-        new_template = manager.create_template(template.dict())
+        new_template = await manager.create_template(template.dict())
         return new_template
     except DatabaseError as e:
         logger.error(f"Database error in create_prompt_template: {str(e)}")
@@ -126,7 +126,7 @@ async def update_prompt_template(
 
     try:
         manager = get_prompt_manager()
-        updated_template = manager.update_template(
+        updated_template = await manager.update_template(
             template_id,
             template.dict(exclude_unset=True)
         )
@@ -167,7 +167,7 @@ async def delete_prompt_template(
     try:
         manager = get_prompt_manager()
         # 실제 로우를 삭제하고, 삭제 성공 정보를 반환합니다.
-        deleted_template = manager.delete_template(template_id)
+        deleted_template = await manager.delete_template(template_id)
         return deleted_template
 
     except PromptException as e:
@@ -6,8 +6,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from utils.auth import get_current_user
-from utils.mysql_connector import MySQLConnector
-from ..deps import get_db
+from utils.async_mysql_connector import AsyncMySQLConnector
+from ..deps import get_async_db
 from ..models.small_talk import (
     SmallTalk, SmallTalkCreate, SmallTalkUpdate, SmallTalkPatch
 )
@@ -34,7 +34,7 @@ class Direction(str, Enum):
 @router.get("/count", response_model=Dict[str, int])
 async def get_small_talks_count(
         tag: Optional[str] = None,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ) -> Dict[str, int]:
     """스몰톡 전체 개수 조회"""
     try:
@@ -45,7 +45,7 @@ async def get_small_talks_count(
             query += " AND tag = %(tag)s"
             params['tag'] = tag
 
-        result = db.execute_raw_query(query, params)
+        result = await db.fetch_all(query, params)
         return {"total": result[0]['total']}
     except Exception as e:
         raise HTTPException(
@@ -59,7 +59,7 @@ async def get_small_talks(
         tag: Optional[str] = None,
         page: int = Query(default=1, ge=1),
         size: int = Query(default=10, le=100),
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """스몰톡 목록 조회 (페이지네이션)"""
     count_query = "SELECT COUNT(*) as total FROM small_talk WHERE 1=1"
@@ -69,7 +69,7 @@ async def get_small_talks(
         count_query += " AND tag = %(tag)s"
         count_params['tag'] = tag
 
-    total = db.execute_raw_query(count_query, count_params)[0]['total']
+    total = (await db.fetch_all(count_query, count_params))[0]['total']
 
     total_pages = (total + size - 1) // size
     offset = (page - 1) * size
@@ -88,7 +88,7 @@ async def get_small_talks(
     query += " ORDER BY talk_id DESC LIMIT %(limit)s OFFSET %(offset)s"
     params.update({'limit': size, 'offset': offset})
 
-    items = db.execute_raw_query(query, params)
+    items = await db.fetch_all(query, params)
 
     return {
         "items": items,
@@ -106,7 +106,7 @@ async def search_small_talks(
         query: Optional[str] = None,
         page: int = 1,
         size: int = 10,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """스몰톡 풀텍스트 검색 (페이지네이션)"""
     try:
@@ -140,7 +140,7 @@ async def search_small_talks(
                 """
                 count_params = {'query': f"{query}*"}
 
-                total_result = db.execute_raw_query(count_query, count_params)
+                total_result = await db.fetch_all(count_query, count_params)
                 total = total_result[0]['total'] if total_result else 0
 
                 # 결과가 있으면 풀텍스트 검색 쿼리 준비
@@ -181,7 +181,7 @@ async def search_small_talks(
             """
             count_params = {'search': search_term}
 
-            total_result = db.execute_raw_query(count_query, count_params)
+            total_result = await db.fetch_all(count_query, count_params)
             total = total_result[0]['total'] if total_result else 0
 
             search_query = """
@@ -216,7 +216,7 @@ async def search_small_talks(
         total_pages = (total + size - 1) // size
 
         # 결과 조회
-        items = db.execute_raw_query(search_query, search_params)
+        items = await db.fetch_all(search_query, search_params)
 
         # relevance 필드 제거 (반환 구조를 일관되게 유지하기 위해)
         if use_fulltext:
@@ -253,7 +253,7 @@ async def get_sentence(
         current_user=Depends(get_current_user),
         direction: Direction = Direction.CURRENT,
         current_talk_id: Optional[int] = None,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """사용자별 스몰톡 문장 조회 (현재/이전/다음)"""
     try:
@@ -314,7 +314,7 @@ async def get_sentence(
                 """
             params = {'current_talk_id': current_talk_id}
 
-        result = db.execute_raw_query(query, params)
+        result = await db.fetch_all(query, params)
 
         if not result:
             # 데이터가 없는 경우 첫 번째 문장 가져오기
@@ -329,7 +329,7 @@ async def get_sentence(
                 ORDER BY s.talk_id ASC
                 LIMIT 1
             """
-            result = db.execute_raw_query(query)
+            result = await db.fetch_all(query)
 
             if not result:
                 raise HTTPException(
@@ -343,11 +343,12 @@ async def get_sentence(
                 (user_id, talk_id)
             VALUES 
                 (%(user_id)s, %(talk_id)s)
+            AS new
             ON DUPLICATE KEY UPDATE
-                talk_id = VALUES(talk_id)
+                talk_id = new.talk_id
         """
         try:
-            db.execute_raw_query(
+            await db.execute(
                 upsert_query,
                 {'user_id': user_id, 'talk_id': result[0]['talk_id']}
             )
@@ -379,9 +380,9 @@ async def get_sentence(
 
 
 @router.get("/{talk_id}", response_model=SmallTalk)
-async def get_small_talk(talk_id: int, db: MySQLConnector = Depends(get_db)):
+async def get_small_talk(talk_id: int, db: AsyncMySQLConnector = Depends(get_async_db)):
     """스몰톡 상세 조회"""
-    result = db.execute_raw_query(
+    result = await db.fetch_all(
         "SELECT * FROM small_talk WHERE talk_id = %(talk_id)s",
         {'talk_id': talk_id}
     )
@@ -394,7 +395,7 @@ async def get_small_talk(talk_id: int, db: MySQLConnector = Depends(get_db)):
 async def create_small_talk(
         small_talk: SmallTalkCreate,
         current_user=Depends(get_current_user),
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """스몰톡 생성 (관리자 권한 필요)"""
     if not current_user.is_admin:
@@ -403,9 +404,9 @@ async def create_small_talk(
             detail="관리자 권한이 필요합니다"
         )
     data = small_talk.dict(exclude_unset=True)
-    result = db.insert('small_talk', data)
+    result = await db.insert('small_talk', data)
 
-    created = db.execute_raw_query(
+    created = await db.fetch_all(
         "SELECT * FROM small_talk WHERE talk_id = %(talk_id)s",
         {'talk_id': result['id']}
     )
@@ -417,7 +418,7 @@ async def update_small_talk(
         talk_id: int,
         small_talk: SmallTalkUpdate,
         current_user=Depends(get_current_user),
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """스몰톡 전체 수정 (관리자 권한 필요)"""
     if not current_user.is_admin:
@@ -426,12 +427,12 @@ async def update_small_talk(
             detail="관리자 권한이 필요합니다"
         )
     data = small_talk.dict(exclude_unset=True)
-    result = db.update('small_talk', data, {'talk_id': talk_id})
+    result = await db.update('small_talk', data, {'talk_id': talk_id})
 
     if result['affected_rows'] == 0:
         raise HTTPException(status_code=404, detail="Small talk not found")
 
-    updated = db.execute_raw_query(
+    updated = await db.fetch_all(
         "SELECT * FROM small_talk WHERE talk_id = %(talk_id)s",
         {'talk_id': talk_id}
     )
@@ -443,7 +444,7 @@ async def patch_small_talk(
         talk_id: int,
         small_talk: SmallTalkPatch,
         current_user=Depends(get_current_user),
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """스몰톡 부분 수정 (관리자 권한 필요)"""
     if not current_user.is_admin:
@@ -459,12 +460,12 @@ async def patch_small_talk(
     if not update_data:
         raise HTTPException(status_code=400, detail="No fields to update")
 
-    result = db.update('small_talk', update_data, {'talk_id': talk_id})
+    result = await db.update('small_talk', update_data, {'talk_id': talk_id})
 
     if result['affected_rows'] == 0:
         raise HTTPException(status_code=404, detail="Small talk not found")
 
-    updated = db.execute_raw_query(
+    updated = await db.fetch_all(
         "SELECT * FROM small_talk WHERE talk_id = %(talk_id)s",
         {'talk_id': talk_id}
     )
@@ -475,7 +476,7 @@ async def patch_small_talk(
 async def delete_small_talk(
         talk_id: int,
         current_user=Depends(get_current_user),
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """스몰톡 삭제 (관리자 권한 필요)"""
     if not current_user.is_admin:
@@ -484,7 +485,7 @@ async def delete_small_talk(
             detail="관리자 권한이 필요합니다"
         )
     try:
-        exists = db.execute_raw_query(
+        exists = await db.fetch_all(
             "SELECT talk_id FROM small_talk WHERE talk_id = %(talk_id)s",
             {'talk_id': talk_id}
         )
@@ -492,12 +493,12 @@ async def delete_small_talk(
         if not exists:
             raise HTTPException(status_code=404, detail="Small talk not found")
 
-        db.execute_raw_query(
+        await db.execute(
             "DELETE FROM answer WHERE talk_id = %(talk_id)s",
             {'talk_id': talk_id}
         )
 
-        result = db.execute_raw_query(
+        result = await db.execute(
             "DELETE FROM small_talk WHERE talk_id = %(talk_id)s",
             {'talk_id': talk_id}
         )
@@ -1,15 +1,21 @@
 # apis/routes/vocabulary.py
-from typing import List, Dict
+from datetime import datetime
+from typing import Any, List, Dict, Optional
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from apis.deps import get_db
+from apis.deps import get_async_db
 from apis.models.vocabulary import VocabularyCreate, VocabularyUpdate, Vocabulary
-from utils.mysql_connector import MySQLConnector
+from utils.async_mysql_connector import AsyncMySQLConnector
+from utils.pagination import encode_cursor, decode_cursor
 
 router = APIRouter(prefix="/api/v1/vocabulary", tags=["vocabulary"])
 
+# 목록/검색 전체 개수 캐시 (매 요청마다 COUNT를 실행하지 않도록)
+_count_cache = TTLCache(maxsize=256, ttl=60)
+
 
 # 페이지네이션 응답 모델
 class PaginatedVocabulary(BaseModel):
@@ -20,6 +26,54 @@ class PaginatedVocabulary(BaseModel):
     total_pages: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
+
+
+async def _cached_count(db: AsyncMySQLConnector, cache_key: str, query: str, params: Optional[dict] = None) -> int:
+    """COUNT 쿼리 결과를 잠시 캐시해서 반환"""
+    total = _count_cache.get(cache_key)
+    if total is None:
+        result = await db.fetch_one(query, params)
+        total = result['total'] if result else 0
+        _count_cache[cache_key] = total
+    return total
+
+
+def _decode_after(after: str, length: int) -> list:
+    try:
+        return decode_cursor(after, length)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _cursor_datetime(value: Any) -> datetime:
+    """커서 값을 datetime으로 해석 (형식이 다르면 400)"""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+
+def _cursor_int(value: Any) -> int:
+    """커서 값을 정수로 확인 (형식이 다르면 400)"""
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+    return value
+
+
+def _paginated_response(items: List[Dict], total: int, page: int, size: int,
+                        after: Optional[str], next_cursor: Optional[str]) -> Dict:
+    total_pages = (total + size - 1) // size if total > 0 else 1
+    return {
+        "items": items,
+        "total": total,
+        "page": page,
+        "size": size,
+        "total_pages": total_pages,
+        "has_next": next_cursor is not None,
+        "has_prev": after is not None or page > 1,
+        "next_cursor": next_cursor
+    }
 
 
 @router.get("/text-search", response_model=PaginatedVocabulary)
@@ -27,40 +81,64 @@ async def search_vocabularies(
         q: str = Query(..., description="검색어"),
         page: int = Query(default=1, ge=1),
         size: int = Query(default=10, le=100),
-        db: MySQLConnector = Depends(get_db)
+        after: Optional[str] = Query(default=None, description="이전 응답의 next_cursor (지정 시 page 무시)"),
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """단어 전문 검색 (영어 단어)"""
     try:
-        # 먼저 모든 vocabulary_id를 가져옵니다 (중복 없이)
-        id_query = """
-            SELECT DISTINCT v.vocabulary_id, v.create_at,
-                   MATCH(v.word) AGAINST(%(query)s IN BOOLEAN MODE) as relevance
+        params = {'query': q, 'limit': size + 1, 'offset': 0}
+        cursor_condition = ""
+        if after:
+            # relevance를 소수 6자리로 반올림한 값으로 정렬/비교하므로 커서 값과 같음 비교가 정확히 맞는다
+            relevance, create_at, last_id = _decode_after(after, 3)
+            if not isinstance(relevance, (int, float)) or isinstance(relevance, bool):
+                raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+            cursor_condition = """
+                WHERE (m.relevance, m.create_at, m.vocabulary_id) < (%(relevance)s, %(create_at)s, %(last_id)s)
+            """
+            params.update({
+                'relevance': relevance,
+                'create_at': _cursor_datetime(create_at),
+                'last_id': _cursor_int(last_id)
+            })
+        else:
+            params['offset'] = (page - 1) * size
+
+        # 매칭된 단어 중 현재 페이지(+1) 만큼만 가져옴 (다음 페이지 존재 여부 확인용)
+        id_query = f"""
+            SELECT m.vocabulary_id, m.create_at, m.relevance
+            FROM (
+                SELECT v.vocabulary_id, v.create_at,
+                       ROUND(MATCH(v.word) AGAINST(%(query)s IN BOOLEAN MODE), 6) as relevance
+                FROM vocabulary v
+                WHERE MATCH(v.word) AGAINST(%(query)s IN BOOLEAN MODE)
+            ) m
+            {cursor_condition}
+            ORDER BY m.relevance DESC, m.create_at DESC, m.vocabulary_id DESC
+            LIMIT %(limit)s OFFSET %(offset)s
+        """
+        rows = await db.fetch_all(id_query, params)
+
+        next_cursor = None
+        if len(rows) > size:
+            rows = rows[:size]
+            last = rows[-1]
+            next_cursor = encode_cursor(float(last['relevance']), last['create_at'], last['vocabulary_id'])
+
+        total = await _cached_count(
+            db,
+            f"search:{q}",
+            """
+            SELECT COUNT(*) as total
             FROM vocabulary v
             WHERE MATCH(v.word) AGAINST(%(query)s IN BOOLEAN MODE)
-            ORDER BY relevance DESC, v.create_at DESC
-        """
-        all_ids = db.execute_raw_query(id_query, {'query': q})
-
-        # 전체 고유 단어 수 계산
-        total = len(all_ids)
-
-        # 페이지네이션 계산
-        total_pages = (total + size - 1) // size if total > 0 else 1
-        offset = (page - 1) * size
-
-        # 현재 페이지에 해당하는 ID만 필터링
-        page_ids = [row['vocabulary_id'] for row in all_ids[offset:offset + size]]
+            """,
+            {'query': q}
+        )
 
+        page_ids = [row['vocabulary_id'] for row in rows]
         if not page_ids:
-            return {
-                "items": [],
-                "total": total,
-                "page": page,
-                "size": size,
-                "total_pages": total_pages,
-                "has_next": page < total_pages,
-                "has_prev": page > 1
-            }
+            return _paginated_response([], total, page, size, after, None)
 
         # ID 목록으로 상세 정보 쿼리
         placeholders = ','.join(['%s'] * len(page_ids))
@@ -77,18 +155,12 @@ async def search_vocabularies(
         """
 
         # 파라미터를 두 번 포함시켜야 합니다 (IN 절과 ORDER BY FIELD 절)
-        results = db.execute_raw_query(query, page_ids + page_ids)
+        results = await db.fetch_all(query, page_ids + page_ids)
 
         items = _group_vocabulary_results(results)
-        return {
-            "items": items,
-            "total": total,
-            "page": page,
-            "size": size,
-            "total_pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1
-        }
+        return _paginated_response(items, total, page, size, after, next_cursor)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -98,11 +170,11 @@ async def search_vocabularies(
 
 @router.get("/count", response_model=Dict[str, int])
 async def get_vocabularies_count(
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ) -> Dict[str, int]:
     """단어 전체 개수 조회"""
     try:
-        result = db.execute_raw_query("SELECT COUNT(*) as total FROM vocabulary")
+        result = await db.fetch_all("SELECT COUNT(*) as total FROM vocabulary")
         return {"total": result[0]['total']}
     except Exception as e:
         raise HTTPException(
@@ -115,38 +187,42 @@ async def get_vocabularies_count(
 async def get_vocabularies(
         page: int = Query(default=1, ge=1),
         size: int = Query(default=10, le=100),
-        db: MySQLConnector = Depends(get_db)
+        after: Optional[str] = Query(default=None, description="이전 응답의 next_cursor (지정 시 page 무시)"),
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """단어 목록 조회 (페이지네이션)"""
     try:
-        # 먼저 모든 vocabulary_id를 가져옵니다 (중복 없이)
-        id_query = """
-            SELECT DISTINCT vocabulary_id, create_at 
+        params = {'limit': size + 1, 'offset': 0}
+        cursor_condition = ""
+        if after:
+            # (create_at, vocabulary_id) 인덱스를 타는 행 생성자 키셋 조건
+            create_at, last_id = _decode_after(after, 2)
+            create_at, last_id = _cursor_datetime(create_at), _cursor_int(last_id)
+            cursor_condition = "WHERE (create_at, vocabulary_id) < (%(create_at)s, %(last_id)s)"
+            params.update({'create_at': create_at, 'last_id': last_id})
+        else:
+            params['offset'] = (page - 1) * size
+
+        # 현재 페이지(+1) 만큼의 ID만 가져옴 (다음 페이지 존재 여부 확인용)
+        id_query = f"""
+            SELECT vocabulary_id, create_at
             FROM vocabulary
-            ORDER BY create_at DESC
+            {cursor_condition}
+            ORDER BY create_at DESC, vocabulary_id DESC
+            LIMIT %(limit)s OFFSET %(offset)s
         """
-        all_ids = db.execute_raw_query(id_query)
+        rows = await db.fetch_all(id_query, params)
 
-        # 전체 고유 단어 수 계산
-        total = len(all_ids)
+        next_cursor = None
+        if len(rows) > size:
+            rows = rows[:size]
+            next_cursor = encode_cursor(rows[-1]['create_at'], rows[-1]['vocabulary_id'])
 
-        # 페이지네이션 계산
-        total_pages = (total + size - 1) // size if total > 0 else 1
-        offset = (page - 1) * size
-
-        # 현재 페이지에 해당하는 ID만 필터링
-        page_ids = [row['vocabulary_id'] for row in all_ids[offset:offset + size]]
+        total = await _cached_count(db, "all", "SELECT COUNT(*) as total FROM vocabulary")
 
+        page_ids = [row['vocabulary_id'] for row in rows]
         if not page_ids:
-            return {
-                "items": [],
-                "total": total,
-                "page": page,
-                "size": size,
-                "total_pages": total_pages,
-                "has_next": page < total_pages,
-                "has_prev": page > 1
-            }
+            return _paginated_response([], total, page, size, after, None)
 
         # ID 목록으로 상세 정보 쿼리
         placeholders = ','.join(['%s'] * len(page_ids))
@@ -169,19 +245,12 @@ async def get_vocabularies(
         """
 
         # 파라미터를 두 번 포함시켜야 합니다 (IN 절과 ORDER BY FIELD 절)
-        results = db.execute_raw_query(query, page_ids + page_ids)
+        results = await db.fetch_all(query, page_ids + page_ids)
 
         items = _group_vocabulary_results(results)
-
-        return {
-            "items": items,
-            "total": total,
-            "page": page,
-            "size": size,
-            "total_pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1
-        }
+        return _paginated_response(items, total, page, size, after, next_cursor)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -190,7 +259,7 @@ async def get_vocabularies(
 
 
 @router.get("/{vocabulary_id}", response_model=Vocabulary)
-async def get_vocabulary(vocabulary_id: int, db: MySQLConnector = Depends(get_db)):
+async def get_vocabulary(vocabulary_id: int, db: AsyncMySQLConnector = Depends(get_async_db)):
     """단어 상세 조회"""
     query = """
             SELECT 
@@ -208,7 +277,7 @@ async def get_vocabulary(vocabulary_id: int, db: MySQLConnector = Depends(get_db
                 ON v.vocabulary_id = vm.vocabulary_id 
             WHERE v.vocabulary_id = %(vocabulary_id)s
         """
-    results = db.execute_raw_query(query, {'vocabulary_id': vocabulary_id})
+    results = await db.fetch_all(query, {'vocabulary_id': vocabulary_id})
     if not results:
         raise HTTPException(status_code=404, detail="단어를 찾을 수 없습니다")
 
@@ -219,11 +288,11 @@ async def get_vocabulary(vocabulary_id: int, db: MySQLConnector = Depends(get_db
 @router.post("/", response_model=Vocabulary)
 async def create_vocabulary(
         vocabulary: VocabularyCreate,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """단어 생성"""
     try:
-        db.begin_transaction()
+        await db.begin_transaction()
 
         # 단어 추가
         vocab_data = {
@@ -232,12 +301,12 @@ async def create_vocabulary(
             'past_participle': vocabulary.past_participle,
             'rule': vocabulary.rule.value  # Enum 값을 문자열로 변환
         }
-        vocab_result = db.insert('vocabulary', vocab_data)
+        vocab_result = await db.insert('vocabulary', vocab_data)
         vocabulary_id = vocab_result['id']
 
-        # 의미 추가
-        for idx, meaning in enumerate(vocabulary.meanings, 1):
-            meaning_data = {
+        # 의미 추가 (다중 행 INSERT 한 번으로 처리)
+        meanings_data = [
+            {
                 'vocabulary_id': vocabulary_id,
                 'meaning': meaning.meaning,
                 'classes': meaning.classes or "기타",  # 기본값 처리
@@ -245,13 +314,17 @@ async def create_vocabulary(
                 'parenthesis': meaning.parenthesis,
                 'order_no': idx
             }
-            db.insert('vocabulary_meaning', meaning_data)
+            for idx, meaning in enumerate(vocabulary.meanings, 1)
+        ]
+        if meanings_data:
+            await db.insert('vocabulary_meaning', meanings_data)
 
-        db.commit_transaction()
+        await db.commit_transaction()
+        _count_cache.clear()
         return await get_vocabulary(vocabulary_id, db)
 
     except Exception as e:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise HTTPException(
             status_code=500,
             detail=f"단어 생성 실패: {str(e)}"
@@ -262,25 +335,27 @@ async def create_vocabulary(
 async def update_vocabulary(
         vocabulary_id: int,
         vocabulary: VocabularyUpdate,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """단어 전체 수정"""
     try:
-        db.begin_transaction()
+        await db.begin_transaction()
 
         # 단어 정보 업데이트
         if word_update := vocabulary.dict(exclude={'meanings'}, exclude_unset=True):
-            db.update('vocabulary', word_update, {'vocabulary_id': vocabulary_id})
+            await db.update('vocabulary', word_update, {'vocabulary_id': vocabulary_id})
 
         # 의미 업데이트/추가/삭제
-        existing_meanings = db.execute_raw_query(
+        existing_meanings = await db.fetch_all(
             "SELECT meaning_id FROM vocabulary_meaning WHERE vocabulary_id = %(vocabulary_id)s",
             {'vocabulary_id': vocabulary_id}
         )
         existing_meaning_ids = [m['meaning_id'] for m in existing_meanings]
 
-        for idx, meaning in enumerate(vocabulary.meanings, 1):
-            meaning_data = {
+        # 기존 의미는 meaning_id로 덮어쓰고, 나머지는 새로 추가 (upsert 한 번으로 처리)
+        meanings_data = [
+            {
+                'meaning_id': existing_meaning_ids[idx - 1] if idx <= len(existing_meaning_ids) else None,
                 'vocabulary_id': vocabulary_id,
                 'meaning': meaning.meaning,
                 'classes': meaning.classes,
@@ -288,29 +363,30 @@ async def update_vocabulary(
                 'parenthesis': meaning.parenthesis,
                 'order_no': idx
             }
-
-            if idx <= len(existing_meaning_ids):
-                # 기존 의미 업데이트
-                db.update('vocabulary_meaning', meaning_data,
-                          {'meaning_id': existing_meaning_ids[idx - 1]})
-            else:
-                # 새로운 의미 추가
-                db.insert('vocabulary_meaning', meaning_data)
+            for idx, meaning in enumerate(vocabulary.meanings, 1)
+        ]
+        if meanings_data:
+            await db.insert(
+                'vocabulary_meaning',
+                meanings_data,
+                on_duplicate_update=['meaning', 'classes', 'example', 'parenthesis', 'order_no']
+            )
 
         # 남은 의미 삭제
         if len(vocabulary.meanings) < len(existing_meaning_ids):
             delete_ids = existing_meaning_ids[len(vocabulary.meanings):]
             placeholders = ','.join(['%s'] * len(delete_ids))
-            db.execute_raw_query(
+            await db.execute(
                 f"DELETE FROM vocabulary_meaning WHERE meaning_id IN ({placeholders})",
                 delete_ids
             )
 
-        db.commit_transaction()
+        await db.commit_transaction()
+        _count_cache.clear()
         return await get_vocabulary(vocabulary_id, db)
 
     except Exception as e:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise HTTPException(
             status_code=500,
             detail=f"단어 수정 실패: {str(e)}"
@@ -320,14 +396,14 @@ async def update_vocabulary(
 @router.delete("/{vocabulary_id}")
 async def delete_vocabulary(
         vocabulary_id: int,
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     """단어 삭제"""
     try:
-        db.begin_transaction()
+        await db.begin_transaction()
 
         # 단어 존재 여부 확인
-        exists = db.execute_raw_query(
+        exists = await db.fetch_all(
             "SELECT vocabulary_id FROM vocabulary WHERE vocabulary_id = %(vocabulary_id)s",
             {'vocabulary_id': vocabulary_id}
         )
@@ -335,25 +411,26 @@ async def delete_vocabulary(
             raise HTTPException(status_code=404, detail="단어를 찾을 수 없습니다")
 
         # 의미 삭제
-        db.execute_raw_query(
+        await db.execute(
             "DELETE FROM vocabulary_meaning WHERE vocabulary_id = %(vocabulary_id)s",
             {'vocabulary_id': vocabulary_id}
         )
 
         # 단어 삭제
-        db.execute_raw_query(
+        await db.execute(
             "DELETE FROM vocabulary WHERE vocabulary_id = %(vocabulary_id)s",
             {'vocabulary_id': vocabulary_id}
         )
 
-        db.commit_transaction()
+        await db.commit_transaction()
+        _count_cache.clear()
         return {"status": "success", "message": "단어가 성공적으로 삭제되었습니다"}
 
     except HTTPException:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise
     except Exception as e:
-        db.rollback_transaction()
+        await db.rollback_transaction()
         raise HTTPException(
             status_code=500,
             detail=f"단어 삭제 실패: {str(e)}"
@@ -367,7 +444,7 @@ async def get_vocabulary_meaning_counts_by_ids(
             description="조회할 어휘 ID 목록",
             example=[1, 2, 3]
         ),
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ):
     try:
         if not vocabulary_ids:
@@ -382,7 +459,7 @@ async def get_vocabulary_meaning_counts_by_ids(
             GROUP BY vocabulary_id
         """.format(','.join(['%s'] * len(vocabulary_ids)))
 
-        result = db.execute_raw_query(query, tuple(vocabulary_ids))
+        result = await db.fetch_all(query, tuple(vocabulary_ids))
 
         return {row['vocabulary_id']: row['count'] for row in result}  # int 변환 제거 (이미 int 타입)
 
@@ -0,0 +1,267 @@
+# bots/context_builder.py
+import logging
+import math
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from chat.chat_manager import ChatManager
+from bots.rate_limiter import OpenAIRateLimiter
+from chat.constants import CACHE_KEYS, CACHE_TAGS
+from utils.cache_manager import CacheManager
+
+try:
+    import tiktoken
+except ImportError:  # 선택 의존성
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# 모델별 컨텍스트 창 크기 (토큰), 접두사가 가장 길게 일치하는 항목을 사용
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-4o-mini": 128000,
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4-32k": 32768,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+
+# 메시지 하나에 붙는 형식 토큰과 응답 시작 토큰 (OpenAI 채팅 형식 기준 근사값)
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_OVERHEAD_TOKENS = 3
+
+SUMMARY_PROMPT = (
+    "Summarize the earlier part of this conversation between a user and an English tutor assistant. "
+    "Keep facts about the user, topics discussed, corrections given and any open questions. "
+    "Write at most a short paragraph."
+)
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """모델의 tiktoken 인코딩 (tiktoken이 없거나 인코딩 파일을 받을 수 없으면 None)"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        try:
+            return tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.warning(f"tiktoken 인코딩을 불러올 수 없어 근사값으로 토큰을 셉니다: {str(e)}")
+            return None
+    except Exception as e:
+        logger.warning(f"tiktoken 인코딩을 불러올 수 없어 근사값으로 토큰을 셉니다: {str(e)}")
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """
+    텍스트 토큰 수
+
+    tiktoken이 없으면 UTF-8 3바이트당 1토큰으로 근사한다 (영어는 약간 크게, 한글은 글자당 1토큰으로 계산됨).
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return math.ceil(len(text.encode("utf-8")) / 3)
+
+
+def count_message_tokens(messages: List[Dict], model: str) -> int:
+    """채팅 메시지 목록의 토큰 수 (메시지 형식 토큰 포함)"""
+    return sum(count_tokens(message["content"], model) + MESSAGE_OVERHEAD_TOKENS for message in messages)
+
+
+class ContextBuilder:
+    """
+    토큰 예산 안에서 대화 맥락 구성
+
+    최근 대화 턴을 캐시된 대화 기록(ChatManager.get_chat_history)에서 가져와 최신 순으로 예산만큼 담고,
+    예산을 넘는 이전 턴은 Redis에 보관하는 누적 요약으로 대신한다.
+    요약은 요약 이후의 턴이 예산을 넘을 때만 다시 만들며, 이때 예산의 keep_ratio만 남기고 접어서
+    턴마다 요약을 다시 만들지 않도록 한다.
+    """
+
+    def __init__(self, client: Any, chat_manager: ChatManager, cache_manager: CacheManager,
+                 max_context_tokens: int = 3000, summary_model: str = "gpt-4o-mini",
+                 summary_max_tokens: int = 300, keep_ratio: float = 0.5, summary_ttl: int = 86400,
+                 rate_limiter: Optional[OpenAIRateLimiter] = None):
+        """
+        컨텍스트 빌더 초기화
+
+        Args:
+            client: 요약 생성에 쓸 AsyncOpenAI 클라이언트
+            chat_manager: 대화 기록 조회용 ChatManager
+            cache_manager: 요약 저장용 캐시 매니저
+            max_context_tokens: 대화 맥락(이전 턴 + 요약)에 쓸 최대 토큰 수
+            summary_model: 요약 생성 모델
+            summary_max_tokens: 요약 최대 토큰 수
+            keep_ratio: 요약을 다시 만들 때 요약하지 않고 남길 최근 턴의 예산 비율
+            summary_ttl: 요약 캐시 TTL(초)
+            rate_limiter: 요약 호출에 적용할 OpenAI 호출 제한기 (None이면 제한 없음)
+        """
+        if not 0 < keep_ratio <= 1:
+            raise ValueError("keep_ratio는 0보다 크고 1 이하여야 합니다.")
+
+        self.client = client
+        self.chat_manager = chat_manager
+        self.cache_manager = cache_manager
+        self.max_context_tokens = max_context_tokens
+        self.summary_model = summary_model
+        self.summary_max_tokens = summary_max_tokens
+        self.keep_ratio = keep_ratio
+        self.summary_ttl = summary_ttl
+        self.rate_limiter = rate_limiter
+
+    def budget(self, model: str, max_tokens: int, fixed_tokens: int = 0) -> int:
+        """
+        대화 맥락에 쓸 수 있는 토큰 수
+
+        모델 컨텍스트 창에서 응답 토큰(max_tokens)과 고정 메시지(시스템/현재 메시지)를 뺀 값과
+        max_context_tokens 중 작은 값이다.
+        """
+        window = DEFAULT_CONTEXT_WINDOW
+        for prefix in sorted(MODEL_CONTEXT_WINDOWS, key=len, reverse=True):
+            if model.startswith(prefix):
+                window = MODEL_CONTEXT_WINDOWS[prefix]
+                break
+        available = window - max_tokens - fixed_tokens - REPLY_OVERHEAD_TOKENS
+        return max(0, min(self.max_context_tokens, available))
+
+    @staticmethod
+    def _turn_messages(turn: Dict) -> List[Dict]:
+        return [
+            {"role": "user", "content": turn["user_message"]},
+            {"role": "assistant", "content": turn["bot_response"]}
+        ]
+
+    def _turn_tokens(self, turn: Dict, model: str) -> int:
+        return count_message_tokens(self._turn_messages(turn), model)
+
+    async def build(self, conversation_id: Optional[str], model: str, max_tokens: int,
+                    fixed_messages: List[Dict]) -> List[Dict]:
+        """
+        이전 대화 맥락 메시지 구성
+
+        Args:
+            conversation_id: 대화 ID (None이면 맥락 없음)
+            model: 응답 생성 모델
+            max_tokens: 응답 최대 토큰 수 (user_settings['max_tokens'])
+            fixed_messages: 항상 보내는 메시지 (시스템 프롬프트, 현재 사용자 메시지)
+
+        Returns:
+            시스템 프롬프트와 현재 메시지 사이에 넣을 메시지 목록 (요약 + 최근 턴)
+        """
+        if not conversation_id:
+            return []
+
+        budget = self.budget(model, max_tokens, count_message_tokens(fixed_messages, model))
+        if budget <= 0:
+            return []
+
+        try:
+            turns = await self.chat_manager.get_chat_history(conversation_id)
+            # write-behind 큐에 있어 아직 저장되지 않은 턴 (저장되어 기록에 들어온 턴은 pending_id로 제외)
+            saved_ids = {turn.get("pending_id") for turn in turns}
+            turns = turns + [
+                turn for turn in await self.chat_manager.get_pending_messages(conversation_id)
+                if turn["pending_id"] not in saved_ids
+            ]
+        except Exception as e:
+            logger.warning(f"대화 맥락 조회 실패, 맥락 없이 진행: {str(e)}")
+            return []
+        if not turns:
+            return []
+
+        summary_key = CACHE_KEYS["conversation_summary"].format(conversation_id=conversation_id)
+        state = await self.cache_manager.aget(summary_key) or {"until_id": 0, "summary": ""}
+
+        # 요약 이후의 턴이 (요약을 뺀) 예산 안에 들어오면 요약을 그대로 사용 (저장 전 턴은 ID가 None)
+        pending = [
+            turn for turn in turns
+            if turn["chat_history_id"] is None or turn["chat_history_id"] > state["until_id"]
+        ]
+        summary_tokens = self._summary_tokens(state["summary"], model)
+        if sum(self._turn_tokens(turn, model) for turn in pending) <= budget - summary_tokens:
+            return self._assemble(state["summary"], pending)
+
+        # 예산의 keep_ratio만큼 최근 턴을 남기고 나머지를 요약에 접음
+        keep_budget = int((budget - self.summary_max_tokens - MESSAGE_OVERHEAD_TOKENS) * self.keep_ratio)
+        kept: List[Dict] = []
+        used = 0
+        for turn in reversed(pending):
+            tokens = self._turn_tokens(turn, model)
+            if used + tokens > keep_budget:
+                break
+            kept.insert(0, turn)
+            used += tokens
+        # 저장 전 턴은 요약 범위(until_id)로 표시할 수 없으므로 요약에 접지 않음 (예산을 넘으면 이번 맥락에서만 제외)
+        folded = [turn for turn in pending[:len(pending) - len(kept)] if turn["chat_history_id"] is not None]
+        if not folded:
+            return self._assemble(state["summary"], kept)
+
+        summary = await self._summarize(state["summary"], folded)
+        if summary is None:
+            # 요약 실패 시 오래된 턴은 버리고 최근 턴만 사용
+            return self._assemble("", kept)
+
+        state = {"until_id": folded[-1]["chat_history_id"], "summary": summary}
+        await self.cache_manager.aset(
+            summary_key,
+            state,
+            ttl=self.summary_ttl,
+            tags=[CACHE_TAGS["conversation"].format(conversation_id=conversation_id)]
+        )
+        return self._assemble(summary, kept)
+
+    def _summary_tokens(self, summary: str, model: str) -> int:
+        """요약 메시지 토큰 수"""
+        if not summary:
+            return 0
+        return count_message_tokens([self._summary_message(summary)], model)
+
+    @staticmethod
+    def _summary_message(summary: str) -> Dict:
+        return {"role": "system", "content": f"Summary of the earlier conversation:\n{summary}"}
+
+    def _assemble(self, summary: str, turns: List[Dict]) -> List[Dict]:
+        messages = [self._summary_message(summary)] if summary else []
+        for turn in turns:
+            messages.extend(self._turn_messages(turn))
+        return messages
+
+    async def _summarize(self, previous_summary: str, turns: List[Dict]) -> Optional[str]:
+        """기존 요약에 턴들을 더해 새 요약 생성 (실패하면 None)"""
+        transcript = "\n".join(
+            f"User: {turn['user_message']}\nAssistant: {turn['bot_response']}" for turn in turns
+        )
+        content = f"Previous summary:\n{previous_summary}\n\n" if previous_summary else ""
+        content += f"Conversation:\n{transcript}"
+
+        messages = [
+            {"role": "system", "content": SUMMARY_PROMPT},
+            {"role": "user", "content": content}
+        ]
+        try:
+            if self.rate_limiter is not None:
+                tokens = count_message_tokens(messages, self.summary_model) + self.summary_max_tokens
+                async with self.rate_limiter.acquire(self.summary_model, tokens):
+                    response = await self._create_summary(messages)
+            else:
+                response = await self._create_summary(messages)
+            summary = response.choices[0].message.content if response.choices else None
+            return summary.strip() if summary else None
+        except Exception as e:
+            logger.warning(f"대화 요약 생성 실패: {str(e)}")
+            return None
+
+    async def _create_summary(self, messages: List[Dict]) -> Any:
+        return await self.client.chat.completions.create(
+            model=self.summary_model,
+            messages=messages,
+            temperature=0,
+            max_tokens=self.summary_max_tokens
+        )
@@ -6,6 +6,7 @@ from typing import Optional, List, Dict, Any, Tuple
 
 from dotenv import load_dotenv
 
+from bots.sentence_deck import SentenceDeck
 from utils.mysql_connector import MySQLConnector
 from utils.slack_sender import SlackSender
 from utils.time_utils import (
@@ -32,6 +33,7 @@ class EnglishBot:
     def _initialize(self):
         """봇 초기화"""
         self.db = MySQLConnector()
+        self.deck = SentenceDeck()
         self.sentences_per_message = int(os.getenv('SENTENCES_PER_MESSAGE', 1))
         self._running = False
         self._thread = None
@@ -41,13 +43,8 @@ class EnglishBot:
     def get_current_cycle(self) -> int:
         """현재 사이클 번호를 가져옵니다."""
         try:
-            query = """
-                SELECT COALESCE(MAX(cycle_number), 0) as current_cycle
-                FROM small_talk
-                WHERE last_sent_at IS NOT NULL
-            """
-            result = self.db.execute_raw_query(query)
-            current_cycle = result[0]['current_cycle'] if result and result[0]['current_cycle'] is not None else 0
+            status = self.deck.status()
+            current_cycle = status['cycle_number'] if status else 0
             self.logger.info(f"Current cycle: {current_cycle}")
             return current_cycle
         except Exception as e:
@@ -56,32 +53,18 @@ class EnglishBot:
 
     def check_cycle_completion(self) -> Tuple[bool, int]:
         """사이클 완료 여부를 확인하고 새로운 사이클 번호를 반환합니다."""
+        current_cycle = 0
         try:
-            current_cycle = self.get_current_cycle()
-
-            query = """
-                SELECT 
-                    total.count as total_sentences,
-                    COALESCE(sent.count, 0) as sent_sentences
-                FROM 
-                    (SELECT COUNT(*) as count FROM small_talk) total
-                    LEFT JOIN 
-                    (SELECT COUNT(*) as count 
-                     FROM small_talk 
-                     WHERE cycle_number = %(current_cycle)s) sent ON 1=1
-            """
-
-            result = self.db.execute_raw_query(query, {'current_cycle': current_cycle})
-
-            if not result:
+            status = self.deck.status()
+            if not status:
                 return False, current_cycle
 
-            total = result[0]['total_sentences']
-            sent = result[0]['sent_sentences']
-
-            self.logger.info(f"Total sentences: {total}, Sent in current cycle: {sent}")
+            current_cycle = status['cycle_number']
+            self.logger.info(
+                f"Deck size: {status['deck_size']}, Sent in current cycle: {status['position']}"
+            )
 
-            if sent >= total:
+            if status['remaining'] == 0:
                 return True, current_cycle + 1
 
             return False, current_cycle
@@ -90,94 +73,19 @@ class EnglishBot:
             self.logger.error(f"사이클 완료 확인 중 오류 발생: {str(e)}")
             return False, current_cycle
 
+    def get_deck_status(self) -> Optional[Dict[str, Any]]:
+        """발송 덱 상태 (덱이 아직 없으면 None)"""
+        return self.deck.status()
+
     def get_random_sentences(self) -> Optional[List[Dict[str, Any]]]:
-        """랜덤 영어 문장을 가져옵니다."""
+        """섞어둔 발송 덱에서 다음 영어 문장을 가져옵니다."""
         try:
-            cycle_completed, current_cycle = self.check_cycle_completion()
-
-            if current_cycle == 0 or cycle_completed:
-                current_cycle = 1
-                self.logger.info(f"Starting new cycle: {current_cycle}")
-
-            collected_talk_ids = []
-            needed_count = self.sentences_per_message
-
-            # 1단계: cycle 0 문장 조회
-            zero_cycle_query = """
-                SELECT talk_id
-                FROM small_talk
-                WHERE (cycle_number = 0 OR cycle_number IS NULL OR last_sent_at IS NULL)
-                ORDER BY RAND()
-                LIMIT %(limit)s
-            """
-
-            zero_cycle_result = self.db.execute_raw_query(
-                zero_cycle_query,
-                {'limit': needed_count}
-            )
-
-            if zero_cycle_result:
-                collected_talk_ids.extend([row['talk_id'] for row in zero_cycle_result])
-                needed_count -= len(collected_talk_ids)
-                self.logger.info(f"Found {len(collected_talk_ids)} messages with cycle 0, need {needed_count} more")
-
-            # 2단계: cycle 0 문장이 부족한 경우 처리
-            if needed_count > 0 and collected_talk_ids:
-                collected_ids_str = ','.join(map(str, collected_talk_ids))
-                reset_query = f"""
-                    UPDATE small_talk
-                    SET last_sent_at = NULL,
-                        cycle_number = 0
-                    WHERE talk_id NOT IN ({collected_ids_str})
-                """
-                self.db.execute_raw_query(reset_query)
-                self.logger.info("Reset cycle for remaining messages: last_sent_at to NULL and cycle_number to 0")
-
-                # 추가 문장 선택
-                additional_query = f"""
-                    SELECT talk_id
-                    FROM small_talk
-                    WHERE talk_id NOT IN ({collected_ids_str})
-                    AND last_sent_at IS NULL
-                    ORDER BY RAND()
-                    LIMIT %(limit)s
-                """
+            # 덱 포인터 전진 (덱 소진 시 다음 사이클 덱을 새로 섞음)
+            collected_talk_ids = self.deck.draw(self.sentences_per_message)
 
-                additional_result = self.db.execute_raw_query(
-                    additional_query,
-                    {'limit': needed_count}
-                )
-
-                if additional_result:
-                    collected_talk_ids.extend([row['talk_id'] for row in additional_result])
-                    self.logger.info(f"Added {len(additional_result)} additional messages")
-
-            # 3단계: cycle 0 문장이 없는 경우 일반 로직으로 처리
-            if not collected_talk_ids:
-                regular_query = """
-                    SELECT talk_id
-                    FROM small_talk
-                    WHERE cycle_number < %(cycle_number)s
-                    ORDER BY RAND()
-                    LIMIT %(limit)s
-                """
-
-                regular_result = self.db.execute_raw_query(
-                    regular_query,
-                    {
-                        'cycle_number': current_cycle,
-                        'limit': self.sentences_per_message
-                    }
-                )
-
-                if regular_result:
-                    collected_talk_ids = [row['talk_id'] for row in regular_result]
-                elif cycle_completed:
-                    self.reset_cycle()
-                    return self.get_random_sentences()
-
-            # 4단계: 선택된 문장이 있으면 상세 정보 조회
+            # 선택된 문장이 있으면 상세 정보 조회
             if collected_talk_ids:
+                current_cycle = self.get_current_cycle()
                 talk_ids_str = ','.join(map(str, collected_talk_ids))
 
                 detail_query = f"""
@@ -195,7 +103,7 @@ class EnglishBot:
                     FROM small_talk st
                     LEFT JOIN answer a ON st.talk_id = a.talk_id
                     WHERE st.talk_id IN ({talk_ids_str})
-                    ORDER BY st.talk_id, a.answer_id
+                    ORDER BY FIELD(st.talk_id, {talk_ids_str}), a.answer_id
                 """
 
                 result = self.db.execute_raw_query(detail_query)
@@ -248,7 +156,7 @@ class EnglishBot:
             return None
 
     def update_sent_status(self, talk_ids: List[int], cycle_number: int) -> bool:
-        """발송된 문장들의 상태를 업데이트합니다."""
+        """발송된 문장들의 상태를 업데이트합니다. (발송된 행만 기본 키로 갱신)"""
         try:
             if not talk_ids:
                 return False
@@ -267,7 +175,7 @@ class EnglishBot:
                 'cycle_number': cycle_number
             }
 
-            result = self.db.execute_raw_query(query, params)
+            self.db.execute_raw_query(query, params)
             self.logger.info(f"Updated {len(talk_ids)} sentences to cycle {cycle_number} with current timestamp")
             return True
 
@@ -276,16 +184,12 @@ class EnglishBot:
             return False
 
     def reset_cycle(self) -> bool:
-        """새로운 사이클을 위해 모든 문장의 상태를 초기화합니다."""
+        """새로운 사이클 덱을 섞어 처음부터 다시 발송합니다. (small_talk 행은 갱신하지 않음)"""
         try:
-            query = """
-                UPDATE small_talk
-                SET last_sent_at = NULL,
-                    cycle_number = 0
-            """
-            self.db.execute_raw_query(query)
-            self.logger.info("Reset all sentences: last_sent_at to NULL and cycle_number to 0")
-            return True
+            success = self.deck.reset()
+            if success:
+                self.logger.info("Reset cycle: reshuffled a new delivery deck")
+            return success
         except Exception as e:
             self.logger.error(f"사이클 초기화 중 오류 발생: {str(e)}")
             return False
@@ -348,15 +252,10 @@ class EnglishBot:
     def get_last_message_time(self) -> Optional[str]:
         """마지막 메시지 전송 시간 반환 (KST)"""
         try:
-            query = """
-                SELECT MAX(last_sent_at) as last_sent
-                FROM small_talk
-                WHERE last_sent_at IS NOT NULL
-            """
-            result = self.db.execute_raw_query(query)
-            if result and result[0]['last_sent']:
+            status = self.deck.status()
+            if status and status['last_sent_at']:
                 # UTC 시간을 KST로 변환하여 문자열로 반환
-                return format_kst(result[0]['last_sent'])
+                return format_kst(status['last_sent_at'])
             return None
         except Exception as e:
             self.logger.error(f"마지막 전송 시간 조회 중 오류 발생: {str(e)}")
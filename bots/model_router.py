@@ -0,0 +1,354 @@
+# bots/model_router.py
+import asyncio
+import logging
+import random
+import threading
+from bisect import bisect_left
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import openai
+
+from bots.context_builder import count_message_tokens
+from bots.rate_limiter import OpenAIRateLimiter
+from chat.exceptions import OpenAIError, OpenAITimeout
+
+logger = logging.getLogger(__name__)
+
+# 시도 지연 히스토그램 구간 상한(초), 마지막 구간은 그 이상
+LATENCY_BUCKETS_SECONDS = (0.5, 1, 2, 5, 10, 20, 30, 60)
+
+# 같은 모델로 다시 시도할 HTTP 상태 코드 (요청 시간 초과, 충돌, 요청 한도, 서버 오류)
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+# 다음 모델로 넘어가면 해결될 수 있는 HTTP 상태 코드 (모델 접근 권한 없음, 모델 없음)
+FALLBACK_STATUS_CODES = {403, 404}
+
+# 오류 처리 방식
+RETRY = "retry"
+FALLBACK = "fallback"
+FATAL = "fatal"
+
+
+class _AttemptStats:
+    """모델별 호출 시도 지표"""
+
+    __slots__ = ("attempts", "successes", "failures", "retries", "fallbacks", "latency_time", "latency_max",
+                 "latency_buckets", "first_token_calls", "first_token_time", "first_token_max")
+
+    def __init__(self):
+        self.attempts = 0
+        self.successes = 0
+        self.failures: Dict[str, int] = {}
+        self.retries = 0
+        self.fallbacks = 0
+        self.latency_time = 0.0
+        self.latency_max = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS_SECONDS) + 1)
+        self.first_token_calls = 0
+        self.first_token_time = 0.0
+        self.first_token_max = 0.0
+
+    def to_dict(self) -> Dict:
+        buckets = {f"le_{bound}s": count for bound, count in zip(LATENCY_BUCKETS_SECONDS, self.latency_buckets)}
+        buckets[f"gt_{LATENCY_BUCKETS_SECONDS[-1]}s"] = self.latency_buckets[-1]
+        return {
+            "attempts": self.attempts,
+            "successes": self.successes,
+            "failures": dict(sorted(self.failures.items())),
+            "success_rate": round(self.successes / self.attempts, 4) if self.attempts else 0.0,
+            "retries": self.retries,
+            "fallbacks": self.fallbacks,
+            "latency": {
+                "avg_ms": round(self.latency_time / self.attempts * 1000, 3) if self.attempts else 0.0,
+                "max_ms": round(self.latency_max * 1000, 3),
+                "histogram": buckets
+            },
+            "first_token": {
+                "avg_ms": round(self.first_token_time / self.first_token_calls * 1000, 3)
+                if self.first_token_calls else 0.0,
+                "max_ms": round(self.first_token_max * 1000, 3)
+            }
+        }
+
+
+class OpenAICallMetrics:
+    """OpenAI 호출 시도별 지표 (모델별 성공/실패 원인, 재시도/전환 수, 전체 지연과 첫 토큰 지연)"""
+
+    def __init__(self):
+        self._models: Dict[str, _AttemptStats] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.served_by_fallback = 0
+        self.deadline_exceeded = 0
+        self.exhausted = 0
+
+    def _stats(self, model: str) -> _AttemptStats:
+        stats = self._models.get(model)
+        if stats is None:
+            stats = self._models[model] = _AttemptStats()
+        return stats
+
+    def record_attempt(self, model: str, elapsed: float, first_token: Optional[float] = None,
+                       error: Optional[str] = None) -> None:
+        """
+        시도 하나의 결과 기록
+
+        Args:
+            model: 호출한 모델
+            elapsed: 요청 시작부터 스트림 종료(또는 실패)까지 걸린 시간(초)
+            first_token: 첫 토큰까지 걸린 시간(초), 토큰을 받지 못했으면 None
+            error: 실패 원인 (성공이면 None)
+        """
+        bucket = bisect_left(LATENCY_BUCKETS_SECONDS, elapsed)
+        with self._lock:
+            stats = self._stats(model)
+            stats.attempts += 1
+            if error is None:
+                stats.successes += 1
+            else:
+                stats.failures[error] = stats.failures.get(error, 0) + 1
+            stats.latency_time += elapsed
+            stats.latency_max = max(stats.latency_max, elapsed)
+            stats.latency_buckets[bucket] += 1
+            if first_token is not None:
+                stats.first_token_calls += 1
+                stats.first_token_time += first_token
+                stats.first_token_max = max(stats.first_token_max, first_token)
+
+    def record_retry(self, model: str) -> None:
+        with self._lock:
+            self._stats(model).retries += 1
+
+    def record_fallback(self, model: str) -> None:
+        """model에서 다음 모델로 전환"""
+        with self._lock:
+            self._stats(model).fallbacks += 1
+
+    def record_request(self, fallback: bool = False, deadline_exceeded: bool = False,
+                       exhausted: bool = False) -> None:
+        """요청 하나의 최종 결과 기록"""
+        with self._lock:
+            self.requests += 1
+            self.served_by_fallback += fallback
+            self.deadline_exceeded += deadline_exceeded
+            self.exhausted += exhausted
+
+    def stats(self) -> Dict:
+        """
+        호출 지표 스냅샷
+
+        Returns:
+            전체 요청 결과와 모델별 시도 지표
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "served_by_fallback": self.served_by_fallback,
+                "deadline_exceeded": self.deadline_exceeded,
+                "exhausted": self.exhausted,
+                "models": {model: stats.to_dict() for model, stats in sorted(self._models.items())}
+            }
+
+
+class ModelRouter:
+    """
+    OpenAI 스트리밍 호출의 재시도, 시간 제한, 모델 전환
+
+    재시도할 수 있는 오류(연결 오류, 429, 5xx, 첫 토큰 시간 초과)는 지터를 준 지수 백오프로
+    같은 모델에 다시 시도하고, 재시도를 다 쓰거나 모델을 쓸 수 없으면 fallback_models의 다음 모델로 넘어간다.
+    모든 시도는 요청 전체 기한(deadline) 안에서만 이루어진다.
+    응답 조각을 한 번이라도 내보낸 뒤에는 구독자가 이미 받은 내용과 섞이므로 다시 시도하지 않는다.
+    """
+
+    def __init__(self, client: Any, rate_limiter: OpenAIRateLimiter, fallback_models: Sequence[str] = (),
+                 max_retries: int = 2, backoff_base: float = 0.5, backoff_max: float = 8.0,
+                 first_token_timeout: float = 20.0, deadline: float = 90.0,
+                 metrics: Optional[OpenAICallMetrics] = None):
+        """
+        라우터 초기화
+
+        Args:
+            client: AsyncOpenAI 클라이언트 (SDK 자체 재시도는 끄고 연결 시간 제한을 설정해 둘 것)
+            rate_limiter: 시도마다 적용할 OpenAI 호출 제한기
+            fallback_models: 모델 전환 순서 (예: ["gpt-4o", "gpt-4o-mini"])
+            max_retries: 모델마다 처음 시도 이후 다시 시도할 횟수
+            backoff_base: 첫 재시도 백오프 상한(초), 재시도마다 두 배
+            backoff_max: 백오프 최대값(초)
+            first_token_timeout: 요청 시작부터 첫 응답 토큰까지 기다리는 시간(초)
+            deadline: 재시도와 모델 전환을 포함한 요청 전체 기한(초)
+            metrics: 시도 지표 기록 대상 (None이면 공유 지표)
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries는 0 이상이어야 합니다.")
+
+        self.client = client
+        self.rate_limiter = rate_limiter
+        self.fallback_models = list(fallback_models)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.first_token_timeout = first_token_timeout
+        self.deadline = deadline
+        self.metrics = metrics or get_call_metrics()
+
+    def chain(self, model: str) -> List[str]:
+        """요청 모델부터 시작하는 모델 전환 순서 (요청 모델이 목록에 없으면 목록 전체가 뒤에 붙음)"""
+        if model in self.fallback_models:
+            return self.fallback_models[self.fallback_models.index(model):]
+        return [model, *self.fallback_models]
+
+    @staticmethod
+    def _classify(error: Exception) -> Tuple[str, str]:
+        """오류의 (처리 방식, 지표용 원인)"""
+        if isinstance(error, openai.APITimeoutError):
+            return RETRY, "timeout"
+        if isinstance(error, openai.APIConnectionError):
+            return RETRY, "connection"
+        if isinstance(error, openai.APIStatusError):
+            reason = f"status_{error.status_code}"
+            if getattr(error, "code", None) == "insufficient_quota":
+                return FATAL, "insufficient_quota"
+            if error.status_code in RETRYABLE_STATUS_CODES:
+                return RETRY, reason
+            if error.status_code in FALLBACK_STATUS_CODES:
+                return FALLBACK, reason
+            return FATAL, reason
+        return FATAL, type(error).__name__
+
+    def _backoff(self, retry: int, error: Optional[Exception]) -> float:
+        """retry번째 재시도 전 대기 시간 (full jitter, 서버가 Retry-After를 주면 그 이상 대기)"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** retry)))
+        response = getattr(error, "response", None)
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get("retry-after", 0))
+            except (TypeError, ValueError):
+                retry_after = 0.0
+            delay = max(delay, min(retry_after, self.backoff_max))
+        return delay
+
+    async def stream(self, messages: List[Dict], model: str, temperature: float, max_tokens: int,
+                     user_id: Optional[int] = None) -> AsyncIterator[str]:
+        """
+        응답 조각(delta)을 도착하는 대로 반환 (재시도/모델 전환 적용)
+
+        Raises:
+            RateLimitTimeout: 호출 제한기 대기 시간 초과
+            OpenAITimeout: 요청 전체 기한 초과
+            OpenAIError: 재시도할 수 없는 오류 또는 모든 모델 실패
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline
+        chain = self.chain(model)
+        last_error: Optional[Exception] = None
+
+        for index, candidate in enumerate(chain):
+            if index > 0:
+                logger.warning(f"{chain[index - 1]} 호출 실패, {candidate} 모델로 전환: {str(last_error)}")
+                self.metrics.record_fallback(chain[index - 1])
+
+            for retry in range(self.max_retries + 1):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    self.metrics.record_request(deadline_exceeded=True)
+                    raise OpenAITimeout(f"OpenAI 응답 기한({self.deadline}초) 초과: {str(last_error)}")
+
+                streamed = False
+                first_token = None
+                response = None
+                # 호출 차례는 남은 기한 안에서만 기다림 (제한기 대기 시간은 시도 지연에 넣지 않음)
+                tokens = count_message_tokens(messages, candidate) + max_tokens
+                async with self.rate_limiter.acquire(candidate, tokens, user_id=user_id,
+                                                     timeout=min(self.rate_limiter.timeout, remaining)):
+                    started = loop.time()
+                    first_token_deadline = min(deadline, started + self.first_token_timeout)
+                    try:
+                        response = await asyncio.wait_for(
+                            self.client.chat.completions.create(
+                                model=candidate,
+                                messages=messages,
+                                stream=True,
+                                temperature=temperature,
+                                max_tokens=max_tokens
+                            ),
+                            max(0.0, first_token_deadline - loop.time())
+                        )
+                        chunks = response.__aiter__()
+                        while True:
+                            limit = deadline if streamed else first_token_deadline
+                            chunk = await asyncio.wait_for(anext(chunks, None), max(0.0, limit - loop.time()))
+                            if chunk is None:
+                                break
+                            if chunk.choices and chunk.choices[0].delta.content:
+                                if not streamed:
+                                    streamed = True
+                                    first_token = loop.time() - started
+                                yield chunk.choices[0].delta.content
+
+                        if not streamed:
+                            raise OpenAIError("Empty response from OpenAI")
+
+                    except asyncio.TimeoutError:
+                        expired = streamed or loop.time() >= deadline
+                        self.metrics.record_attempt(candidate, loop.time() - started, first_token,
+                                                    "deadline" if expired else "first_token_timeout")
+                        if expired:
+                            self.metrics.record_request(deadline_exceeded=True)
+                            raise OpenAITimeout(f"OpenAI 응답 기한({self.deadline}초) 초과 ({candidate})")
+                        last_error = OpenAITimeout(
+                            f"{candidate} 첫 토큰 대기 시간({self.first_token_timeout}초) 초과")
+                        action = RETRY
+
+                    except OpenAIError as e:
+                        # 빈 응답은 일시적인 오류로 보고 다시 시도
+                        self.metrics.record_attempt(candidate, loop.time() - started, first_token, "empty")
+                        last_error = e
+                        action = RETRY
+
+                    except Exception as e:
+                        action, reason = self._classify(e)
+                        self.metrics.record_attempt(candidate, loop.time() - started, first_token, reason)
+                        if streamed:
+                            self.metrics.record_request()
+                            raise OpenAIError(f"응답 스트림 중단 ({candidate}): {str(e)}")
+                        if action == FATAL:
+                            self.metrics.record_request()
+                            raise OpenAIError(f"OpenAI 호출 실패 ({candidate}): {str(e)}")
+                        last_error = e
+
+                    else:
+                        self.metrics.record_attempt(candidate, loop.time() - started, first_token)
+                        self.metrics.record_request(fallback=index > 0)
+                        return
+
+                    finally:
+                        if response is not None:
+                            await response.close()
+
+                logger.warning(f"OpenAI 호출 실패 ({candidate}, 시도 {retry + 1}/{self.max_retries + 1}): "
+                               f"{str(last_error)}")
+                if action == FALLBACK or retry == self.max_retries:
+                    break
+
+                delay = self._backoff(retry, last_error)
+                if loop.time() + delay >= deadline:
+                    break
+                self.metrics.record_retry(candidate)
+                await asyncio.sleep(delay)
+
+        if deadline - loop.time() <= 0:
+            self.metrics.record_request(deadline_exceeded=True)
+            raise OpenAITimeout(f"OpenAI 응답 기한({self.deadline}초) 초과: {str(last_error)}")
+        self.metrics.record_request(exhausted=True)
+        raise OpenAIError(f"모든 모델 호출 실패 ({', '.join(chain)}): {str(last_error)}")
+
+
+_call_metrics: Optional[OpenAICallMetrics] = None
+
+
+def get_call_metrics() -> OpenAICallMetrics:
+    """공유 OpenAI 호출 지표 반환"""
+    global _call_metrics
+    if _call_metrics is None:
+        _call_metrics = OpenAICallMetrics()
+    return _call_metrics
@@ -1,60 +1,146 @@
 # bots/openai_bot.py
+import asyncio
 import hashlib
 import json
 import logging
-from typing import List, Dict, Optional, Tuple, Any
+import time
+from typing import List, Dict, Optional, Tuple, Any, AsyncIterator
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, Timeout
 
+from bots.context_builder import ContextBuilder
+from bots.model_router import ModelRouter
+from bots.rate_limiter import get_rate_limiter
+from chat.chat_manager import ChatManager
 from chat.chat_settings import ChatSettingsManager
+from chat.constants import CACHE_TAGS, MAX_HISTORY_PER_CONV
 from chat.exceptions import OpenAIError
 from chat.prompt_manager import PromptManager
 from configs.openai_setting import get_openai_settings
-from utils.cache_manager import CacheManager
+from utils.cache_manager import CacheManager, get_cache_manager
 
 logger = logging.getLogger(__name__)
 
 
+class _StreamFlight:
+    """
+    진행 중인 OpenAI 스트림 하나 (같은 캐시 키의 동시 요청이 함께 구독)
+
+    조각을 모두 보관하므로 늦게 합류한 구독자도 처음부터 받는다.
+    """
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.done = False
+        self.error: Optional[Exception] = None
+        self.task: Optional[asyncio.Task] = None
+        self.subscribers = 0
+        self._changed = asyncio.Event()
+
+    def publish(self, part: str) -> None:
+        self.parts.append(part)
+        self._notify()
+
+    def finish(self, error: Optional[Exception] = None) -> None:
+        self.error = error
+        self.done = True
+        self._notify()
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def subscribe(self) -> AsyncIterator[str]:
+        index = 0
+        while True:
+            changed = self._changed
+            while index < len(self.parts):
+                yield self.parts[index]
+                index += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            await changed.wait()
+
+
 class OpenAIBot:
     def __init__(self, cache_manager: Optional[CacheManager] = None):
         settings = get_openai_settings()
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        # 재시도는 ModelRouter가 담당하므로 SDK 자체 재시도는 끔 (읽기 시간 제한은 요청 전체 기한)
+        self.client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            base_url=settings.OPENAI_BASE_URL,
+            timeout=Timeout(settings.OPENAI_REQUEST_DEADLINE, connect=settings.OPENAI_CONNECT_TIMEOUT),
+            max_retries=0
+        )
         self.base_model = settings.MODEL_NAME
         self.base_temperature = settings.TEMPERATURE
         self.base_max_tokens = settings.MAX_TOKENS
-        self.prompt_manager = PromptManager()
-        self.chat_settings_manager = ChatSettingsManager()
 
-        # 캐시 매니저 초기화
-        self.cache_manager = cache_manager or CacheManager(
-            redis_url=settings.REDIS_URL,
-            ttl=settings.CACHE_TTL if hasattr(settings, 'CACHE_TTL') else 3600
+        # 공유 캐시 매니저 (매니저들과 같은 Redis 연결/L1 캐시 사용)
+        self.cache_manager = cache_manager or get_cache_manager()
+        self.prompt_manager = PromptManager(self.cache_manager)
+        self.chat_settings_manager = ChatSettingsManager(self.cache_manager)
+
+        # OpenAI 호출 속도/동시 실행 제한 (프로세스 공유)
+        self.rate_limiter = get_rate_limiter()
+
+        # 재시도/시간 제한/모델 전환 (gpt-4o -> gpt-4o-mini)
+        self.model_router = ModelRouter(
+            self.client,
+            self.rate_limiter,
+            fallback_models=[model.strip() for model in settings.OPENAI_FALLBACK_MODELS.split(',') if model.strip()],
+            max_retries=settings.OPENAI_MAX_RETRIES,
+            backoff_base=settings.OPENAI_RETRY_BACKOFF_BASE,
+            backoff_max=settings.OPENAI_RETRY_BACKOFF_MAX,
+            first_token_timeout=settings.OPENAI_FIRST_TOKEN_TIMEOUT,
+            deadline=settings.OPENAI_REQUEST_DEADLINE
         )
+
+        # 이전 대화 맥락 (토큰 예산 안의 최근 턴 + 누적 요약)
+        self.context_builder = ContextBuilder(
+            self.client,
+            ChatManager(self.cache_manager),
+            self.cache_manager,
+            max_context_tokens=settings.CONTEXT_MAX_TOKENS,
+            summary_model=settings.CONTEXT_SUMMARY_MODEL,
+            summary_max_tokens=settings.CONTEXT_SUMMARY_MAX_TOKENS,
+            rate_limiter=self.rate_limiter
+        )
+
         self.cache_enabled = getattr(settings, 'ENABLE_RESPONSE_CACHE', True)
 
+        # 같은 캐시 키의 동시 요청은 하나의 OpenAI 스트림을 공유 (0보다 크면 워커 간에도 Redis 락으로 합침)
+        self._inflight: Dict[str, _StreamFlight] = {}
+        self.single_flight_lock_timeout = settings.OPENAI_SINGLE_FLIGHT_LOCK_TIMEOUT
+
         # 캐시 접두사 및 TTL 설정
         self.cache_prefix = "openai_response:"
         self.conversation_cache_prefix = "openai_conversation:"
 
-    def _get_user_settings(self, user_id: int) -> Dict:
+    async def _get_user_settings(self, user_id: int) -> Dict:
         """사용자별 설정 조회"""
         # 캐시 키 생성
         cache_key = f"user_settings:{user_id}"
 
         # 캐시에서 설정 조회
         if self.cache_manager.is_available:
-            cached_settings = self.cache_manager.get(cache_key)
+            cached_settings = await self.cache_manager.aget(cache_key)
             if cached_settings:
                 return cached_settings
 
         try:
             # ChatSettingsManager를 통해 사용자 설정 조회
             # 설정이 없는 경우 기본값 반환됨
-            settings = self.chat_settings_manager.get_user_settings(user_id)
+            settings = await self.chat_settings_manager.get_user_settings(user_id)
 
             # 캐시에 저장 (TTL 1시간)
             if self.cache_manager.is_available:
-                self.cache_manager.set(cache_key, settings, ttl=3600)
+                await self.cache_manager.aset(cache_key, settings, ttl=3600, tags=[
+                    CACHE_TAGS["user"].format(user_id=user_id),
+                    CACHE_TAGS["user_settings"].format(user_id=user_id)
+                ])
 
             return settings
         except Exception as e:
@@ -69,56 +155,64 @@ class OpenAIBot:
 
             return default_settings
 
-    def _get_template(self, template_id: Optional[int] = None) -> Dict:
+    async def _get_template(self, template_id: Optional[int] = None) -> Dict:
         """템플릿 조회 (캐시 적용)"""
         if not template_id:
             # 기본 템플릿이 없는 경우 첫 번째 활성 템플릿 사용
             cache_key = "default_template"
+            tag = CACHE_TAGS["prompt_templates"]
         else:
             cache_key = f"template:{template_id}"
+            tag = CACHE_TAGS["prompt_template"].format(template_id=template_id)
 
         # 캐시에서 템플릿 조회
         if self.cache_manager.is_available:
-            cached_template = self.cache_manager.get(cache_key)
+            cached_template = await self.cache_manager.aget(cache_key)
             if cached_template:
                 return cached_template
 
         try:
             if template_id:
-                template = self.prompt_manager.get_template_by_id(template_id)
+                template = await self.prompt_manager.get_template_by_id(template_id)
             else:
-                templates = self.prompt_manager.get_all_templates()
+                templates = await self.prompt_manager.get_all_templates()
                 if not templates:
                     raise OpenAIError("No active prompt template found")
                 template = templates[0]
 
             # 캐시에 저장 (TTL 1일)
             if self.cache_manager.is_available:
-                self.cache_manager.set(cache_key, template, ttl=86400)
+                await self.cache_manager.aset(cache_key, template, ttl=86400, tags=[tag])
 
             return template
         except Exception as e:
             logger.error(f"템플릿 조회 실패: {str(e)}")
             raise OpenAIError(f"템플릿 조회 실패: {str(e)}")
 
-    def _prepare_messages(self, user_message: str, user_id: int) -> Tuple[List[Dict], Dict]:
-        """대화 메시지 준비"""
+    async def _prepare_messages(self, user_message: str, user_id: int,
+                                conversation_id: Optional[str] = None) -> Tuple[List[Dict], Dict]:
+        """대화 메시지 준비 (conversation_id가 있으면 토큰 예산 안에서 이전 대화 맥락 포함)"""
         # 사용자 설정 조회
-        user_settings = self._get_user_settings(user_id)
+        user_settings = await self._get_user_settings(user_id)
 
         # 프롬프트 템플릿 조회
-        template = self._get_template(user_settings.get('default_prompt_template_id'))
-
-        messages = [
-            {"role": "system", "content": template['system_prompt']},
-            {"role": "user", "content": template['user_prompt'].format(user_input=user_message)}
-        ]
-        return messages, user_settings
+        template = await self._get_template(user_settings.get('default_prompt_template_id'))
+
+        system_message = {"role": "system", "content": template['system_prompt']}
+        user_prompt = {"role": "user", "content": template['user_prompt'].format(user_input=user_message)}
+        context = await self.context_builder.build(
+            conversation_id,
+            user_settings['model'],
+            user_settings['max_tokens'],
+            [system_message, user_prompt]
+        )
+        return [system_message, *context, user_prompt], user_settings
 
-    def _generate_cache_key(self, user_message: str, user_id: int, model: str, temperature: float) -> str:
-        """캐시 키 생성"""
+    async def _generate_cache_key(self, user_message: str, user_id: int, model: str, temperature: float,
+                                  messages: Optional[List[Dict]] = None) -> str:
+        """캐시 키 생성 (같은 메시지라도 대화 맥락이 다르면 다른 키)"""
         # 사용자 설정 조회
-        user_settings = self._get_user_settings(user_id)
+        user_settings = await self._get_user_settings(user_id)
 
         # 캐시 키 구성 요소
         key_components = {
@@ -126,7 +220,8 @@ class OpenAIBot:
             "user_id": user_id,
             "model": model,
             "temperature": temperature,
-            "template_id": user_settings.get('default_prompt_template_id')
+            "template_id": user_settings.get('default_prompt_template_id'),
+            "context": messages[1:-1] if messages else []
         }
 
         # 해시 생성
@@ -137,7 +232,7 @@ class OpenAIBot:
 
     def _get_conversation_cache_key(self, conversation_id: str) -> str:
         """대화 ID에 대한 캐시 키 생성"""
-        return f"{self.conversation_cache_prefix}{conversation_id}"
+        return f"{self.conversation_cache_prefix}{conversation_id}:messages"
 
     async def get_cached_response(self, cache_key: str) -> Optional[str]:
         """캐시에서 응답 조회"""
@@ -145,18 +240,20 @@ class OpenAIBot:
             return None
 
         try:
-            return self.cache_manager.get(cache_key)
+            return await self.cache_manager.aget(cache_key)
         except Exception as e:
             logger.warning(f"캐시 조회 중 오류 발생: {str(e)}")
             return None
 
-    async def cache_response(self, cache_key: str, response: str, ttl: Optional[int] = None) -> None:
-        """응답을 캐시에 저장"""
+    async def cache_response(self, cache_key: str, response: str, ttl: Optional[int] = None,
+                             user_id: Optional[int] = None) -> None:
+        """응답을 캐시에 저장 (user_id가 있으면 사용자 태그에 등록)"""
         if not self.cache_enabled or not self.cache_manager.is_available:
             return
 
         try:
-            self.cache_manager.set(cache_key, response, ttl=ttl)
+            tags = [CACHE_TAGS["user"].format(user_id=user_id)] if user_id else None
+            await self.cache_manager.aset(cache_key, response, ttl=ttl, tags=tags)
         except Exception as e:
             logger.warning(f"캐시 저장 중 오류 발생: {str(e)}")
 
@@ -167,35 +264,35 @@ class OpenAIBot:
 
         try:
             cache_key = self._get_conversation_cache_key(conversation_id)
-            conversation = self.cache_manager.get(cache_key) or []
-
-            # 대화 기록 추가
-            conversation.append({
-                "role": "user",
-                "content": user_message
-            })
-            conversation.append({
-                "role": "assistant",
-                "content": ai_response
-            })
 
-            # 캐시에 저장 (TTL 1일)
-            self.cache_manager.set(cache_key, conversation, ttl=86400)
+            # 대화 기록을 리스트 끝에 덧붙이고 최근 메시지만 유지 (TTL 1일)
+            await self.cache_manager.alist_append(cache_key, [
+                {"role": "user", "content": user_message},
+                {"role": "assistant", "content": ai_response}
+            ], max_len=MAX_HISTORY_PER_CONV * 2, ttl=86400)
         except Exception as e:
             logger.warning(f"대화 기록 캐시 업데이트 중 오류 발생: {str(e)}")
 
-    async def generate_stream(self, user_message: str, user_id: int, conversation_id: Optional[str] = None) -> str:
-        """스트리밍 방식으로 응답 생성 (캐시 적용)"""
+    async def stream_response(self, user_message: str, user_id: int,
+                              conversation_id: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        응답 조각(delta)을 도착하는 대로 반환하는 스트리밍 생성 (캐시 적용)
+
+        캐시 히트 시 캐시된 응답 전체를 한 번에 반환한다.
+        같은 캐시 키로 이미 진행 중인 스트림이 있으면 OpenAI를 다시 호출하지 않고 그 스트림에 합류한다.
+        응답 캐싱과 대화 기록 캐시 갱신은 스트림이 끝난 뒤에 수행한다.
+        """
         try:
             # 메시지와 설정 준비
-            messages, user_settings = self._prepare_messages(user_message, user_id)
+            messages, user_settings = await self._prepare_messages(user_message, user_id, conversation_id)
 
             # 캐시 키 생성
-            cache_key = self._generate_cache_key(
+            cache_key = await self._generate_cache_key(
                 user_message,
                 user_id,
                 user_settings['model'],
-                user_settings['temperature']
+                user_settings['temperature'],
+                messages
             )
 
             # 캐시에서 응답 조회
@@ -207,35 +304,34 @@ class OpenAIBot:
                 if conversation_id:
                     await self.update_conversation_cache(conversation_id, user_message, cached_response)
 
-                return cached_response
-
-            # OpenAI API 호출
-            response = await self.client.chat.completions.create(
-                model=user_settings['model'],
-                messages=messages,
-                stream=True,
-                temperature=user_settings['temperature'],
-                max_tokens=user_settings['max_tokens']
-            )
-
-            # 전체 응답 수집
-            full_response = ""
-            async for chunk in response:
-                if chunk.choices[0].delta.content:
-                    full_response += chunk.choices[0].delta.content
+                yield cached_response
+                return
 
-            if not full_response:
-                raise OpenAIError("Empty response from OpenAI")
-
-            # 응답 캐싱
-            ttl = getattr(user_settings, 'cache_ttl', None)  # 사용자 별 TTL 설정이 있으면 사용
-            await self.cache_response(cache_key, full_response, ttl)
+            # 같은 키로 진행 중인 스트림이 있으면 합류, 없으면 새로 시작
+            flight = self._inflight.get(cache_key)
+            if flight is None:
+                flight = _StreamFlight()
+                self._inflight[cache_key] = flight
+                flight.task = asyncio.create_task(self._run_flight(flight, cache_key, messages, user_settings, user_id))
+            else:
+                logger.info(f"진행 중인 응답 스트림에 합류 (키: {cache_key})")
+
+            # 조각은 리스트에 모았다가 마지막에 한 번만 합침
+            parts = []
+            flight.subscribers += 1
+            try:
+                async for delta in flight.subscribe():
+                    parts.append(delta)
+                    yield delta
+            finally:
+                flight.subscribers -= 1
+                if flight.subscribers == 0 and not flight.done:
+                    # 모든 구독자가 떠나면 (연결 종료/오류) OpenAI 호출을 취소해 토큰과 호출 슬롯을 반환
+                    self._cancel_flight(cache_key, flight)
 
             # 대화 기록 업데이트
             if conversation_id:
-                await self.update_conversation_cache(conversation_id, user_message, full_response)
-
-            return full_response
+                await self.update_conversation_cache(conversation_id, user_message, "".join(parts))
 
         except Exception as e:
             logger.error(f"응답 생성 중 오류 발생: {str(e)}")
@@ -243,6 +339,88 @@ class OpenAIBot:
                 raise
             raise OpenAIError(f"응답 생성 실패: {str(e)}")
 
+    def _cancel_flight(self, cache_key: str, flight: _StreamFlight) -> None:
+        """구독자가 없는 스트림 취소 (새 요청이 취소된 스트림에 합류하지 않도록 바로 목록에서 제거)"""
+        if self._inflight.get(cache_key) is flight:
+            del self._inflight[cache_key]
+        flight.finish(OpenAIError("응답 스트림이 취소되었습니다."))
+        if flight.task is not None:
+            flight.task.cancel()
+
+    async def _run_flight(self, flight: _StreamFlight, cache_key: str, messages: List[Dict],
+                          user_settings: Dict, user_id: int) -> None:
+        """
+        OpenAI 스트림을 받아 구독자들에게 전달하고 응답을 캐시 (구독자와 별개의 태스크로 실행)
+
+        워커 간 single-flight를 켜면 Redis 락을 잡은 워커만 OpenAI를 호출하고,
+        다른 워커는 응답 캐시에 저장될 때까지 기다렸다가 전체 응답을 한 번에 전달한다.
+        """
+        token = None
+        try:
+            if self.single_flight_lock_timeout > 0 and self.cache_enabled and self.cache_manager.is_available:
+                token = await self.cache_manager.aacquire_lock(cache_key, self.single_flight_lock_timeout)
+                if token is None:
+                    cached_response, token = await self._wait_for_other_worker(cache_key)
+                    if cached_response:
+                        flight.publish(cached_response)
+                        flight.finish()
+                        return
+
+            # OpenAI API 호출 (시도마다 한도 안에서 차례를 기다리고, 일시적 오류는 재시도 후 다음 모델로 전환)
+            async for delta in self.model_router.stream(
+                    messages,
+                    user_settings['model'],
+                    user_settings['temperature'],
+                    user_settings['max_tokens'],
+                    user_id=user_id
+            ):
+                flight.publish(delta)
+
+            full_response = "".join(flight.parts)
+            if not full_response:
+                raise OpenAIError("Empty response from OpenAI")
+
+            # 응답 캐싱 (구독자가 끝나기 전에 저장해 이후 요청은 캐시에서 받도록)
+            ttl = getattr(user_settings, 'cache_ttl', None)  # 사용자 별 TTL 설정이 있으면 사용
+            await self.cache_response(cache_key, full_response, ttl, user_id=user_id)
+            flight.finish()
+
+        except Exception as e:
+            logger.error(f"응답 생성 중 오류 발생: {str(e)}")
+            flight.finish(e if isinstance(e, OpenAIError) else OpenAIError(f"응답 생성 실패: {str(e)}"))
+        finally:
+            if self._inflight.get(cache_key) is flight:
+                del self._inflight[cache_key]
+            if token is not None:
+                await self.cache_manager.arelease_lock(cache_key, token)
+
+    async def _wait_for_other_worker(self, cache_key: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        다른 워커가 같은 키의 응답을 생성하는 동안 대기
+
+        Returns:
+            (캐시된 응답, 락 토큰) - 응답이 저장되면 응답을, 상대 락이 풀리면(실패/만료) 새로 얻은 토큰을 반환.
+            대기 시간이 지나면 둘 다 None (락 없이 직접 생성)
+        """
+        deadline = time.monotonic() + self.single_flight_lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+            cached_response = await self.get_cached_response(cache_key)
+            if cached_response:
+                return cached_response, None
+            token = await self.cache_manager.aacquire_lock(cache_key, self.single_flight_lock_timeout)
+            if token is not None:
+                return None, token
+        logger.warning(f"다른 워커의 응답 생성 대기 시간 초과, 직접 생성 (키: {cache_key})")
+        return None, None
+
+    async def generate_stream(self, user_message: str, user_id: int, conversation_id: Optional[str] = None) -> str:
+        """스트리밍 방식으로 전체 응답 생성 (캐시 적용)"""
+        parts = [
+            delta async for delta in self.stream_response(user_message, user_id, conversation_id)
+        ]
+        return "".join(parts)
+
     async def invalidate_user_cache(self, user_id: int) -> bool:
         """사용자 관련 캐시 무효화"""
         if not self.cache_manager.is_available:
@@ -250,11 +428,10 @@ class OpenAIBot:
 
         try:
             # 사용자 설정 캐시 삭제
-            self.cache_manager.delete(f"user_settings:{user_id}")
+            await self.cache_manager.adelete(f"user_settings:{user_id}")
 
-            # 사용자 응답 캐시 패턴 삭제
-            pattern = f"{self.cache_prefix}*user_id\":{user_id}*"
-            self.cache_manager.delete_pattern(pattern)
+            # 사용자 태그에 등록된 응답/설정/대화 목록 캐시 삭제 (응답 키는 해시라 패턴으로 찾을 수 없음)
+            await self.cache_manager.ainvalidate_tag(CACHE_TAGS["user"].format(user_id=user_id))
 
             return True
         except Exception as e:
@@ -268,8 +445,24 @@ class OpenAIBot:
 
         try:
             cache_key = self._get_conversation_cache_key(conversation_id)
-            self.cache_manager.delete(cache_key)
+            await self.cache_manager.adelete(cache_key)
             return True
         except Exception as e:
             logger.error(f"대화 기록 캐시 무효화 중 오류 발생: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+
+_openai_bot: Optional[OpenAIBot] = None
+
+
+def get_openai_bot() -> OpenAIBot:
+    """
+    프로세스에서 공유하는 OpenAIBot 반환
+
+    동시 요청 합치기(in-flight 레지스트리), OpenAI 클라이언트 연결 풀, 모델 라우터가 봇 인스턴스에 있으므로
+    채팅과 일기 피드백이 같은 인스턴스를 써야 같은 프롬프트의 동시 요청이 하나의 호출로 합쳐진다.
+    """
+    global _openai_bot
+    if _openai_bot is None:
+        _openai_bot = OpenAIBot()
+    return _openai_bot
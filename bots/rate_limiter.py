@@ -0,0 +1,371 @@
+# bots/rate_limiter.py
+import asyncio
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from redis.exceptions import RedisError
+
+from chat.exceptions import RateLimitTimeout
+from configs.openai_setting import OpenAISettings
+from utils.cache_manager import CacheManager, get_cache_manager
+
+logger = logging.getLogger(__name__)
+
+# 대기 시간 히스토그램 구간 상한(초), 마지막 구간은 그 이상
+WAIT_BUCKETS_SECONDS = (0.01, 0.1, 0.5, 1, 2, 5, 10, 30)
+
+# KEYS[i]: 버킷 해시 키, ARGV[3i-2..3i]: 용량, 초당 충전량, 꺼낼 양
+# 모든 버킷에 충분한 양이 있을 때만 한꺼번에 꺼내고 0을, 아니면 부족한 버킷이 찰 때까지의 대기 시간(ms)을 반환
+_TOKEN_BUCKET_SCRIPT = """
+local time = redis.call('time')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local levels = {}
+local wait = 0
+for i = 1, #KEYS do
+    local capacity = tonumber(ARGV[i * 3 - 2])
+    local rate = tonumber(ARGV[i * 3 - 1]) / 1000
+    local amount = math.min(tonumber(ARGV[i * 3]), capacity)
+    local state = redis.call('hmget', KEYS[i], 'level', 'updated')
+    local level = tonumber(state[1]) or capacity
+    local updated = tonumber(state[2]) or now
+    level = math.min(capacity, level + math.max(0, now - updated) * rate)
+    levels[i] = level
+    if level < amount then
+        wait = math.max(wait, math.ceil((amount - level) / rate))
+    end
+end
+if wait > 0 then
+    return wait
+end
+for i = 1, #KEYS do
+    local capacity = tonumber(ARGV[i * 3 - 2])
+    local rate = tonumber(ARGV[i * 3 - 1]) / 1000
+    local amount = math.min(tonumber(ARGV[i * 3]), capacity)
+    redis.call('hset', KEYS[i], 'level', levels[i] - amount, 'updated', now)
+    redis.call('pexpire', KEYS[i], math.ceil(capacity / rate) + 1000)
+end
+return 0
+"""
+
+
+class TokenBucket:
+    """프로세스 내 토큰 버킷 (용량만큼 쌓이고 초당 refill_rate씩 충전)"""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.level = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.refill_rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount를 꺼낼 수 있을 때까지 남은 시간(초)"""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.refill_rate
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+
+class _ModelStats:
+    """모델별 대기열 지표"""
+
+    __slots__ = ("waiting", "max_waiting", "acquired", "timeouts", "wait_time", "wait_max", "wait_buckets", "tokens")
+
+    def __init__(self):
+        self.waiting = 0
+        self.max_waiting = 0
+        self.acquired = 0
+        self.timeouts = 0
+        self.wait_time = 0.0
+        self.wait_max = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_SECONDS) + 1)
+        self.tokens = 0
+
+    def to_dict(self) -> Dict:
+        buckets = {f"le_{bound}s": count for bound, count in zip(WAIT_BUCKETS_SECONDS, self.wait_buckets)}
+        buckets[f"gt_{WAIT_BUCKETS_SECONDS[-1]}s"] = self.wait_buckets[-1]
+        return {
+            "queue_depth": self.waiting,
+            "max_queue_depth": self.max_waiting,
+            "acquired": self.acquired,
+            "timeouts": self.timeouts,
+            "reserved_tokens": self.tokens,
+            "wait": {
+                "avg_ms": round(self.wait_time / self.acquired * 1000, 3) if self.acquired else 0.0,
+                "max_ms": round(self.wait_max * 1000, 3),
+                "histogram": buckets
+            }
+        }
+
+
+class OpenAIRateLimiter:
+    """
+    OpenAI 호출 속도/동시 실행 제한
+
+    모델별로 분당 요청 수(RPM)와 분당 토큰 수(TPM) 토큰 버킷을 두고, 사용자별 동시 실행 수를 제한한다.
+    한도를 넘은 요청은 바로 실패하지 않고 순서대로 기다리며, timeout 안에 차례가 오지 않으면
+    RateLimitTimeout을 발생시킨다. shared=True면 버킷을 Redis에 두어 여러 워커가 같은 한도를 나눠 쓴다
+    (Redis를 쓸 수 없으면 프로세스 내 버킷으로 대신한다).
+    """
+
+    def __init__(self, requests_per_minute: int = 500, tokens_per_minute: int = 40000,
+                 model_limits: Optional[Dict[str, Tuple[int, int]]] = None, user_concurrency: int = 2,
+                 timeout: float = 30.0, shared: bool = False, cache_manager: Optional[CacheManager] = None):
+        """
+        제한기 초기화
+
+        Args:
+            requests_per_minute: 기본 분당 요청 수
+            tokens_per_minute: 기본 분당 토큰 수
+            model_limits: 모델별 (RPM, TPM), 접두사가 가장 길게 일치하는 항목을 사용
+            user_concurrency: 사용자별 동시 OpenAI 호출 수 (0 이하면 제한 없음)
+            timeout: 기본 최대 대기 시간(초)
+            shared: Redis 공유 버킷 사용 여부
+            cache_manager: 공유 버킷에 쓸 캐시 매니저
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.model_limits = model_limits or {}
+        self.user_concurrency = user_concurrency
+        self.timeout = timeout
+        self.shared = shared
+        self.cache_manager = cache_manager
+
+        self._buckets: Dict[str, Tuple[TokenBucket, TokenBucket]] = {}
+        self._model_locks: Dict[str, asyncio.Lock] = {}
+        self._user_slots: Dict[int, list] = {}  # user_id -> [semaphore, 사용/대기 중인 요청 수]
+        self._users_waiting = 0
+        self._stats: Dict[str, _ModelStats] = {}
+
+    def limits(self, model: str) -> Tuple[int, int]:
+        """모델의 (RPM, TPM)"""
+        for prefix in sorted(self.model_limits, key=len, reverse=True):
+            if model.startswith(prefix):
+                rpm, tpm = self.model_limits[prefix]
+                return int(rpm), int(tpm)
+        return self.requests_per_minute, self.tokens_per_minute
+
+    def _model_stats(self, model: str) -> _ModelStats:
+        stats = self._stats.get(model)
+        if stats is None:
+            stats = self._stats[model] = _ModelStats()
+        return stats
+
+    @asynccontextmanager
+    async def acquire(self, model: str, tokens: int, user_id: Optional[int] = None,
+                      timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        OpenAI 호출 허가를 받을 때까지 대기 (블록을 벗어나면 사용자 동시 실행 슬롯 반환)
+
+        Args:
+            model: 호출할 모델
+            tokens: 예상 토큰 수 (프롬프트 + 최대 응답 토큰)
+            user_id: 사용자 ID (None이면 사용자별 제한 없음)
+            timeout: 최대 대기 시간(초), None이면 기본값
+
+        Raises:
+            RateLimitTimeout: 대기 시간 안에 허가를 받지 못한 경우
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        stats = self._model_stats(model)
+        started = time.monotonic()
+
+        stats.waiting += 1
+        stats.max_waiting = max(stats.max_waiting, stats.waiting)
+        slot = None
+        try:
+            slot = await self._acquire_user_slot(user_id, deadline)
+            await self._acquire_tokens(model, tokens, deadline)
+        except RateLimitTimeout:
+            stats.timeouts += 1
+            self._release_user_slot(user_id, slot)
+            raise
+        except BaseException:
+            self._release_user_slot(user_id, slot)
+            raise
+        finally:
+            stats.waiting -= 1
+
+        waited = time.monotonic() - started
+        stats.acquired += 1
+        stats.tokens += tokens
+        stats.wait_time += waited
+        stats.wait_max = max(stats.wait_max, waited)
+        stats.wait_buckets[_bucket_index(waited)] += 1
+        if waited >= 1:
+            logger.info(f"OpenAI rate limiter waited {waited:.2f}s (model={model}, user={user_id})")
+
+        try:
+            yield
+        finally:
+            self._release_user_slot(user_id, slot)
+
+    async def _acquire_user_slot(self, user_id: Optional[int], deadline: float) -> Optional[asyncio.Semaphore]:
+        if user_id is None or self.user_concurrency <= 0:
+            return None
+
+        slot = self._user_slots.get(user_id)
+        if slot is None:
+            slot = self._user_slots[user_id] = [asyncio.Semaphore(self.user_concurrency), 0]
+        slot[1] += 1
+        semaphore = slot[0]
+
+        self._users_waiting += 1
+        try:
+            await asyncio.wait_for(semaphore.acquire(), max(0.0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            self._forget_user(user_id)
+            raise RateLimitTimeout("동시 요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요.")
+        except BaseException:
+            self._forget_user(user_id)
+            raise
+        finally:
+            self._users_waiting -= 1
+        return semaphore
+
+    def _release_user_slot(self, user_id: Optional[int], semaphore: Optional[asyncio.Semaphore]) -> None:
+        if semaphore is None:
+            return
+        semaphore.release()
+        self._forget_user(user_id)
+
+    def _forget_user(self, user_id: int) -> None:
+        # 사용/대기 중인 요청이 없는 사용자의 세마포어는 정리
+        slot = self._user_slots.get(user_id)
+        if slot is None:
+            return
+        slot[1] -= 1
+        if slot[1] <= 0:
+            del self._user_slots[user_id]
+
+    async def _acquire_tokens(self, model: str, tokens: int, deadline: float) -> None:
+        """모델 버킷에서 요청 1개와 tokens개를 꺼냄 (같은 모델의 대기자는 도착 순서대로)"""
+        lock = self._model_locks.get(model)
+        if lock is None:
+            lock = self._model_locks[model] = asyncio.Lock()
+
+        try:
+            await asyncio.wait_for(lock.acquire(), max(0.0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            raise RateLimitTimeout("OpenAI 요청 한도에 도달했습니다. 잠시 후 다시 시도해주세요.")
+
+        try:
+            rpm, tpm = self.limits(model)
+            while True:
+                wait = await self._try_take(model, rpm, tpm, tokens)
+                if wait <= 0:
+                    return
+                if time.monotonic() + wait > deadline:
+                    raise RateLimitTimeout("OpenAI 요청 한도에 도달했습니다. 잠시 후 다시 시도해주세요.")
+                await asyncio.sleep(wait)
+        finally:
+            lock.release()
+
+    async def _try_take(self, model: str, rpm: int, tpm: int, tokens: int) -> float:
+        """버킷에서 꺼내기 시도, 꺼냈으면 0 아니면 기다릴 시간(초)"""
+        if self.shared and self.cache_manager is not None:
+            wait = await self._take_shared([
+                (f"ratelimit:openai:{model}:requests", rpm, rpm / 60, 1),
+                (f"ratelimit:openai:{model}:tokens", tpm, tpm / 60, tokens)
+            ])
+            if wait is not None:
+                return wait
+
+        buckets = self._buckets.get(model)
+        if buckets is None:
+            buckets = self._buckets[model] = (TokenBucket(rpm, rpm / 60), TokenBucket(tpm, tpm / 60))
+        requests_bucket, tokens_bucket = buckets
+
+        now = time.monotonic()
+        wait = max(requests_bucket.wait_time(1, now), tokens_bucket.wait_time(tokens, now))
+        if wait > 0:
+            return wait
+        requests_bucket.take(1)
+        tokens_bucket.take(tokens)
+        return 0.0
+
+    async def _take_shared(self, buckets: List[Tuple[str, float, float, float]]) -> Optional[float]:
+        """
+        여러 워커가 공유하는 Redis 토큰 버킷에서 꺼냄 (모든 버킷에서 한꺼번에, Redis 서버 시간 기준)
+
+        Args:
+            buckets: (버킷 키, 용량, 초당 충전량, 꺼낼 양) 목록
+
+        Returns:
+            꺼냈으면 0, 부족하면 다시 시도할 때까지 기다릴 시간(초), Redis를 쓸 수 없으면 None
+        """
+        client = self.cache_manager.async_client
+        if client is None:
+            return None
+
+        args = []
+        for _, capacity, refill_rate, amount in buckets:
+            args.extend((capacity, refill_rate, amount))
+        try:
+            wait_ms = await client.eval(
+                _TOKEN_BUCKET_SCRIPT, len(buckets), *(bucket[0] for bucket in buckets), *args
+            )
+            return int(wait_ms) / 1000
+        except RedisError as e:
+            logger.error(f"Shared token bucket error for keys {[bucket[0] for bucket in buckets]}: {str(e)}")
+            return None
+
+    def stats(self) -> Dict:
+        """
+        모델별 대기열 길이, 대기 시간, 시간 초과 수와 사용자별 동시 실행 현황
+
+        Returns:
+            제한기 통계
+        """
+        return {
+            "shared": self.shared,
+            "user_concurrency": self.user_concurrency,
+            "users_active": len(self._user_slots),
+            "users_waiting": self._users_waiting,
+            "models": {
+                model: {"limits": dict(zip(("rpm", "tpm"), self.limits(model))), **stats.to_dict()}
+                for model, stats in sorted(self._stats.items())
+            }
+        }
+
+
+def _bucket_index(seconds: float) -> int:
+    for index, bound in enumerate(WAIT_BUCKETS_SECONDS):
+        if seconds <= bound:
+            return index
+    return len(WAIT_BUCKETS_SECONDS)
+
+
+_rate_limiter: Optional[OpenAIRateLimiter] = None
+
+
+def get_rate_limiter() -> OpenAIRateLimiter:
+    """설정값으로 만든 공유 OpenAI 호출 제한기 반환"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        settings = OpenAISettings()
+        try:
+            model_limits = json.loads(settings.OPENAI_MODEL_LIMITS) if settings.OPENAI_MODEL_LIMITS else {}
+        except ValueError:
+            logger.error("OPENAI_MODEL_LIMITS는 {\"모델\": [RPM, TPM]} 형식의 JSON이어야 합니다. 기본 한도를 사용합니다.")
+            model_limits = {}
+        _rate_limiter = OpenAIRateLimiter(
+            requests_per_minute=settings.OPENAI_RPM,
+            tokens_per_minute=settings.OPENAI_TPM,
+            model_limits=model_limits,
+            user_concurrency=settings.OPENAI_USER_CONCURRENCY,
+            timeout=settings.OPENAI_QUEUE_TIMEOUT,
+            shared=settings.OPENAI_SHARED_RATE_LIMIT,
+            cache_manager=get_cache_manager() if settings.OPENAI_SHARED_RATE_LIMIT else None
+        )
+    return _rate_limiter
@@ -0,0 +1,260 @@
+# bots/sentence_deck.py
+import logging
+import random
+from typing import List, Dict, Optional
+
+from utils.mysql_connector import MySQLConnector
+
+logger = logging.getLogger(__name__)
+
+DECK_TABLE = "small_talk_deck"
+STATE_TABLE = "small_talk_deck_state"
+DECK_ID = 1
+
+
+class SentenceDeck:
+    """
+    사이클별로 미리 섞어둔 small_talk 발송 덱
+
+    사이클마다 talk_id의 무작위 순열을 small_talk_deck 테이블에 저장하고,
+    small_talk_deck_state의 위치 포인터만 전진시키며 문장을 꺼낸다.
+    발송 한 번은 (cycle_number, position) 기본 키 범위 조회 + 포인터 갱신이며,
+    덱을 다 쓰면 다음 사이클 덱을 새로 섞어 만든다 (small_talk 전체를 UPDATE하지 않음).
+    덱 생성 이후 추가된 문장은 남은 덱의 무작위 위치에 끼워 넣는다.
+
+    동시에 발송되더라도 상태 행을 FOR UPDATE로 잠그므로 같은 문장이 두 번 나가지 않는다.
+    트랜잭션 연결을 스레드 간에 공유하지 않도록 호출마다 커넥터를 새로 만든다.
+    """
+
+    def draw(self, count: int) -> List[int]:
+        """
+        덱에서 다음 count개의 talk_id를 꺼낸다
+
+        Returns:
+            List[int]: 발송할 talk_id 목록 (문장이 없으면 빈 리스트)
+        """
+        db = MySQLConnector()
+        db.begin_transaction()
+        try:
+            state = self._lock_state(db)
+            if state is None:
+                state = self._build_deck(db, cycle_number=1)
+                if state is None:
+                    db.commit_transaction()
+                    return []
+            else:
+                self._splice_new_sentences(db, state)
+
+            talk_ids = self._take(db, state, count)
+
+            # 현재 덱이 부족하면 다음 사이클 덱으로 넘어가서 나머지를 채움
+            if len(talk_ids) < count:
+                next_state = self._build_deck(db, state['cycle_number'] + 1, exclude=talk_ids)
+                if next_state is not None:
+                    state = next_state
+                    talk_ids += self._take(db, state, count - len(talk_ids), exclude=talk_ids)
+
+            self._save_state(db, state, sent=bool(talk_ids))
+            db.commit_transaction()
+
+            logger.info(
+                f"덱에서 {len(talk_ids)}개 문장 선택 (사이클: {state['cycle_number']}, "
+                f"위치: {state['position']}/{state['deck_size']})"
+            )
+            return talk_ids
+
+        except Exception:
+            db.rollback_transaction()
+            raise
+
+    def reset(self) -> bool:
+        """현재 덱을 버리고 다음 사이클 덱을 새로 섞는다"""
+        db = MySQLConnector()
+        db.begin_transaction()
+        try:
+            state = self._lock_state(db)
+            next_cycle = state['cycle_number'] + 1 if state else 1
+            new_state = self._build_deck(db, next_cycle)
+            if new_state is not None:
+                self._save_state(db, new_state)
+            db.commit_transaction()
+            return new_state is not None
+        except Exception:
+            db.rollback_transaction()
+            raise
+
+    def status(self) -> Optional[Dict]:
+        """현재 덱 상태 (덱이 아직 없으면 None)"""
+        result = MySQLConnector().execute_raw_query(
+            f"""
+            SELECT cycle_number, position, deck_size, max_talk_id, last_sent_at
+            FROM {STATE_TABLE}
+            WHERE deck_id = %(deck_id)s
+            """,
+            {'deck_id': DECK_ID}
+        )
+        if not result:
+            return None
+
+        state = result[0]
+        state['remaining'] = max(state['deck_size'] - state['position'], 0)
+        return state
+
+    def _lock_state(self, db: MySQLConnector) -> Optional[Dict]:
+        result = db.execute_raw_query(
+            f"""
+            SELECT cycle_number, position, deck_size, max_talk_id
+            FROM {STATE_TABLE}
+            WHERE deck_id = %(deck_id)s
+            FOR UPDATE
+            """,
+            {'deck_id': DECK_ID}
+        )
+        return result[0] if result else None
+
+    def _save_state(self, db: MySQLConnector, state: Dict, sent: bool = False) -> None:
+        """덱 상태 저장 (sent=True면 마지막 발송 시각도 갱신)"""
+        last_sent_at = "CURRENT_TIMESTAMP" if sent else "NULL"
+        db.execute_raw_query(
+            f"""
+            INSERT INTO {STATE_TABLE}
+                (deck_id, cycle_number, position, deck_size, max_talk_id, last_sent_at)
+            VALUES
+                (%(deck_id)s, %(cycle_number)s, %(position)s, %(deck_size)s, %(max_talk_id)s, {last_sent_at})
+            AS new
+            ON DUPLICATE KEY UPDATE
+                cycle_number = new.cycle_number,
+                position = new.position,
+                deck_size = new.deck_size,
+                max_talk_id = new.max_talk_id,
+                last_sent_at = COALESCE(new.last_sent_at, {STATE_TABLE}.last_sent_at)
+            """,
+            {
+                'deck_id': DECK_ID,
+                'cycle_number': state['cycle_number'],
+                'position': state['position'],
+                'deck_size': state['deck_size'],
+                'max_talk_id': state['max_talk_id']
+            }
+        )
+
+    def _build_deck(self,
+                    db: MySQLConnector,
+                    cycle_number: int,
+                    exclude: Optional[List[int]] = None) -> Optional[Dict]:
+        """
+        새 사이클 덱 생성
+
+        exclude에 있는 talk_id(같은 발송에서 이미 뽑힌 문장)는 덱의 맨 뒤로 보낸다.
+        """
+        talk_ids = [
+            row[0] for row in
+            db.stream_query("SELECT talk_id FROM small_talk", as_tuples=True)
+        ]
+        if not talk_ids:
+            logger.warning("small_talk 테이블에 문장이 없어 덱을 만들 수 없습니다.")
+            return None
+
+        excluded = set(exclude or [])
+        head = [talk_id for talk_id in talk_ids if talk_id not in excluded]
+        tail = [talk_id for talk_id in talk_ids if talk_id in excluded]
+        random.shuffle(head)
+        random.shuffle(tail)
+        deck = head + tail
+
+        db.execute_raw_query(f"DELETE FROM {DECK_TABLE} WHERE cycle_number <> %(cycle_number)s",
+                             {'cycle_number': cycle_number})
+        db.insert(DECK_TABLE, [
+            {'cycle_number': cycle_number, 'position': position, 'talk_id': talk_id}
+            for position, talk_id in enumerate(deck)
+        ])
+
+        logger.info(f"새 덱 생성: 사이클 {cycle_number}, {len(deck)}개 문장")
+        return {
+            'cycle_number': cycle_number,
+            'position': 0,
+            'deck_size': len(deck),
+            'max_talk_id': max(talk_ids)
+        }
+
+    def _splice_new_sentences(self, db: MySQLConnector, state: Dict) -> None:
+        """덱 생성 이후 추가된 문장을 남은 덱의 무작위 위치에 삽입"""
+        new_rows = db.execute_raw_query(
+            "SELECT talk_id FROM small_talk WHERE talk_id > %(max_talk_id)s ORDER BY talk_id",
+            {'max_talk_id': state['max_talk_id']}
+        )
+        if not new_rows:
+            return
+
+        appended = []
+        for row in new_rows:
+            new_id = row['talk_id']
+            end = state['deck_size']
+            slot = random.randint(state['position'], end)
+
+            if slot == end:
+                appended.append({'cycle_number': state['cycle_number'], 'position': end, 'talk_id': new_id})
+            else:
+                # slot의 문장을 덱 끝으로 옮기고 그 자리에 새 문장을 넣는다
+                displaced = self._talk_at(db, state['cycle_number'], slot, appended)
+                self._put(db, state['cycle_number'], slot, new_id, appended)
+                appended.append({'cycle_number': state['cycle_number'], 'position': end, 'talk_id': displaced})
+
+            state['deck_size'] += 1
+            state['max_talk_id'] = max(state['max_talk_id'], new_id)
+
+        if appended:
+            db.insert(DECK_TABLE, appended)
+        logger.info(f"새 문장 {len(new_rows)}개를 사이클 {state['cycle_number']} 덱에 추가")
+
+    def _talk_at(self, db: MySQLConnector, cycle_number: int, position: int, pending: List[Dict]) -> int:
+        for row in pending:
+            if row['position'] == position:
+                return row['talk_id']
+        result = db.execute_raw_query(
+            f"SELECT talk_id FROM {DECK_TABLE} WHERE cycle_number = %(cycle_number)s AND position = %(position)s",
+            {'cycle_number': cycle_number, 'position': position}
+        )
+        return result[0]['talk_id']
+
+    def _put(self, db: MySQLConnector, cycle_number: int, position: int, talk_id: int,
+             pending: List[Dict]) -> None:
+        for row in pending:
+            if row['position'] == position:
+                row['talk_id'] = talk_id
+                return
+        db.update(DECK_TABLE, {'talk_id': talk_id},
+                  {'cycle_number': cycle_number, 'position': position})
+
+    def _take(self, db: MySQLConnector, state: Dict, count: int,
+              exclude: Optional[List[int]] = None) -> List[int]:
+        """현재 위치부터 count개를 꺼내고 포인터 전진 (삭제된 문장은 건너뜀)"""
+        if count <= 0:
+            return []
+
+        excluded = set(exclude or [])
+        rows = db.execute_raw_query(
+            f"""
+            SELECT d.position, d.talk_id
+            FROM {DECK_TABLE} d
+            JOIN small_talk st ON st.talk_id = d.talk_id
+            WHERE d.cycle_number = %(cycle_number)s
+            AND d.position >= %(position)s
+            ORDER BY d.position
+            LIMIT %(limit)s
+            """,
+            {'cycle_number': state['cycle_number'], 'position': state['position'], 'limit': count + len(excluded)}
+        )
+
+        talk_ids = []
+        for row in rows:
+            if len(talk_ids) >= count:
+                break
+            state['position'] = row['position'] + 1
+            if row['talk_id'] not in excluded:
+                talk_ids.append(row['talk_id'])
+
+        if len(talk_ids) < count:
+            # 덱 소진
+            state['position'] = state['deck_size']
+        return talk_ids
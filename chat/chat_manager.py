@@ -1,26 +1,29 @@
 # chat/chat_manager.py
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from chat.constants import CACHE_KEYS, DB_TABLES, CACHE_TTL, MAX_HISTORY_PER_CONV, MAX_CONVERSATIONS
+from chat.constants import (
+    CACHE_KEYS, CACHE_TAGS, DB_TABLES, CACHE_TTL, MAX_HISTORY_PER_CONV, MAX_CONVERSATIONS,
+    LAST_MESSAGE_PREVIEW_LENGTH
+)
 from chat.exceptions import (
     ChatBaseException,
     DatabaseError,
     ConversationNotFound
 )
-from utils.cache_manager import CacheManager
-from utils.mysql_connector import MySQLConnector
+from utils.cache_manager import CacheManager, get_cache_manager
+from utils.async_mysql_connector import AsyncMySQLConnector
 
 logger = logging.getLogger(__name__)
 
 
 class ChatManager:
-    def __init__(self):
-        self.db = MySQLConnector()
-        self.cache = CacheManager()
+    def __init__(self, cache: Optional[CacheManager] = None):
+        self.db = AsyncMySQLConnector()
+        self.cache = cache or get_cache_manager()
 
-    def get_user_conversations(self, user_id: int) -> List[Dict]:
+    async def get_user_conversations(self, user_id: int) -> List[Dict]:
         """사용자의 대화 목록 조회"""
         if not user_id:
             logger.error("User ID is required")
@@ -29,70 +32,57 @@ class ChatManager:
         try:
             logger.debug(f"Attempting to get conversations for user: {user_id}")
 
-            # 캐시 확인
+            # 캐시 확인 (동시 미스는 한 번만 조회, 만료 전 조기 재계산)
             cache_key = CACHE_KEYS["user_conversations"].format(user_id=user_id)
-            cached_data = self.cache.get(cache_key)
-            if cached_data:
-                logger.debug(f"Returning cached conversations for user: {user_id}")
-                return cached_data
-
-            # 기본 쿼리 - 최신 대화 목록만 조회
-            base_query = f"""
-                SELECT 
-                    cs.conversation_id,
-                    cs.title,
-                    cs.status,
-                    cs.message_count,
-                    cs.create_at,
-                    cs.last_message_at,
-                    COALESCE(ch.user_message, '') as last_message,
-                    COALESCE(ch.bot_response, '') as last_response
-                FROM {DB_TABLES['conversation']} cs
-                LEFT JOIN (
-                    SELECT 
-                        conversation_id,
-                        user_message,
-                        bot_response,
-                        create_at,
-                        ROW_NUMBER() OVER (PARTITION BY conversation_id ORDER BY create_at DESC) as rn
-                    FROM {DB_TABLES['chat_history']}
-                ) ch ON cs.conversation_id = ch.conversation_id AND ch.rn = 1
-                WHERE cs.user_id = %(user_id)s
-                AND cs.status != 'deleted'
-                ORDER BY cs.last_message_at DESC
-                LIMIT {MAX_CONVERSATIONS}
-            """
-
-            logger.debug(f"Executing query for user: {user_id}")
-            conversations = self.db.execute_raw_query(base_query, {"user_id": user_id})
-
-            if not conversations:
-                logger.info(f"No conversations found for user: {user_id}")
-                return []
-
-            # datetime 객체 처리
-            for conv in conversations:
-                if isinstance(conv['create_at'], datetime):
-                    conv['create_at'] = conv['create_at'].replace(tzinfo=None)
-                if isinstance(conv['last_message_at'], datetime):
-                    conv['last_message_at'] = conv['last_message_at'].replace(tzinfo=None)
-
-            logger.info(f"Found {len(conversations)} conversations for user: {user_id}")
-
-            # 캐시 저장
-            self.cache.set(
+            return await self.cache.aget_or_compute(
                 cache_key,
-                conversations,
-                ttl=CACHE_TTL["user_conversations"]
+                lambda: self._load_user_conversations(user_id),
+                ttl=CACHE_TTL["user_conversations"],
+                tags=[CACHE_TAGS["user"].format(user_id=user_id)]
             )
 
-            return conversations
-
         except Exception as e:
             error_msg = f"Error getting conversations for user {user_id}: {str(e)}"
             logger.error(error_msg, exc_info=True)
             raise DatabaseError(error_msg)
 
+    async def _load_user_conversations(self, user_id: int) -> List[Dict]:
+        """사용자의 대화 목록 DB 조회"""
+        # 최신 대화 목록 - 마지막 메시지는 저장 시 갱신되는 컬럼을 사용 ((user_id, status, last_message_at) 인덱스 범위 조회)
+        base_query = f"""
+            SELECT
+                conversation_id,
+                title,
+                status,
+                message_count,
+                create_at,
+                last_message_at,
+                last_user_message as last_message,
+                last_bot_response as last_response
+            FROM {DB_TABLES['conversation']}
+            WHERE user_id = %(user_id)s
+            AND status IN ('active', 'archived')
+            ORDER BY last_message_at DESC
+            LIMIT {MAX_CONVERSATIONS}
+        """
+
+        logger.debug(f"Executing query for user: {user_id}")
+        conversations = await self.db.fetch_all(base_query, {"user_id": user_id})
+
+        if not conversations:
+            logger.info(f"No conversations found for user: {user_id}")
+            return []
+
+        # datetime 객체 처리
+        for conv in conversations:
+            if isinstance(conv['create_at'], datetime):
+                conv['create_at'] = conv['create_at'].replace(tzinfo=None)
+            if isinstance(conv['last_message_at'], datetime):
+                conv['last_message_at'] = conv['last_message_at'].replace(tzinfo=None)
+
+        logger.info(f"Found {len(conversations)} conversations for user: {user_id}")
+        return conversations
+
     async def get_conversation_info(self, conversation_id: str) -> Optional[Dict]:
         """대화 세션 정보 조회"""
         if not conversation_id:
@@ -101,7 +91,7 @@ class ChatManager:
         try:
             # 캐시 확인
             cache_key = CACHE_KEYS["conversation_info"].format(conversation_id=conversation_id)
-            cached_data = self.cache.get(cache_key)
+            cached_data = await self.cache.aget(cache_key)
             if cached_data:
                 logger.debug(f"Cache hit for conversation: {conversation_id}")
                 return cached_data
@@ -119,19 +109,18 @@ class ChatManager:
                 FROM {DB_TABLES['conversation']}                WHERE conversation_id = %(conversation_id)s
                 AND status != 'deleted'
             """
-            result = self.db.execute_raw_query(query, {"conversation_id": conversation_id})
+            conversation = await self.db.fetch_one(query, {"conversation_id": conversation_id})
 
-            if not result:
+            if not conversation:
                 logger.warning(f"Conversation not found: {conversation_id}")
                 raise ConversationNotFound(f"대화를 찾을 수 없습니다: {conversation_id}")
 
-            conversation = result[0]
-
             # 캐시 저장
-            self.cache.set(
+            await self.cache.aset(
                 cache_key,
                 conversation,
-                ttl=CACHE_TTL["conversation_info"]
+                ttl=CACHE_TTL["conversation_info"],
+                tags=[CACHE_TAGS["user"].format(user_id=conversation['user_id'])]
             )
             return conversation
 
@@ -141,67 +130,89 @@ class ChatManager:
             logger.error(f"대화 세션 조회 오류: {str(e)}")
             raise DatabaseError(f"대화 세션 조회 중 오류 발생: {str(e)}")
 
-    def create_conversation(self, user_id: int) -> Dict:
-        """새 대화 세션 생성"""
-        if not user_id:
-            raise ChatBaseException("User ID is required")
-
+    async def _insert_conversation(self, db: AsyncMySQLConnector, user_id: int, title: str,
+                                   current_time: datetime, message_count: int = 0,
+                                   last_user_message: str = '', last_bot_response: str = '',
+                                   conversation_id: Optional[str] = None) -> Dict:
+        """
+        대화 세션 INSERT (트랜잭션 안에서 호출)
+
+        사용자의 대화 행을 FOR UPDATE로 잠그고 개수 확인과 새 ID(UUID_SHORT) 발급을 한 번에 조회하므로,
+        동시에 생성해도 MAX_CONVERSATIONS를 넘지 않고 INSERT 후 ID를 다시 조회할 필요가 없다.
+        conversation_id를 주면(reserve_conversation_id로 미리 받은 ID) 새로 발급하지 않고 그 ID로 만든다.
+        """
+        check_query = f"""
+            SELECT COUNT(*) AS count, UUID_SHORT() AS conversation_id
+            FROM {DB_TABLES['conversation']}
+            WHERE user_id = %(user_id)s
+            AND status IN ('active', 'archived')
+            FOR UPDATE
+        """
+        check_result = await db.fetch_one(check_query, {"user_id": user_id})
+        if check_result['count'] >= MAX_CONVERSATIONS:
+            raise ChatBaseException("Maximum number of conversations reached")
+
+        conversation = {
+            "conversation_id": conversation_id or str(check_result['conversation_id']),
+            "user_id": user_id,
+            "title": title,
+            "status": "active",
+            "message_count": message_count,
+            "create_at": current_time,
+            "last_message_at": current_time,
+            "last_user_message": last_user_message[:LAST_MESSAGE_PREVIEW_LENGTH],
+            "last_bot_response": last_bot_response[:LAST_MESSAGE_PREVIEW_LENGTH]
+        }
+        insert_query = f"""
+            INSERT INTO {DB_TABLES['conversation']}
+            (conversation_id, user_id, title, status, message_count, create_at, last_message_at,
+             last_user_message, last_bot_response)
+            VALUES (%(conversation_id)s, %(user_id)s, %(title)s, %(status)s, %(message_count)s,
+                    %(create_at)s, %(last_message_at)s, %(last_user_message)s, %(last_bot_response)s)
+        """
+        await db.execute(insert_query, conversation)
+        return conversation
+
+    async def reserve_conversation_id(self) -> str:
+        """
+        새 대화 ID만 미리 발급 (행은 만들지 않음)
+
+        스트리밍 응답 헤더로 ID를 먼저 보내야 하는 경우에 쓰고, 대화 행은 응답이 끝난 뒤
+        save_message(new_conversation_id=...)로 첫 메시지와 같은 트랜잭션에서 만든다.
+        """
         try:
-            # 기존 대화 세션 수 확인
-            count_query = f"""
-                SELECT COUNT(*) as count
-                FROM {DB_TABLES['conversation']}            WHERE user_id = %(user_id)s
-                AND status != 'deleted'
-            """
-            count_result = self.db.execute_raw_query(count_query, {"user_id": user_id})
-            if count_result and count_result[0]['count'] >= MAX_CONVERSATIONS:
-                raise ChatBaseException("Maximum number of conversations reached")
-
-            # 현재 시간 설정
-            current_time = datetime.utcnow()
-
-            # 새 대화 세션 생성 쿼리 - uuid_short() 사용
-            insert_query = f"""
-                INSERT INTO {DB_TABLES['conversation']} 
-                (user_id, title, status, message_count, create_at, last_message_at)
-                VALUES (%(user_id)s, %(title)s, %(status)s, %(message_count)s, %(create_at)s, %(last_message_at)s)
-            """
-
-            # 데이터 준비
-            conv_data = {
-                "user_id": user_id,
-                "title": "New Conversation",
-                "status": "active",
-                "message_count": 0,
-                "create_at": current_time,
-                "last_message_at": current_time
-            }
+            result = await self.db.fetch_one("SELECT UUID_SHORT() AS conversation_id")
+            return str(result['conversation_id'])
+        except Exception as e:
+            logger.error(f"대화 ID 발급 오류: {str(e)}")
+            raise DatabaseError(f"대화 ID 발급 중 오류 발생: {str(e)}")
 
-            # INSERT 실행
-            self.db.execute_raw_query(insert_query, conv_data)
+    async def check_conversation_limit(self, user_id: int) -> None:
+        """
+        새 대화를 만들 수 있는지 미리 확인 (캐시된 대화 목록 기준)
 
-            # 방금 생성된 conversation 조회
-            select_query = f"""
-                SELECT *
-                FROM {DB_TABLES['conversation']}            WHERE user_id = %(user_id)s
-                AND create_at = %(create_at)s
-                LIMIT 1
-            """
-            select_params = {
-                "user_id": user_id,
-                "create_at": current_time
-            }
+        생성 시에도 _insert_conversation이 잠금을 걸고 다시 확인하므로, OpenAI 호출처럼 비용이 드는 작업 전에
+        한도에 걸릴 요청을 먼저 거르는 용도다.
 
-            result = self.db.execute_raw_query(select_query, select_params)
+        Raises:
+            ChatBaseException: 최대 대화 개수에 도달한 경우
+        """
+        conversations = await self.get_user_conversations(user_id)
+        if len(conversations) >= MAX_CONVERSATIONS:
+            raise ChatBaseException("Maximum number of conversations reached")
 
-            if not result:
-                raise DatabaseError("Failed to get created conversation")
+    async def create_conversation(self, user_id: int, title: str = "New Conversation") -> Dict:
+        """새 대화 세션 생성"""
+        if not user_id:
+            raise ChatBaseException("User ID is required")
 
-            conversation = result[0]
+        try:
+            async with self.db.transaction() as tx:
+                conversation = await self._insert_conversation(tx, user_id, title, datetime.utcnow())
             conv_id = conversation['conversation_id']
 
             # 캐시 무효화
-            self.invalidate_conversation_cache(conv_id, user_id)
+            await self.invalidate_conversation_cache(conv_id, user_id)
 
             logger.info(f"Created new conversation: {conv_id} for user: {user_id}")
 
@@ -220,121 +231,215 @@ class ChatManager:
                 raise
             raise DatabaseError(f"대화 생성 중 오류 발생: {str(e)}")
 
-    def get_chat_history(self, conversation_id: str) -> List[Dict]:
-        """대화 내역 조회"""
+    async def get_chat_history(self, conversation_id: str, before: Optional[int] = None,
+                               after: Optional[int] = None, limit: Optional[int] = None) -> List[Dict]:
+        """
+        대화 내역 조회 (오래된 순)
+
+        커서가 없으면 최근 limit개, before를 주면 그 chat_history_id 이전 limit개,
+        after를 주면 그 이후 limit개(증분 동기화용)를 반환한다.
+        최근 MAX_HISTORY_PER_CONV개는 저장 시 덧붙는 Redis 리스트에서 읽고,
+        그보다 오래된 페이지는 새 메시지가 와도 바뀌지 않으므로 페이지 단위로 캐시한다.
+        """
         if not conversation_id:
             raise ChatBaseException("Conversation ID is required")
+        if before is not None and after is not None:
+            raise ChatBaseException("before and after cannot be used together")
+
+        limit = min(limit or MAX_HISTORY_PER_CONV, MAX_HISTORY_PER_CONV)
 
         try:
-            cache_key = CACHE_KEYS["conversation_history"].format(conversation_id=conversation_id)
-            cached_data = self.cache.get(cache_key)
-            if cached_data:
-                return cached_data
+            recent = await self._get_recent_history(conversation_id)
+            # 리스트가 가득 차지 않았으면 대화 전체가 들어 있음
+            complete = len(recent) < MAX_HISTORY_PER_CONV
 
-            query = f"""
-                SELECT 
-                    chat_history_id, 
-                    conversation_id, 
-                    user_id, 
-                    user_message, 
-                    bot_response, 
-                    create_at
-                FROM {DB_TABLES['chat_history']}
-                WHERE conversation_id = %(conversation_id)s
-                ORDER BY create_at ASC
-                LIMIT {MAX_HISTORY_PER_CONV}
-            """
-            history = self.db.execute_raw_query(query, {"conversation_id": conversation_id})
-            if history:
-                self.cache.set(
-                    cache_key,
-                    history,
-                    ttl=CACHE_TTL["conversation_history"]
-                )
-                logger.info(f"Retrieved {len(history)} messages for conversation: {conversation_id}")
-            return history or []
+            if before is None and after is None:
+                return recent[-limit:]
+
+            if after is not None:
+                # 리스트가 after 이후 메시지를 모두 담고 있으면 캐시만으로 응답 (폴링은 대부분 여기서 끝남)
+                if complete or recent[0]['chat_history_id'] <= after:
+                    return [message for message in recent if message['chat_history_id'] > after][:limit]
+            else:
+                older = [message for message in recent if message['chat_history_id'] < before]
+                if complete or len(older) >= limit:
+                    return older[-limit:]
 
+            return await self._get_history_page(conversation_id, before, after, limit)
+
+        except ChatBaseException:
+            raise
         except Exception as e:
             logger.error(f"대화 내역 조회 오류: {str(e)}")
             raise DatabaseError(f"대화 내역 조회 중 오류 발생: {str(e)}")
 
+    async def _get_recent_history(self, conversation_id: str) -> List[Dict]:
+        """최근 MAX_HISTORY_PER_CONV개 메시지 (캐시 리스트, 없으면 DB에서 읽어 채움)"""
+        cache_key = CACHE_KEYS["conversation_history"].format(conversation_id=conversation_id)
+        cached_data = await self.cache.alist_range(cache_key)
+        if cached_data is not None:
+            return cached_data
+
+        # 조회 도중 저장된 메시지가 있으면 오래된 결과로 리스트를 채우지 않도록 버전을 먼저 읽어 둔다
+        version = await self.cache.alist_version(cache_key)
+        query = f"""
+            SELECT
+                chat_history_id,
+                conversation_id,
+                user_id,
+                user_message,
+                bot_response,
+                create_at,
+                pending_id
+            FROM {DB_TABLES['chat_history']}
+            WHERE conversation_id = %(conversation_id)s
+            ORDER BY chat_history_id DESC
+            LIMIT {MAX_HISTORY_PER_CONV}
+        """
+        history = await self.db.fetch_all(query, {"conversation_id": conversation_id}) or []
+        history.reverse()
+        if history:
+            await self.cache.alist_fill(
+                cache_key,
+                history,
+                max_len=MAX_HISTORY_PER_CONV,
+                version=version,
+                ttl=CACHE_TTL["conversation_history"]
+            )
+            logger.info(f"Retrieved {len(history)} messages for conversation: {conversation_id}")
+        return history
+
+    async def _get_history_page(self, conversation_id: str, before: Optional[int],
+                                after: Optional[int], limit: int) -> List[Dict]:
+        """최근 리스트 밖의 페이지 조회 ((conversation_id, chat_history_id) 인덱스 범위 조회)"""
+        if before is not None:
+            direction, cursor, condition, order = "before", before, "<", "DESC"
+        else:
+            direction, cursor, condition, order = "after", after, ">", "ASC"
+
+        page_key = CACHE_KEYS["conversation_history_page"].format(
+            conversation_id=conversation_id, direction=direction, cursor=cursor, limit=limit
+        )
+        cached_page = await self.cache.aget(page_key)
+        if cached_page is not None:
+            return cached_page
+
+        query = f"""
+            SELECT
+                chat_history_id,
+                conversation_id,
+                user_id,
+                user_message,
+                bot_response,
+                create_at
+            FROM {DB_TABLES['chat_history']}
+            WHERE conversation_id = %(conversation_id)s
+            AND chat_history_id {condition} %(cursor)s
+            ORDER BY chat_history_id {order}
+            LIMIT %(limit)s
+        """
+        page = await self.db.fetch_all(query, {
+            "conversation_id": conversation_id,
+            "cursor": cursor,
+            "limit": limit
+        }) or []
+        if before is not None:
+            page.reverse()
+
+        # before 페이지와 가득 찬 after 페이지는 이후 메시지가 추가되어도 바뀌지 않음
+        if before is not None or len(page) == limit:
+            await self.cache.aset(
+                page_key,
+                page,
+                ttl=CACHE_TTL["conversation_history"],
+                tags=[CACHE_TAGS["conversation"].format(conversation_id=conversation_id)]
+            )
+        return page
+
+    async def add_pending_message(self, message: Dict) -> None:
+        """
+        write-behind 큐에 넣은 턴을 저장 전까지 대화 맥락에서 볼 수 있도록 Redis에 기록
+
+        Args:
+            message: pending_id, conversation_id, user_message, bot_response, create_at을 담은 메시지
+        """
+        await self.cache.ahash_set(
+            CACHE_KEYS["conversation_pending"].format(conversation_id=message["conversation_id"]),
+            {message["pending_id"]: {
+                "pending_id": message["pending_id"],
+                "user_message": message["user_message"],
+                "bot_response": message["bot_response"],
+                "create_at": message["create_at"]
+            }},
+            ttl=CACHE_TTL["conversation_pending"]
+        )
+
+    async def get_pending_messages(self, conversation_id: str) -> List[Dict]:
+        """
+        아직 DB에 저장되지 않은 턴 (오래된 순, chat_history_id는 None)
+
+        Returns:
+            get_chat_history와 같은 형식의 메시지 목록 (pending_id 포함)
+        """
+        pending = await self.cache.ahash_values(
+            CACHE_KEYS["conversation_pending"].format(conversation_id=conversation_id)
+        )
+        messages = [{"chat_history_id": None, "conversation_id": conversation_id, **item} for item in pending.values()]
+        messages.sort(key=lambda message: str(message["create_at"]))
+        return messages
+
     async def save_message(self, user_id: int, user_message: str, bot_response: str,
-                           conversation_id: Optional[str] = None) -> Dict:
-        """대화 메시지 저장"""
+                           conversation_id: Optional[str] = None,
+                           new_conversation_id: Optional[str] = None) -> Dict:
+        """
+        대화 메시지 저장
+
+        conversation_id가 없으면 새 대화를 첫 메시지와 같은 트랜잭션에서 만든다
+        (new_conversation_id를 주면 reserve_conversation_id로 미리 받은 그 ID로 만든다).
+        """
         if not user_id:
             raise ChatBaseException("User ID is required")
         if not user_message:
             raise ChatBaseException("User message is required")
 
         try:
-            # 새 대화 생성이 필요한 경우
-            current_conversation_id = conversation_id
-            if not current_conversation_id:
-                # 대화 생성 쿼리
-                insert_query = f"""
-                    INSERT INTO {DB_TABLES['conversation']} 
-                    (user_id, title, status, message_count, create_at, last_message_at)
-                    VALUES (%(user_id)s, %(title)s, %(status)s, %(message_count)s, %(create_at)s, %(last_message_at)s)
-                """
-                current_time = datetime.utcnow()
-                conv_data = {
+            async with self.db.transaction() as tx:
+                # 새 대화는 첫 메시지와 같은 트랜잭션/연결에서 생성 (메시지 수 1로 시작)
+                current_conversation_id = conversation_id
+                if not current_conversation_id:
+                    conversation = await self._insert_conversation(
+                        tx, user_id, user_message[:50], datetime.utcnow(), message_count=1,  # 제목은 메시지 앞부분으로
+                        last_user_message=user_message, last_bot_response=bot_response,
+                        conversation_id=new_conversation_id
+                    )
+                    current_conversation_id = conversation['conversation_id']
+
+                # 메시지 저장
+                chat_data = {
+                    "conversation_id": current_conversation_id,
                     "user_id": user_id,
-                    "title": user_message[:50],  # 제목은 메시지 앞부분으로
-                    "status": "active",
-                    "message_count": 1,
-                    "create_at": current_time,
-                    "last_message_at": current_time
+                    "user_message": user_message,
+                    "bot_response": bot_response,
+                    "create_at": datetime.utcnow()
                 }
-
-                # INSERT 실행
-                self.db.execute_raw_query(insert_query, conv_data)
-
-                # 방금 생성된 conversation 조회
-                select_query = f"""
-                    SELECT conversation_id
-                    FROM {DB_TABLES['conversation']}                    WHERE user_id = %(user_id)s
-                    ORDER BY create_at DESC
-                    LIMIT 1
-                """
-                result = self.db.execute_raw_query(select_query, {"user_id": user_id})
-
-                if not result:
-                    raise DatabaseError("Failed to get conversation ID")
-
-                current_conversation_id = result[0]['conversation_id']
-
-            # 메시지 저장
-            chat_data = {
-                "conversation_id": current_conversation_id,
-                "user_id": user_id,
-                "user_message": user_message,
-                "bot_response": bot_response,
-                "create_at": datetime.utcnow()
-            }
-
-            insert_query = f"""
-                INSERT INTO {DB_TABLES['chat_history']}                (conversation_id, user_id, user_message, bot_response, create_at)
-                VALUES (%(conversation_id)s, %(user_id)s, %(user_message)s, %(bot_response)s, %(create_at)s)
-            """
-
-            self.db.execute_raw_query(insert_query, chat_data)
-
-            # 대화 세션 업데이트
-            update_query = f"""
-                UPDATE {DB_TABLES['conversation']}                SET message_count = message_count + 1,
-                    last_message_at = %(last_message_at)s
-                WHERE conversation_id = %(conversation_id)s
-            """
-
-            update_data = {
-                "conversation_id": current_conversation_id,
-                "last_message_at": datetime.utcnow()
-            }
-
-            self.db.execute_raw_query(update_query, update_data)
-
-            # 캐시 무효화
-            self.invalidate_conversation_cache(current_conversation_id, user_id)
+                insert_result = await self._save_message_to_db(chat_data, db=tx)
+
+                # 대화 세션 업데이트
+                if conversation_id:
+                    await self._update_conversation_status(current_conversation_id, chat_data, db=tx)
+
+            # 대화 기록 캐시는 무효화하지 않고 새 메시지를 덧붙임 (리스트가 없으면 다음 조회 때 DB에서 채움)
+            await self.cache.alist_append(
+                CACHE_KEYS["conversation_history"].format(conversation_id=current_conversation_id),
+                [{"chat_history_id": insert_result['id'], **chat_data}],
+                max_len=MAX_HISTORY_PER_CONV,
+                ttl=CACHE_TTL["conversation_history"],
+                only_if_exists=True
+            )
+            await self.cache.adelete_many([
+                CACHE_KEYS["conversation_info"].format(conversation_id=current_conversation_id),
+                CACHE_KEYS["user_conversations"].format(user_id=user_id)
+            ])
 
             return {
                 "conversation_id": current_conversation_id,
@@ -347,10 +452,158 @@ class ChatManager:
                 raise
             raise DatabaseError(f"Failed to save message: {str(e)}")
 
-    async def _save_message_to_db(self, chat_data: Dict) -> Dict:
+    async def save_messages(self, messages: List[Dict]) -> List[int]:
+        """
+        여러 메시지를 한 트랜잭션으로 저장 (write-behind 큐의 일괄 저장용)
+
+        chat_history는 다중 행 INSERT 한 번, 대화 세션의 메시지 수/마지막 시각은
+        대화별 CASE 식을 쓴 UPDATE 한 번으로 반영한다.
+        spill 파일 재처리처럼 같은 묶음이 다시 들어와도 pending_id(고유 키)로 이미 저장된 턴은
+        건너뛰므로 메시지가 중복 저장되거나 메시지 수가 두 번 늘지 않는다.
+
+        Args:
+            messages: conversation_id, user_id, user_message, bot_response, create_at
+                      (write-behind로 들어온 경우 pending_id)을 담은 메시지 목록
+
+        Returns:
+            저장된 chat_history_id 목록 (messages와 같은 순서, 이미 저장되어 있던 턴은 기존 ID)
+        """
+        if not messages:
+            return []
+
+        pending_ids = list(dict.fromkeys(message["pending_id"] for message in messages if message.get("pending_id")))
+
+        try:
+            async with self.db.transaction() as tx:
+                # 이미 저장된 턴 조회 (고유 키 범위를 잠가 같은 턴을 동시에 재처리해도 한 번만 들어감)
+                saved: Dict[str, int] = {}
+                if pending_ids:
+                    placeholders = ', '.join(['%s'] * len(pending_ids))
+                    existing = await tx.fetch_all(
+                        f"""
+                        SELECT pending_id, chat_history_id
+                        FROM {DB_TABLES['chat_history']}
+                        WHERE pending_id IN ({placeholders})
+                        FOR UPDATE
+                        """,
+                        pending_ids
+                    )
+                    saved = {row['pending_id']: row['chat_history_id'] for row in existing or []}
+
+                new_positions = []
+                for index, message in enumerate(messages):
+                    pending_id = message.get("pending_id")
+                    if pending_id:
+                        if pending_id in saved:
+                            continue
+                        saved[pending_id] = None  # 같은 묶음 안의 중복도 한 번만 저장
+                    new_positions.append(index)
+
+                rows = [
+                    {
+                        "conversation_id": message["conversation_id"],
+                        "user_id": message["user_id"],
+                        "user_message": message["user_message"],
+                        "bot_response": message["bot_response"],
+                        "create_at": message["create_at"],
+                        "pending_id": message.get("pending_id")
+                    }
+                    for message in (messages[index] for index in new_positions)
+                ]
+                inserted_ids = []
+                if rows:
+                    insert_result = await tx.insert(DB_TABLES['chat_history'], rows)
+                    inserted_ids = insert_result['ids']
+                    update_query, params = self._build_counter_update(rows)
+                    await tx.execute(update_query, params)
+        except Exception as e:
+            logger.error(f"메시지 일괄 저장 오류: {str(e)}")
+            raise DatabaseError(f"Failed to save messages: {str(e)}")
+
+        if len(new_positions) < len(messages):
+            logger.info(f"Skipped {len(messages) - len(new_positions)} chat messages already saved")
+
+        ids: List[Optional[int]] = [None] * len(messages)
+        for index, chat_history_id in zip(new_positions, inserted_ids):
+            ids[index] = chat_history_id
+            if messages[index].get("pending_id"):
+                saved[messages[index]["pending_id"]] = chat_history_id
+        for index, message in enumerate(messages):
+            if ids[index] is None:
+                ids[index] = saved.get(message.get("pending_id"))
+
+        # 대화 기록 리스트에는 새 메시지를 덧붙이고 (pending_id를 남겨 대기 중 턴과 중복 제거), 대기 중 턴은 삭제
+        appended: Dict[str, List[Dict]] = {}
+        for chat_history_id, row in zip(inserted_ids, rows):
+            item = {"chat_history_id": chat_history_id, **row}
+            appended.setdefault(row["conversation_id"], []).append(item)
+        for conversation_id, items in appended.items():
+            await self.cache.alist_append(
+                CACHE_KEYS["conversation_history"].format(conversation_id=conversation_id),
+                items,
+                max_len=MAX_HISTORY_PER_CONV,
+                ttl=CACHE_TTL["conversation_history"],
+                only_if_exists=True
+            )
+
+        done: Dict[str, List[str]] = {}
+        for message in messages:
+            if message.get("pending_id"):
+                done.setdefault(message["conversation_id"], []).append(message["pending_id"])
+        for conversation_id, conversation_pending_ids in done.items():
+            await self.cache.ahash_delete(
+                CACHE_KEYS["conversation_pending"].format(conversation_id=conversation_id),
+                conversation_pending_ids
+            )
+
+        stale_keys = {CACHE_KEYS["conversation_info"].format(conversation_id=row["conversation_id"]) for row in rows}
+        stale_keys.update(CACHE_KEYS["user_conversations"].format(user_id=row["user_id"]) for row in rows)
+        if stale_keys:
+            await self.cache.adelete_many(list(stale_keys))
+
+        return ids
+
+    @staticmethod
+    def _build_counter_update(rows: List[Dict]) -> Tuple[str, Dict]:
+        """대화별 추가 메시지 수와 마지막 메시지(큐에 들어온 순서상 마지막 행)를 반영하는 UPDATE 쿼리"""
+        counters: Dict[str, Dict] = {}
+        for row in rows:
+            counter = counters.setdefault(row["conversation_id"], {"count": 0})
+            counter["count"] += 1
+            counter["last"] = row
+
+        params: Dict = {}
+        cases: Dict[str, List[str]] = {"count": [], "time": [], "user": [], "bot": []}
+        id_params = []
+        for index, (conversation_id, counter) in enumerate(counters.items()):
+            last = counter["last"]
+            params[f"cid{index}"] = conversation_id
+            params[f"cnt{index}"] = counter["count"]
+            params[f"ts{index}"] = last["create_at"]
+            params[f"um{index}"] = last["user_message"][:LAST_MESSAGE_PREVIEW_LENGTH]
+            params[f"br{index}"] = last["bot_response"][:LAST_MESSAGE_PREVIEW_LENGTH]
+            cases["count"].append(f"WHEN %(cid{index})s THEN %(cnt{index})s")
+            cases["time"].append(f"WHEN %(cid{index})s THEN %(ts{index})s")
+            cases["user"].append(f"WHEN %(cid{index})s THEN %(um{index})s")
+            cases["bot"].append(f"WHEN %(cid{index})s THEN %(br{index})s")
+            id_params.append(f"%(cid{index})s")
+
+        update_query = f"""
+            UPDATE {DB_TABLES['conversation']}
+            SET message_count = message_count + CASE conversation_id {' '.join(cases['count'])} ELSE 0 END,
+                last_message_at = CASE conversation_id {' '.join(cases['time'])} ELSE last_message_at END,
+                last_user_message = CASE conversation_id {' '.join(cases['user'])} ELSE last_user_message END,
+                last_bot_response = CASE conversation_id {' '.join(cases['bot'])} ELSE last_bot_response END
+            WHERE conversation_id IN ({', '.join(id_params)})
+        """
+        return update_query, params
+
+    async def _save_message_to_db(self, chat_data: Dict,
+                                  db: Optional[AsyncMySQLConnector] = None) -> Dict:
         """메시지를 데이터베이스에 저장"""
+        db = db or self.db
         try:
-            insert_result = await self.db.ainsert(DB_TABLES['chat_history'], chat_data)
+            insert_result = await db.insert(DB_TABLES['chat_history'], chat_data)
             if not insert_result:
                 raise DatabaseError("Failed to save message")
             return insert_result
@@ -358,38 +611,33 @@ class ChatManager:
             logger.error(f"메시지 저장 오류: {str(e)}")
             raise
 
-    async def _update_conversation_status(self, conversation_id: str):
-        """대화 세션 상태 업데이트"""
+    async def _update_conversation_status(self, conversation_id: str, chat_data: Dict,
+                                          db: Optional[AsyncMySQLConnector] = None):
+        """대화 세션 상태 업데이트 (메시지 수, 마지막 메시지 시각/내용)"""
+        db = db or self.db
         try:
             update_query = f"""
                 UPDATE {DB_TABLES['conversation']}
-                SET last_message_at = CURRENT_TIMESTAMP,
-                    message_count = message_count + 1 
+                SET last_message_at = %(last_message_at)s,
+                    message_count = message_count + 1,
+                    last_user_message = %(last_user_message)s,
+                    last_bot_response = %(last_bot_response)s
                 WHERE conversation_id = %(conversation_id)s
             """
-            update_result = await self.db.aexecute_raw_query(
+            update_result = await db.execute(
                 update_query,
-                {"conversation_id": conversation_id}
+                {
+                    "conversation_id": conversation_id,
+                    "last_message_at": chat_data["create_at"],
+                    "last_user_message": chat_data["user_message"][:LAST_MESSAGE_PREVIEW_LENGTH],
+                    "last_bot_response": chat_data["bot_response"][:LAST_MESSAGE_PREVIEW_LENGTH]
+                }
             )
-            if not update_result:
+            if not update_result['affected_rows']:
                 raise DatabaseError("Failed to update conversation")
         except Exception as e:
             logger.error(f"대화 상태 업데이트 오류: {str(e)}")
-
-    async def _invalidate_cache_async(self, conversation_id: str, user_id: int):
-        """캐시 무효화 (비동기)"""
-        try:
-            await self.cache.adelete(CACHE_KEYS["conversation_info"].format(
-                conversation_id=conversation_id
-            ))
-            await self.cache.adelete(CACHE_KEYS["conversation_history"].format(
-                conversation_id=conversation_id
-            ))
-            await self.cache.adelete(CACHE_KEYS["user_conversations"].format(
-                user_id=user_id
-            ))
-        except Exception as e:
-            logger.warning(f"캐시 무효화 중 오류 발생: {str(e)}")
+            raise
 
     async def delete_conversation(self, conversation_id: str, user_id: int) -> bool:
         """대화 삭제"""
@@ -402,43 +650,38 @@ class ChatManager:
             if not conversation or conversation['user_id'] != user_id:
                 raise ConversationNotFound("대화를 찾을 수 없거나 접근 권한이 없습니다.")
 
-            self.db.begin_transaction()
-
-            update_data = {"status": "deleted"}
-            where = {"conversation_id": conversation_id}
-            update_result = self.db.update(DB_TABLES['conversation'], update_data, where)
-            if not update_result:
-                raise DatabaseError("Failed to delete conversation")
+            async with self.db.transaction() as tx:
+                update_data = {"status": "deleted"}
+                where = {"conversation_id": conversation_id}
+                update_result = await tx.update(DB_TABLES['conversation'], update_data, where)
+                if not update_result:
+                    raise DatabaseError("Failed to delete conversation")
 
             # 캐시 무효화
-            self.invalidate_conversation_cache(conversation_id, user_id)
+            await self.invalidate_conversation_cache(conversation_id, user_id)
 
-            self.db.commit_transaction()
             logger.info(f"Deleted conversation: {conversation_id}")
             return True
 
         except Exception as e:
-            self.db.rollback_transaction()
             logger.error(f"대화 삭제 오류: {str(e)}")
             if isinstance(e, (ChatBaseException, DatabaseError)):
                 raise
             raise DatabaseError(f"대화 삭제 중 오류 발생: {str(e)}")
 
-    def invalidate_conversation_cache(self, conversation_id: str, user_id: int):
+    async def invalidate_conversation_cache(self, conversation_id: str, user_id: int):
         """대화 관련 캐시 무효화"""
         try:
             if not conversation_id or not user_id:
                 logger.warning("Cannot invalidate cache: conversation_id and user_id are required")
                 return
 
-            self.cache.delete(CACHE_KEYS["conversation_info"].format(
-                conversation_id=conversation_id
-            ))
-            self.cache.delete(CACHE_KEYS["conversation_history"].format(
-                conversation_id=conversation_id
-            ))
-            self.cache.delete(CACHE_KEYS["user_conversations"].format(
-                user_id=user_id
-            ))
+            await self.cache.adelete_many([
+                CACHE_KEYS["conversation_info"].format(conversation_id=conversation_id),
+                CACHE_KEYS["conversation_history"].format(conversation_id=conversation_id),
+                CACHE_KEYS["user_conversations"].format(user_id=user_id)
+            ])
+            # 페이지 캐시
+            await self.cache.ainvalidate_tag(CACHE_TAGS["conversation"].format(conversation_id=conversation_id))
         except Exception as e:
             logger.warning(f"캐시 무효화 중 오류 발생: {str(e)}")
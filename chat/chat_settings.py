@@ -2,27 +2,27 @@
 import logging
 from typing import Dict, Optional
 
-from chat.constants import CACHE_KEYS, DB_TABLES, CACHE_TTL, DEFAULT_CHAT_SETTINGS
+from chat.constants import CACHE_KEYS, CACHE_TAGS, DB_TABLES, CACHE_TTL, DEFAULT_CHAT_SETTINGS
 from chat.exceptions import DatabaseError, UserSettingsError
-from utils.cache_manager import CacheManager
-from utils.mysql_connector import MySQLConnector
+from utils.cache_manager import CacheManager, get_cache_manager
+from utils.async_mysql_connector import AsyncMySQLConnector
 
 logger = logging.getLogger(__name__)
 
 
 class ChatSettingsManager:
-    def __init__(self):
-        self.db = MySQLConnector()
-        self.cache = CacheManager()
+    def __init__(self, cache: Optional[CacheManager] = None):
+        self.db = AsyncMySQLConnector()
+        self.cache = cache or get_cache_manager()
 
-    def get_user_settings(self, user_id: int) -> Optional[Dict]:
+    async def get_user_settings(self, user_id: int) -> Optional[Dict]:
         """사용자 설정 조회"""
         if not user_id:
             raise UserSettingsError("User ID is required")
 
         try:
             cache_key = CACHE_KEYS["user_settings"].format(user_id=user_id)
-            cached_data = self.cache.get(cache_key)
+            cached_data = await self.cache.aget(cache_key)
             if cached_data:
                 logger.debug(f"Cache hit for user settings: {user_id}")
                 return cached_data
@@ -40,18 +40,21 @@ class ChatSettingsManager:
             WHERE user_id = %(user_id)s
             """
 
-            result = self.db.execute_raw_query(query, {"user_id": user_id})
-            if not result:
+            settings = await self.db.fetch_one(query, {"user_id": user_id})
+            if not settings:
                 logger.info(f"No settings found for user: {user_id}, using defaults")
                 settings = DEFAULT_CHAT_SETTINGS.copy()
                 settings['user_id'] = user_id
                 return settings
 
-            settings = result[0]
-            self.cache.set(
+            await self.cache.aset(
                 cache_key,
                 settings,
-                ttl=CACHE_TTL["user_settings"]
+                ttl=CACHE_TTL["user_settings"],
+                tags=[
+                    CACHE_TAGS["user"].format(user_id=user_id),
+                    CACHE_TAGS["user_settings"].format(user_id=user_id)
+                ]
             )
             return settings
 
@@ -61,7 +64,7 @@ class ChatSettingsManager:
                 raise
             raise DatabaseError(f"사용자 설정 조회 중 오류 발생: {str(e)}")
 
-    def update_user_settings(self, user_id: int, settings_data: Dict) -> Dict:
+    async def update_user_settings(self, user_id: int, settings_data: Dict) -> Dict:
         """사용자 설정 생성 또는 수정"""
         if not user_id:
             raise UserSettingsError("User ID is required")
@@ -72,53 +75,49 @@ class ChatSettingsManager:
             # 설정값 검증
             self._validate_settings(settings_data)
 
-            self.db.begin_transaction()
-
             # 기존 설정 확인
-            existing_settings = self.get_user_settings(user_id)
+            existing_settings = await self.get_user_settings(user_id)
             has_existing = existing_settings and 'user_id' in existing_settings
 
-            if has_existing:
-                # 업데이트
-                valid_fields = ['default_prompt_template_id', 'model', 'temperature', 'max_tokens']
-                update_data = {
-                    key: value
-                    for key, value in settings_data.items()
-                    if key in valid_fields and value is not None
-                }
-
-                if not update_data:
-                    raise UserSettingsError("No valid fields to update")
-
-                where = {"user_id": user_id}
-                update_result = self.db.update(DB_TABLES['chat_settings'], update_data, where)
-                if not update_result:
-                    raise DatabaseError("Failed to update settings")
-                logger.info(f"Updated settings for user: {user_id}")
-            else:
-                # 새로운 설정 생성
-                insert_data = {
-                    "user_id": user_id,
-                    **settings_data
-                }
-                insert_result = self.db.insert(DB_TABLES['chat_settings'], insert_data)
-                if not insert_result:
-                    raise DatabaseError("Failed to create settings")
-                logger.info(f"Created new settings for user: {user_id}")
+            async with self.db.transaction() as tx:
+                if has_existing:
+                    # 업데이트
+                    valid_fields = ['default_prompt_template_id', 'model', 'temperature', 'max_tokens']
+                    update_data = {
+                        key: value
+                        for key, value in settings_data.items()
+                        if key in valid_fields and value is not None
+                    }
+
+                    if not update_data:
+                        raise UserSettingsError("No valid fields to update")
+
+                    where = {"user_id": user_id}
+                    update_result = await tx.update(DB_TABLES['chat_settings'], update_data, where)
+                    if not update_result:
+                        raise DatabaseError("Failed to update settings")
+                    logger.info(f"Updated settings for user: {user_id}")
+                else:
+                    # 새로운 설정 생성
+                    insert_data = {
+                        "user_id": user_id,
+                        **settings_data
+                    }
+                    insert_result = await tx.insert(DB_TABLES['chat_settings'], insert_data)
+                    if not insert_result:
+                        raise DatabaseError("Failed to create settings")
+                    logger.info(f"Created new settings for user: {user_id}")
 
             # 캐시 무효화
-            self.invalidate_settings_cache(user_id)
-
-            self.db.commit_transaction()
+            await self.invalidate_settings_cache(user_id)
 
             # 업데이트된 설정 반환
-            updated_settings = self.get_user_settings(user_id)
+            updated_settings = await self.get_user_settings(user_id)
             if not updated_settings:
                 raise DatabaseError("Failed to retrieve updated settings")
             return updated_settings
 
         except Exception as e:
-            self.db.rollback_transaction()
             logger.error(f"사용자 설정 저장 오류: {str(e)}")
             if isinstance(e, (UserSettingsError, DatabaseError)):
                 raise
@@ -163,14 +162,16 @@ class ChatSettingsManager:
                 if template_id < 1:
                     raise UserSettingsError("Invalid prompt template ID")
 
-    def invalidate_settings_cache(self, user_id: int):
+    async def invalidate_settings_cache(self, user_id: int):
         """사용자 설정 캐시 무효화"""
         try:
             if not user_id:
                 logger.warning("Cannot invalidate cache: user_id is required")
                 return
 
+            # 봇이 따로 캐시한 설정도 같은 태그로 함께 무효화
             cache_key = CACHE_KEYS["user_settings"].format(user_id=user_id)
-            self.cache.delete(cache_key)
+            await self.cache.adelete(cache_key)
+            await self.cache.ainvalidate_tag(CACHE_TAGS["user_settings"].format(user_id=user_id))
         except Exception as e:
             logger.warning(f"캐시 무효화 중 오류 발생: {str(e)}")
@@ -8,7 +8,14 @@ CACHE_KEYS = {
 
     # 대화 관련
     "conversation_info": "conversation:{conversation_id}:info",
-    "conversation_history": "conversation:{conversation_id}:history",
+    # 대화 기록은 최근 MAX_HISTORY_PER_CONV개만 담는 Redis 리스트 (이전의 문자열 키와 겹치지 않도록 이름 변경)
+    "conversation_history": "conversation:{conversation_id}:messages",
+    # 최근 리스트 밖의 과거 기록 페이지 (direction: before/after, cursor: chat_history_id)
+    "conversation_history_page": "conversation:{conversation_id}:page:{direction}:{cursor}:{limit}",
+    # 토큰 예산 밖으로 밀려난 이전 턴의 누적 요약 ({"until_id": 마지막 요약 chat_history_id, "summary": 요약})
+    "conversation_summary": "conversation:{conversation_id}:summary",
+    # write-behind 큐에 들어갔지만 아직 DB에 저장되지 않은 턴 (해시, 필드: pending_id)
+    "conversation_pending": "conversation:{conversation_id}:pending",
     "user_conversations": "user_conversations:{user_id}",
 
     # 프롬프트 템플릿 관련
@@ -24,12 +31,44 @@ CACHE_TTL = {
     "user_settings": 3600,  # 1시간
     "conversation_info": 1800,  # 30분
     "conversation_history": 1800,  # 30분
+    "conversation_pending": 86400,  # 1일 (MySQL 장애로 spill된 동안에도 유지)
     "user_conversations": 300,  # 5분
     "prompt_templates": 3600,  # 1시간
     "prompt_template": 3600,  # 1시간
     "similar_expressions": 300  # 5분
 }
 
+# 캐시 지표 집계용 키 계열 (CACHE_KEYS + 봇/캐시 매니저가 직접 쓰는 키)
+CACHE_KEY_FAMILIES = {
+    **CACHE_KEYS,
+    "bot_user_settings": "user_settings:{user_id}",
+    "bot_template": "template:{template_id}",
+    "bot_default_template": "default_template",
+    "openai_response": "openai_response:{hash}",
+    "openai_conversation": "openai_conversation:{conversation_id}:messages",
+    "tag": "tag:{tag}",
+    "lock": "lock:{key}"
+}
+
+# 캐시 태그 (태그에 등록된 키를 invalidate_tag로 한 번에 무효화)
+CACHE_TAGS = {
+    "user": "user:{user_id}",  # 사용자 관련 모든 캐시
+    "conversation": "conversation:{conversation_id}",  # 대화 기록 페이지 캐시
+    "user_settings": "user_settings:{user_id}",  # 사용자 설정 캐시 (매니저/봇)
+    "prompt_template": "template:{template_id}",  # 특정 템플릿 캐시
+    "prompt_templates": "template:all"  # 템플릿 목록/기본 템플릿 등 전체 템플릿에 의존하는 캐시
+}
+
+# 프로세스 내 L1 캐시에 보관할 키 접두사 (자주 읽고 거의 바뀌지 않는 키)
+LOCAL_CACHE_KEY_PREFIXES = (
+    "user_chat_settings:",
+    "user_settings:",
+    "prompt_templates:",
+    "prompt_template:",
+    "template:",
+    "default_template",
+)
+
 # 챗봇 기본 설정
 DEFAULT_CHAT_SETTINGS: Dict[str, Any] = {
     "model": "gpt-4o-mini",
@@ -51,3 +90,5 @@ DB_TABLES = {
 MAX_SIMILAR_EXPRESSIONS = 5  # 유사 표현 검색 최대 개수
 MAX_CONVERSATIONS = 50  # 사용자당 최대 대화 개수
 MAX_HISTORY_PER_CONV = 100  # 대화당 최대 메시지 개수
+LAST_MESSAGE_PREVIEW_LENGTH = 255  # 대화 목록에 보여줄 마지막 메시지 길이 (conversation_session 컬럼 크기)
+STREAM_ERROR_MARKER = "\n\n[STREAM_ERROR]"  # 스트리밍 응답이 중간에 끊겼을 때 본문 끝에 붙이는 표시
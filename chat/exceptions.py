@@ -37,6 +37,16 @@ class OpenAIError(ChatBaseException):
     pass
 
 
+class RateLimitTimeout(OpenAIError):
+    """요청 한도/동시 실행 제한 대기 시간 안에 OpenAI 호출 차례가 오지 않았을 때 발생하는 예외"""
+    pass
+
+
+class OpenAITimeout(OpenAIError):
+    """재시도와 모델 전환을 포함한 OpenAI 응답 기한 안에 응답을 받지 못했을 때 발생하는 예외"""
+    pass
+
+
 class SmallTalkError(ChatBaseException):
     """SmallTalk 관련 예외"""
     pass
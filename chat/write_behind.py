@@ -0,0 +1,426 @@
+# chat/write_behind.py
+import asyncio
+import glob
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from chat.chat_manager import ChatManager
+from configs.openai_setting import OpenAISettings
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 (프로세스 간 잠금 없이 동작)
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 워커 종료 신호
+_STOP = object()
+
+
+class ChatWriteBehind:
+    """
+    채팅 메시지 write-behind 큐
+
+    응답 경로에서는 메시지를 큐에 넣기만 하고, 백그라운드 워커가 batch_size개가 모이거나
+    flush_interval초가 지나면 ChatManager.save_messages로 한 번에 저장한다.
+    MySQL에 저장하지 못한 메시지는 spill 파일(JSON Lines)에 남겨 두고,
+    시작 시와 다음 저장이 성공했을 때 다시 저장한다.
+
+    spill 파일은 여러 워커 프로세스가 함께 쓰므로 기록과 회수는 잠금 파일(fcntl.flock)로 보호한다.
+    다시 저장할 때는 spill 파일을 워커 전용 claim 파일로 이름을 바꿔(os.rename) 가져오고,
+    저장에 성공한 뒤에만 claim 파일을 지운다.
+    """
+
+    def __init__(self, chat_manager: Optional[ChatManager] = None, batch_size: int = 100,
+                 flush_interval: float = 0.5, max_queue: int = 10000,
+                 spill_path: str = "data/chat_write_spill.jsonl"):
+        """
+        큐 초기화
+
+        Args:
+            chat_manager: 저장에 쓸 ChatManager (None이면 새로 생성)
+            batch_size: 한 번에 저장할 최대 메시지 수
+            flush_interval: 첫 메시지가 들어온 뒤 저장까지 기다리는 최대 시간(초)
+            max_queue: 큐 최대 길이 (넘치면 spill 파일에 바로 기록)
+            spill_path: MySQL 장애 시 메시지를 남길 파일 경로
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size는 1 이상이어야 합니다.")
+
+        self.chat_manager = chat_manager or ChatManager()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.spill_path = spill_path
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._spill_lock = threading.Lock()
+        self._lock_path = f"{spill_path}.lock"
+
+        # 워커가 저장 중인 묶음 (종료 시 취소되면 spill 파일에 기록)
+        self._batch: List[Dict] = []
+
+        # 큐가 가득 찼을 때 모아 두었다가 스레드에서 한 번에 spill 파일에 기록할 메시지
+        self._overflow: List[Dict] = []
+        self._overflow_task: Optional[asyncio.Task] = None
+
+        # 통계
+        self._enqueued = 0
+        self._flushed = 0
+        self._batches = 0
+        self._spilled = 0
+        self._replayed = 0
+        self._failures = 0
+        self._last_flush_ms = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self) -> None:
+        """워커 시작 (남아 있는 spill 파일을 먼저 저장 시도)"""
+        if self.is_running:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        await self._replay_spill()
+        self._worker = asyncio.create_task(self._run())
+        logger.info(f"Chat write-behind worker started (batch_size={self.batch_size}, "
+                    f"flush_interval={self.flush_interval}s)")
+
+    async def submit(self, user_id: int, conversation_id: str, user_message: str, bot_response: str) -> bool:
+        """
+        메시지를 저장 큐에 추가 (DB 저장을 기다리지 않음)
+
+        저장 전에도 다음 요청의 대화 맥락에 들어가도록 대화의 대기 중 턴(Redis)에 먼저 기록한다.
+
+        Returns:
+            큐 또는 spill 파일에 기록했는지 여부 (워커가 실행 중이 아니면 False, 호출자가 직접 저장해야 함)
+        """
+        if not self.is_running:
+            return False
+
+        message = {
+            "pending_id": uuid.uuid4().hex,
+            "conversation_id": conversation_id,
+            "user_id": user_id,
+            "user_message": user_message,
+            "bot_response": bot_response,
+            "create_at": datetime.utcnow()
+        }
+        try:
+            await self.chat_manager.add_pending_message(message)
+        except Exception as e:
+            logger.warning(f"Failed to register pending chat message: {str(e)}")
+
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # 이벤트 루프를 막지 않도록 모아서 스레드에서 기록
+            self._overflow.append(message)
+            if self._overflow_task is None or self._overflow_task.done():
+                self._overflow_task = asyncio.create_task(self._spill_overflow())
+        self._enqueued += 1
+        return True
+
+    async def _spill_overflow(self) -> None:
+        """큐에 넣지 못한 메시지를 spill 파일에 기록 (기록하는 동안 쌓인 메시지도 이어서 기록)"""
+        while self._overflow:
+            messages, self._overflow = self._overflow, []
+            logger.warning(f"Chat write-behind queue is full, spilling {len(messages)} messages to file")
+            await asyncio.to_thread(self._write_spill, messages)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        try:
+            while not stopping:
+                item = await self._queue.get()
+                if item is _STOP:
+                    break
+
+                self._batch = [item]
+                deadline = loop.time() + self.flush_interval
+                while len(self._batch) < self.batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    self._batch.append(item)
+
+                await self._flush(self._batch)
+                self._batch = []
+        except asyncio.CancelledError:
+            # 모으는 중이거나 저장 중이던 묶음은 버리지 않고 spill 파일에 기록
+            # (저장 도중 취소되어 이미 커밋된 턴은 재처리 때 pending_id로 걸러짐)
+            if self._batch:
+                logger.warning(f"Chat write-behind worker cancelled, spilling {len(self._batch)} messages")
+                self._write_spill(self._batch)
+                self._batch = []
+            raise
+
+    async def _flush(self, batch: List[Dict]) -> bool:
+        """메시지 묶음 저장, 실패하면 spill 파일에 기록"""
+        started = time.perf_counter()
+        try:
+            await self.chat_manager.save_messages(batch)
+        except Exception as e:
+            self._failures += 1
+            logger.error(f"Chat write-behind flush failed, spilling {len(batch)} messages: {str(e)}")
+            # 스레드는 취소되지 않으므로 기록을 맡긴 뒤에는 종료 시 다시 spill하지 않음
+            self._batch = []
+            await asyncio.to_thread(self._write_spill, batch)
+            return False
+
+        # 저장된 묶음은 이후 spill 재저장이 취소되어도 다시 spill하지 않음
+        self._batch = []
+        self._last_flush_ms = round((time.perf_counter() - started) * 1000, 3)
+        self._flushed += len(batch)
+        self._batches += 1
+
+        if os.path.exists(self.spill_path):
+            await self._replay_spill()
+        return True
+
+    @contextmanager
+    def _locked_spill(self):
+        """spill 파일 잠금 (프로세스 내 스레드 잠금 + 프로세스 간 flock)"""
+        with self._spill_lock:
+            directory = os.path.dirname(self.spill_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if fcntl is None:
+                yield
+                return
+            with open(self._lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_spill(self, messages: List[Dict]) -> None:
+        """메시지를 spill 파일 끝에 추가하고 디스크에 기록될 때까지 대기(fsync)"""
+        lines = "".join(json.dumps(message, default=_default, ensure_ascii=False) + "\n" for message in messages)
+        try:
+            with self._locked_spill():
+                with open(self.spill_path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._spilled += len(messages)
+        except OSError as e:
+            logger.critical(f"Failed to spill {len(messages)} chat messages to {self.spill_path}: {str(e)}")
+
+    def _claim_path(self) -> str:
+        return f"{self.spill_path}.{os.getpid()}.{uuid.uuid4().hex[:8]}.claim"
+
+    def _claim_spill(self) -> List[str]:
+        """
+        spill 파일과 종료된 프로세스가 남긴 claim 파일을 이 프로세스의 claim 파일로 가져옴
+
+        Returns:
+            가져온 claim 파일 경로 목록
+        """
+        claims = []
+        with self._locked_spill():
+            # 다시 저장하던 중 종료된 프로세스의 claim 파일
+            for path in glob.glob(f"{glob.escape(self.spill_path)}.*.claim"):
+                try:
+                    pid = int(path[len(self.spill_path) + 1:].split(".", 1)[0])
+                except ValueError:
+                    continue
+                if pid != os.getpid() and not _pid_alive(pid):
+                    claim = self._claim_path()
+                    os.rename(path, claim)
+                    claims.append(claim)
+
+            if os.path.exists(self.spill_path):
+                claim = self._claim_path()
+                os.rename(self.spill_path, claim)
+                claims.append(claim)
+        return claims
+
+    @staticmethod
+    def _read_claim(path: str) -> List[Dict]:
+        messages = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                    message["create_at"] = datetime.fromisoformat(message["create_at"])
+                    messages.append(message)
+                except (ValueError, KeyError) as e:
+                    # 기록 도중 중단되어 잘린 줄은 건너뜀
+                    logger.error(f"Skipping invalid spill line {line_no} in {path}: {str(e)}")
+        return messages
+
+    def _release_claims(self, path: str, remaining: List[Dict], rest: List[str]) -> None:
+        """
+        저장하지 못한 메시지를 spill 파일로 되돌리고 claim 파일 삭제
+
+        Args:
+            path: 저장 중이던 claim 파일
+            remaining: path에서 아직 저장하지 못한 메시지
+            rest: 아직 읽지 않은 claim 파일들 (내용 전체를 되돌림)
+        """
+        for claim, messages in [(path, remaining), *((claim, None) for claim in rest)]:
+            if messages is None:
+                messages = self._read_claim(claim)
+            if messages:
+                self._write_spill(messages)
+                self._spilled -= len(messages)
+            os.remove(claim)
+
+    async def _replay_spill(self) -> None:
+        """spill 파일에 남은 메시지를 다시 저장"""
+        try:
+            claims = await asyncio.to_thread(self._claim_spill)
+        except OSError as e:
+            logger.error(f"Failed to claim spill file {self.spill_path}: {str(e)}")
+            return
+
+        for claim_index, path in enumerate(claims):
+            rest = claims[claim_index + 1:]
+            try:
+                messages = await asyncio.to_thread(self._read_claim, path)
+            except OSError as e:
+                logger.error(f"Failed to read spill claim {path}: {str(e)}")
+                continue
+
+            if messages:
+                logger.info(f"Replaying {len(messages)} spilled chat messages")
+            index = 0
+            try:
+                while index < len(messages):
+                    chunk = messages[index:index + self.batch_size]
+                    await self.chat_manager.save_messages(chunk)
+                    self._replayed += len(chunk)
+                    index += len(chunk)
+            except asyncio.CancelledError:
+                self._release_claims(path, messages[index:], rest)
+                raise
+            except Exception as e:
+                logger.error(f"Spill replay failed, keeping {len(messages) - index} messages: {str(e)}")
+                await asyncio.to_thread(self._release_claims, path, messages[index:], rest)
+                return
+
+            # 모두 저장한 뒤에만 claim 파일 삭제
+            await asyncio.to_thread(os.remove, path)
+
+    async def drain(self, timeout: float = 10.0) -> None:
+        """
+        큐에 남은 메시지를 모두 저장하고 워커 종료 (애플리케이션 종료 시 호출)
+
+        Args:
+            timeout: 저장을 기다릴 최대 시간(초), 넘으면 저장 중이던 묶음과 남은 메시지는 spill 파일에 기록
+        """
+        if self._worker is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        worker = self._worker
+        if not worker.done():
+            try:
+                # 큐가 가득 차 있으면 자리가 날 때까지 기다렸다가 종료 신호를 넣음
+                await asyncio.wait_for(self._queue.put(_STOP), max(0.0, deadline - loop.time()))
+                await asyncio.wait_for(asyncio.shield(worker), max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                logger.warning("Chat write-behind drain timed out, spilling remaining messages")
+                worker.cancel()
+            try:
+                # 취소된 경우 워커가 저장 중이던 묶음을 spill 파일에 기록할 때까지 대기
+                await worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+        if self._overflow_task is not None:
+            await self._overflow_task
+            self._overflow_task = None
+
+        remaining = self._overflow
+        self._overflow = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                remaining.append(item)
+        if remaining:
+            self._write_spill(remaining)
+        logger.info(f"Chat write-behind worker stopped (flushed={self._flushed}, spilled={self._spilled})")
+
+    def stats(self) -> Dict:
+        """
+        write-behind 큐 통계
+
+        Returns:
+            대기 중인 메시지 수, 저장/spill 건수 등
+        """
+        return {
+            "running": self.is_running,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue": self.max_queue,
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "enqueued": self._enqueued,
+            "flushed": self._flushed,
+            "batches": self._batches,
+            "avg_batch_size": round(self._flushed / self._batches, 2) if self._batches else 0.0,
+            "last_flush_ms": self._last_flush_ms,
+            "failures": self._failures,
+            "spilled": self._spilled,
+            "replayed": self._replayed,
+            "spill_pending": os.path.exists(self.spill_path)
+        }
+
+
+def _pid_alive(pid: int) -> bool:
+    """같은 호스트에서 pid 프로세스가 실행 중인지 여부"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _default(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+_write_behind: Optional[ChatWriteBehind] = None
+
+
+def get_chat_write_behind() -> ChatWriteBehind:
+    """설정값으로 만든 공유 write-behind 큐 반환"""
+    global _write_behind
+    if _write_behind is None:
+        settings = OpenAISettings()
+        _write_behind = ChatWriteBehind(
+            batch_size=settings.CHAT_WRITE_BATCH_SIZE,
+            flush_interval=settings.CHAT_WRITE_FLUSH_INTERVAL,
+            max_queue=settings.CHAT_WRITE_MAX_QUEUE,
+            spill_path=settings.CHAT_WRITE_SPILL_PATH
+        )
+    return _write_behind
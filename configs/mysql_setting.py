@@ -19,6 +19,14 @@ MYSQL_CONFIG = {
     'port': int(os.getenv('MYSQL_PORT', 3306))
 }
 
+# MySQL 커넥션 풀 설정
+MYSQL_POOL_CONFIG = {
+    'pool_size': int(os.getenv('MYSQL_POOL_SIZE', 10)),
+    'timeout': float(os.getenv('MYSQL_POOL_TIMEOUT', 30)),
+    'pre_ping': os.getenv('MYSQL_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes'),
+    'recycle': int(os.getenv('MYSQL_POOL_RECYCLE', 3600))
+}
+
 # 필수 환경변수 확인
 required_vars = ['MYSQL_USER', 'MYSQL_PASSWORD', 'MYSQL_DATABASE']
 missing_vars = [var for var in required_vars if not os.getenv(var)]
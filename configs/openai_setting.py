@@ -16,10 +16,59 @@ class OpenAISettings(BaseSettings):
     TEMPERATURE: float = float(os.getenv('OPENAI_TEMPERATURE', '0.7'))
     MAX_TOKENS: int = int(os.getenv('OPENAI_MAX_TOKENS', '2000'))
 
+    # OpenAI compatible endpoint (e.g. the load test stub: http://localhost:8001/v1), unset = api.openai.com
+    OPENAI_BASE_URL: Optional[str] = os.getenv('OPENAI_BASE_URL') or None
+
+    # Client-side OpenAI rate limits (per model token buckets + per user concurrency)
+    # OPENAI_MODEL_LIMITS: JSON like {"gpt-4o-mini": [500, 200000]} overriding the default RPM/TPM per model prefix
+    OPENAI_RPM: int = int(os.getenv('OPENAI_RPM', '500'))
+    OPENAI_TPM: int = int(os.getenv('OPENAI_TPM', '40000'))
+    OPENAI_MODEL_LIMITS: str = os.getenv('OPENAI_MODEL_LIMITS', '')
+    OPENAI_USER_CONCURRENCY: int = int(os.getenv('OPENAI_USER_CONCURRENCY', '2'))
+    OPENAI_QUEUE_TIMEOUT: float = float(os.getenv('OPENAI_QUEUE_TIMEOUT', '30'))
+    OPENAI_SHARED_RATE_LIMIT: bool = os.getenv('OPENAI_SHARED_RATE_LIMIT', 'false').lower() == 'true'
+
+    # Retry, timeouts and model fallback for OpenAI calls (seconds)
+    # OPENAI_FALLBACK_MODELS: comma separated fallback order, the requested model starts at its own position
+    OPENAI_MAX_RETRIES: int = int(os.getenv('OPENAI_MAX_RETRIES', '2'))
+    OPENAI_RETRY_BACKOFF_BASE: float = float(os.getenv('OPENAI_RETRY_BACKOFF_BASE', '0.5'))
+    OPENAI_RETRY_BACKOFF_MAX: float = float(os.getenv('OPENAI_RETRY_BACKOFF_MAX', '8'))
+    OPENAI_CONNECT_TIMEOUT: float = float(os.getenv('OPENAI_CONNECT_TIMEOUT', '5'))
+    OPENAI_FIRST_TOKEN_TIMEOUT: float = float(os.getenv('OPENAI_FIRST_TOKEN_TIMEOUT', '20'))
+    OPENAI_REQUEST_DEADLINE: float = float(os.getenv('OPENAI_REQUEST_DEADLINE', '90'))
+    OPENAI_FALLBACK_MODELS: str = os.getenv('OPENAI_FALLBACK_MODELS', 'gpt-4o,gpt-4o-mini')
+
+    # Cross-worker single-flight for identical prompts via a Redis lock (seconds, 0 = in-process only)
+    OPENAI_SINGLE_FLIGHT_LOCK_TIMEOUT: float = float(os.getenv('OPENAI_SINGLE_FLIGHT_LOCK_TIMEOUT', '0'))
+
+    # Conversation context assembly (recent turns within the token budget + rolling summary of older turns)
+    CONTEXT_MAX_TOKENS: int = int(os.getenv('CONTEXT_MAX_TOKENS', '3000'))
+    CONTEXT_SUMMARY_MODEL: str = os.getenv('CONTEXT_SUMMARY_MODEL', 'gpt-4o-mini')
+    CONTEXT_SUMMARY_MAX_TOKENS: int = int(os.getenv('CONTEXT_SUMMARY_MAX_TOKENS', '300'))
+
     # Redis settings (optional)
     REDIS_URL: Optional[str] = os.getenv('REDIS_URL')
     REDIS_TTL: int = int(os.getenv('REDIS_TTL', '3600'))
 
+    # In-process L1 cache settings (LOCAL_CACHE_TTL=0 disables)
+    LOCAL_CACHE_TTL: int = int(os.getenv('LOCAL_CACHE_TTL', '30'))
+    LOCAL_CACHE_MAX_ENTRIES: int = int(os.getenv('LOCAL_CACHE_MAX_ENTRIES', '1024'))
+    LOCAL_CACHE_MAX_BYTES: int = int(os.getenv('LOCAL_CACHE_MAX_BYTES', str(16 * 1024 * 1024)))
+
+    # Cache value codec settings ("json" or "msgpack", compression "zstd" falls back to "zlib")
+    CACHE_CODEC: str = os.getenv('CACHE_CODEC', 'json')
+    CACHE_COMPRESSION: str = os.getenv('CACHE_COMPRESSION', 'zstd')
+    CACHE_COMPRESS_THRESHOLD: int = int(os.getenv('CACHE_COMPRESS_THRESHOLD', '1024'))
+
+    # Interval (seconds) for logging per key family cache hit rates (0 disables)
+    CACHE_STATS_LOG_INTERVAL: int = int(os.getenv('CACHE_STATS_LOG_INTERVAL', '300'))
+
+    # Chat message write-behind queue (messages are spilled to the file while MySQL is unavailable)
+    CHAT_WRITE_BATCH_SIZE: int = int(os.getenv('CHAT_WRITE_BATCH_SIZE', '100'))
+    CHAT_WRITE_FLUSH_INTERVAL: float = float(os.getenv('CHAT_WRITE_FLUSH_INTERVAL', '0.5'))
+    CHAT_WRITE_MAX_QUEUE: int = int(os.getenv('CHAT_WRITE_MAX_QUEUE', '10000'))
+    CHAT_WRITE_SPILL_PATH: str = os.getenv('CHAT_WRITE_SPILL_PATH', 'data/chat_write_spill.jsonl')
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding='utf-8',
@@ -1,12 +1,12 @@
 # diary/ai.py
 from typing import Optional
 
-from bots.openai_bot import OpenAIBot
+from bots.openai_bot import get_openai_bot
 
 
 class DiaryAnalyzer:
     def __init__(self):
-        self.bot = OpenAIBot()
+        self.bot = get_openai_bot()
 
     async def analyze_diary(self, diary_text: str) -> Optional[str]:
         """일기 내용을 분석하여 피드백 생성"""
@@ -30,10 +30,12 @@ CREATE TABLE `chat_history`
     `user_id`         tinyint unsigned NOT NULL COMMENT '사용자 식별자',
     `user_message`    text COLLATE utf8mb4_general_ci     NOT NULL COMMENT '사용자 메시지',
     `bot_response`    text COLLATE utf8mb4_general_ci     NOT NULL COMMENT '봇 응답',
+    `pending_id`      char(32) COLLATE utf8mb4_general_ci          DEFAULT NULL COMMENT 'write-behind 턴 식별자',
     `create_at`       datetime                            NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 시간',
     `update_at`       datetime                            NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 시간',
     PRIMARY KEY (`chat_history_id`),
-    KEY               `chat_history_conversation_id_IDX` (`conversation_id`),
+    UNIQUE KEY        `chat_history_pending_id_UIDX` (`pending_id`),
+    KEY               `chat_history_conversation_id_chat_history_id_IDX` (`conversation_id`,`chat_history_id`),
     KEY               `chat_history_user_id_IDX` (`user_id`),
     KEY               `chat_history_create_at_IDX` (`create_at`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT='OpenAI 챗봇 대화 이력';
@@ -50,8 +52,10 @@ CREATE TABLE `conversation_session`
     `message_count`   int                                                       NOT NULL DEFAULT '0' COMMENT '메시지 수',
     `create_at`       datetime                                                  NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 시간',
     `last_message_at` datetime                                                  NOT NULL COMMENT '마지막 메시지 시간',
+    `last_user_message`  varchar(255) COLLATE utf8mb4_general_ci                    NOT NULL DEFAULT '' COMMENT '마지막 사용자 메시지 (앞부분)',
+    `last_bot_response`  varchar(255) COLLATE utf8mb4_general_ci                    NOT NULL DEFAULT '' COMMENT '마지막 봇 응답 (앞부분)',
     PRIMARY KEY (`conversation_id`),
-    KEY               `conversation_sessions_user_id_status_IDX` (`user_id`,`status`),
+    KEY               `conversation_sessions_user_id_status_last_message_at_IDX` (`user_id`,`status`,`last_message_at`),
     KEY               `conversation_sessions_last_message_at_IDX` (`last_message_at`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT='대화 세션 메타데이터';
 
@@ -136,6 +140,32 @@ CREATE TABLE `small_talk`
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT='스몰토크 문장';
 
 
+-- eng_base.small_talk_deck definition
+
+CREATE TABLE `small_talk_deck`
+(
+    `cycle_number` int unsigned      NOT NULL COMMENT '사이클 번호',
+    `position`     int unsigned      NOT NULL COMMENT '덱 내 발송 순서',
+    `talk_id`      smallint unsigned NOT NULL COMMENT 'small_talk FK',
+    PRIMARY KEY (`cycle_number`, `position`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT='스몰토크 발송 덱 (사이클별 셔플 순서)';
+
+
+-- eng_base.small_talk_deck_state definition
+
+CREATE TABLE `small_talk_deck_state`
+(
+    `deck_id`      tinyint unsigned  NOT NULL COMMENT 'PK',
+    `cycle_number` int unsigned      NOT NULL COMMENT '현재 사이클 번호',
+    `position`     int unsigned      NOT NULL COMMENT '다음 발송 위치',
+    `deck_size`    int unsigned      NOT NULL COMMENT '덱 크기',
+    `max_talk_id`  smallint unsigned NOT NULL COMMENT '덱에 반영된 마지막 talk_id',
+    `last_sent_at` datetime                   DEFAULT NULL COMMENT '마지막 발송일',
+    `update_at`    datetime          NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일',
+    PRIMARY KEY (`deck_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT='스몰토크 발송 덱 상태';
+
+
 -- eng_base.`user` definition
 
 CREATE TABLE `user`
@@ -186,6 +216,7 @@ CREATE TABLE `vocabulary`
     `create_at`       datetime                                NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '등록일자',
     `update_at`       datetime                                NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일자',
     PRIMARY KEY (`vocabulary_id`),
+    KEY             `vocabulary_create_at_IDX` (`create_at`,`vocabulary_id`) USING BTREE,
     FULLTEXT KEY `vocabulary_word_FTX` (`word`) /*!50100 WITH PARSER `ngram` */
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT='뜻이 많은 단어';
 
@@ -0,0 +1,3 @@
+-- 단어 목록 키셋 페이지네이션용 인덱스 (init.sql 적용 이전에 생성된 DB에 실행)
+ALTER TABLE `vocabulary`
+    ADD KEY `vocabulary_create_at_IDX` (`create_at`,`vocabulary_id`) USING BTREE;
@@ -0,0 +1,44 @@
+-- 스몰토크 발송 덱 테이블 (ORDER BY RAND() 대신 사이클별로 미리 섞어둔 순서를 사용)
+CREATE TABLE `small_talk_deck`
+(
+    `cycle_number` int unsigned      NOT NULL COMMENT '사이클 번호',
+    `position`     int unsigned      NOT NULL COMMENT '덱 내 발송 순서',
+    `talk_id`      smallint unsigned NOT NULL COMMENT 'small_talk FK',
+    PRIMARY KEY (`cycle_number`, `position`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT='스몰토크 발송 덱 (사이클별 셔플 순서)';
+
+CREATE TABLE `small_talk_deck_state`
+(
+    `deck_id`      tinyint unsigned  NOT NULL COMMENT 'PK',
+    `cycle_number` int unsigned      NOT NULL COMMENT '현재 사이클 번호',
+    `position`     int unsigned      NOT NULL COMMENT '다음 발송 위치',
+    `deck_size`    int unsigned      NOT NULL COMMENT '덱 크기',
+    `max_talk_id`  smallint unsigned NOT NULL COMMENT '덱에 반영된 마지막 talk_id',
+    `last_sent_at` datetime                   DEFAULT NULL COMMENT '마지막 발송일',
+    `update_at`    datetime          NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일',
+    PRIMARY KEY (`deck_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci COMMENT='스몰토크 발송 덱 상태';
+
+-- 기존 발송 기록 이어받기 (small_talk.cycle_number/last_sent_at 방식에서 전환)
+-- 현재 사이클에서 아직 보내지 않은 문장만 섞어서 첫 덱을 만들고, 사이클 번호도 그대로 이어간다
+-- (모두 보낸 상태면 빈 덱이 되어 첫 발송 때 다음 사이클 덱을 만든다)
+SET @current_cycle := (
+    SELECT GREATEST(COALESCE(MAX(cycle_number), 0), 1)
+    FROM `small_talk`
+    WHERE last_sent_at IS NOT NULL
+);
+
+INSERT INTO `small_talk_deck` (cycle_number, position, talk_id)
+SELECT @current_cycle, ROW_NUMBER() OVER (ORDER BY RAND()) - 1, talk_id
+FROM `small_talk`
+WHERE cycle_number = 0 OR cycle_number IS NULL OR last_sent_at IS NULL;
+
+INSERT INTO `small_talk_deck_state` (deck_id, cycle_number, position, deck_size, max_talk_id, last_sent_at)
+SELECT 1,
+       @current_cycle,
+       0,
+       (SELECT COUNT(*) FROM `small_talk_deck` WHERE cycle_number = @current_cycle),
+       MAX(talk_id),
+       MAX(last_sent_at)
+FROM `small_talk`
+HAVING COUNT(*) > 0;
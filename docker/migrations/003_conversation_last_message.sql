@@ -0,0 +1,17 @@
+-- 대화 목록 조회용 마지막 메시지 컬럼과 인덱스 (chat_history 전체에 대한 윈도우 함수 조회 제거)
+ALTER TABLE `conversation_session`
+    ADD COLUMN `last_user_message` varchar(255) COLLATE utf8mb4_general_ci NOT NULL DEFAULT '' COMMENT '마지막 사용자 메시지 (앞부분)',
+    ADD COLUMN `last_bot_response` varchar(255) COLLATE utf8mb4_general_ci NOT NULL DEFAULT '' COMMENT '마지막 봇 응답 (앞부분)',
+    ADD KEY `conversation_sessions_user_id_status_last_message_at_IDX` (`user_id`,`status`,`last_message_at`),
+    DROP KEY `conversation_sessions_user_id_status_IDX`;
+
+-- 기존 대화의 마지막 메시지 채우기
+UPDATE `conversation_session` cs
+    JOIN (
+        SELECT conversation_id, MAX(chat_history_id) AS chat_history_id
+        FROM `chat_history`
+        GROUP BY conversation_id
+    ) latest ON latest.conversation_id = cs.conversation_id
+    JOIN `chat_history` ch ON ch.chat_history_id = latest.chat_history_id
+SET cs.last_user_message = LEFT(ch.user_message, 255),
+    cs.last_bot_response = LEFT(ch.bot_response, 255);
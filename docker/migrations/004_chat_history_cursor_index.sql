@@ -0,0 +1,4 @@
+-- 대화 기록 커서 페이지네이션용 인덱스 (before/after chat_history_id 범위 조회)
+ALTER TABLE `chat_history`
+    ADD KEY `chat_history_conversation_id_chat_history_id_IDX` (`conversation_id`,`chat_history_id`),
+    DROP KEY `chat_history_conversation_id_IDX`;
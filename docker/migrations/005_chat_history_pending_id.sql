@@ -0,0 +1,4 @@
+-- write-behind 턴 식별자 (spill 파일 재처리로 같은 턴이 다시 저장되지 않도록 고유 키로 사용)
+ALTER TABLE `chat_history`
+    ADD COLUMN `pending_id` char(32) COLLATE utf8mb4_general_ci DEFAULT NULL COMMENT 'write-behind 턴 식별자' AFTER `bot_response`,
+    ADD UNIQUE KEY `chat_history_pending_id_UIDX` (`pending_id`);
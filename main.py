@@ -1,4 +1,6 @@
 # main.py
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -6,15 +8,48 @@ from fastapi import FastAPI
 from middlewares.cors import setup_cors_middleware
 from middlewares.json_handler import raw_json_middleware
 from middlewares.router import setup_routers
+from chat.write_behind import get_chat_write_behind
+from configs.openai_setting import OpenAISettings
+from utils.async_mysql_connector import close_async_pool
+from utils.cache_manager import get_cache_manager, close_cache_manager
+from utils.mysql_pool import dispose_pool
 from utils.scheduler import message_scheduler
 
 
+async def log_cache_hit_rates(interval: int):
+    """키 계열별 캐시 적중률을 주기적으로 로그"""
+    cache = get_cache_manager()
+    while True:
+        await asyncio.sleep(interval)
+        cache.log_hit_rates()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 공유 캐시 매니저를 먼저 만들어 Redis 연결/무효화 구독을 시작
+    get_cache_manager()
+    interval = OpenAISettings().CACHE_STATS_LOG_INTERVAL
+    stats_task = asyncio.create_task(log_cache_hit_rates(interval)) if interval > 0 else None
+
+    # 채팅 메시지 write-behind 워커 (이전 실행에서 남은 spill 파일도 저장)
+    write_behind = get_chat_write_behind()
+    await write_behind.start()
+
     message_scheduler.start()
     yield
     message_scheduler.stop()
 
+    # 큐에 남은 메시지를 DB 연결을 닫기 전에 모두 저장
+    await write_behind.drain()
+
+    if stats_task is not None:
+        stats_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await stats_task
+    await close_cache_manager()
+    dispose_pool()
+    await close_async_pool()
+
 
 app = FastAPI(title="English Bot API", lifespan=lifespan)
 
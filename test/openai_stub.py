@@ -0,0 +1,283 @@
+# test/openai_stub.py
+"""
+OpenAI 호환 채팅 완성 스텁 서버 (부하 테스트용)
+
+실제 OpenAI 대신 /v1/chat/completions를 흉내 내어, 비용과 OpenAI 응답 편차 없이
+/api/v1/chat/stream, /api/v1/diary/{id}/feedback의 처리량을 반복해서 측정할 수 있게 한다.
+
+실행:
+    python -m test.openai_stub --port 8001 --first-token-latency 0.3 --tokens-per-second 50
+
+앱 설정 (.env):
+    OPENAI_BASE_URL=http://localhost:8001/v1
+
+실행 중 설정 변경/통계:
+    POST /stub/config  {"error_rate": 0.05}
+    GET  /stub/stats
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+import uuid
+from typing import AsyncIterator, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CANNED_RESPONSE = (
+    "Great job! Your sentence is almost correct. A native speaker would say it a little differently: "
+    "\"I went to the park yesterday and met my friend.\" Use the past tense \"went\" because the action "
+    "finished in the past, and put \"yesterday\" at the end of the clause to sound more natural. "
+    "Keep practicing and try writing one more sentence about what you did after that."
+)
+
+
+class StubConfig(BaseModel):
+    """스텁 응답 설정"""
+
+    first_token_latency: float = Field(0.3, ge=0, description="첫 토큰까지 지연(초)")
+    latency_jitter: float = Field(0.1, ge=0, description="첫 토큰 지연에 더할 최대 무작위 지연(초)")
+    tokens_per_second: float = Field(50.0, gt=0, description="스트리밍 속도 (초당 토큰 수)")
+    error_rate: float = Field(0.0, ge=0, le=1, description="500 오류 비율")
+    rate_limit_rate: float = Field(0.0, ge=0, le=1, description="429 오류 비율")
+    retry_after: float = Field(1.0, ge=0, description="429 응답의 Retry-After(초)")
+    mode: str = Field("canned", pattern="^(canned|echo)$", description="canned: 고정 응답, echo: 마지막 사용자 메시지 반복")
+    response_tokens: int = Field(120, ge=1, description="canned 응답 토큰 수 (고정 응답을 반복해 채움)")
+    seed: Optional[int] = Field(None, description="난수 시드 (지정하면 지연/오류 발생 순서가 재현됨)")
+
+
+class StubStats:
+    """스텁 서버 누적 통계"""
+
+    def __init__(self):
+        self.requests = 0
+        self.streams = 0
+        self.active = 0
+        self.max_active = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.tokens = 0
+        self.started = time.monotonic()
+
+    def to_dict(self) -> Dict:
+        elapsed = time.monotonic() - self.started
+        return {
+            "requests": self.requests,
+            "streams": self.streams,
+            "active": self.active,
+            "max_active": self.max_active,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "tokens": self.tokens,
+            "tokens_per_second": round(self.tokens / elapsed, 2) if elapsed else 0.0,
+            "uptime": round(elapsed, 3)
+        }
+
+
+def _config_from_env() -> StubConfig:
+    """STUB_ 접두사 환경변수로 설정 생성 (예: STUB_TOKENS_PER_SECOND=100)"""
+    values = {}
+    for name in StubConfig.model_fields:
+        value = os.getenv(f"STUB_{name.upper()}")
+        if value is not None:
+            values[name] = value
+    return StubConfig(**values)
+
+
+app = FastAPI(title="OpenAI stub")
+app.state.config = _config_from_env()
+app.state.stats = StubStats()
+app.state.random = random.Random(app.state.config.seed)
+
+
+def _tokens(messages: List[Dict], max_tokens: Optional[int]) -> List[str]:
+    """응답 토큰 목록 (단어 하나를 토큰 하나로 취급)"""
+    config: StubConfig = app.state.config
+    if config.mode == "echo":
+        user_messages = [message for message in messages if message.get("role") == "user"]
+        text = user_messages[-1].get("content", "") if user_messages else ""
+        words = text.split() or ["(empty)"]
+    else:
+        canned = CANNED_RESPONSE.split()
+        words = [canned[index % len(canned)] for index in range(config.response_tokens)]
+
+    tokens = [words[0]] + [f" {word}" for word in words[1:]]
+    if max_tokens:
+        tokens = tokens[:max_tokens]
+    return tokens
+
+
+def _error(status_code: int, message: str, error_type: str, code: Optional[str],
+           headers: Optional[Dict] = None) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"error": {"message": message, "type": error_type, "param": None, "code": code}},
+        headers=headers
+    )
+
+
+def _chunk(completion_id: str, created: int, model: str, delta: Dict, finish_reason: Optional[str] = None) -> str:
+    payload = {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": created,
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "logprobs": None, "finish_reason": finish_reason}]
+    }
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+async def _stream(completion_id: str, created: int, model: str, tokens: List[str],
+                  finish_reason: str, first_token_delay: float) -> AsyncIterator[str]:
+    config: StubConfig = app.state.config
+    stats: StubStats = app.state.stats
+    stats.active += 1
+    stats.max_active = max(stats.max_active, stats.active)
+    try:
+        yield _chunk(completion_id, created, model, {"role": "assistant", "content": ""})
+        await asyncio.sleep(first_token_delay)
+        interval = 1 / config.tokens_per_second
+        for index, token in enumerate(tokens):
+            if index:
+                await asyncio.sleep(interval)
+            stats.tokens += 1
+            yield _chunk(completion_id, created, model, {"content": token})
+        yield _chunk(completion_id, created, model, {}, finish_reason)
+        yield "data: [DONE]\n\n"
+    finally:
+        stats.active -= 1
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    """채팅 완성 (stream=true면 SSE 스트리밍)"""
+    config: StubConfig = app.state.config
+    stats: StubStats = app.state.stats
+    rng: random.Random = app.state.random
+    stats.requests += 1
+
+    body = await request.json()
+    model = body.get("model", "gpt-4o-mini")
+    messages = body.get("messages", [])
+    max_tokens = body.get("max_tokens") or body.get("max_completion_tokens")
+
+    # 오류 주입 (429가 먼저)
+    roll = rng.random()
+    if roll < config.rate_limit_rate:
+        stats.rate_limited += 1
+        return _error(429, "Rate limit reached (stub)", "requests", "rate_limit_exceeded",
+                      headers={"retry-after": str(config.retry_after)})
+    if roll < config.rate_limit_rate + config.error_rate:
+        stats.errors += 1
+        return _error(500, "The server had an error while processing your request (stub)", "server_error", None)
+
+    tokens = _tokens(messages, max_tokens)
+    full_length = len(_tokens(messages, None))
+    finish_reason = "length" if len(tokens) < full_length else "stop"
+    first_token_delay = config.first_token_latency + rng.uniform(0, config.latency_jitter)
+    completion_id = f"chatcmpl-stub-{uuid.uuid4().hex[:24]}"
+    created = int(time.time())
+
+    if body.get("stream"):
+        stats.streams += 1
+        return StreamingResponse(
+            _stream(completion_id, created, model, tokens, finish_reason, first_token_delay),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"}
+        )
+
+    # 비스트리밍 응답은 전체 생성 시간만큼 기다린 뒤 한 번에 반환
+    await asyncio.sleep(first_token_delay + (len(tokens) - 1) / config.tokens_per_second)
+    stats.tokens += len(tokens)
+    prompt_tokens = sum(len(str(message.get("content", "")).split()) + 4 for message in messages)
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": created,
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": "".join(tokens)},
+            "logprobs": None,
+            "finish_reason": finish_reason
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(tokens),
+            "total_tokens": prompt_tokens + len(tokens)
+        }
+    }
+
+
+@app.get("/v1/models")
+async def list_models():
+    """모델 목록"""
+    created = int(app.state.stats.started)
+    return {
+        "object": "list",
+        "data": [
+            {"id": model, "object": "model", "created": created, "owned_by": "stub"}
+            for model in ("gpt-4o", "gpt-4o-mini")
+        ]
+    }
+
+
+@app.get("/stub/config")
+async def get_config():
+    """현재 스텁 설정"""
+    return app.state.config
+
+
+@app.post("/stub/config")
+async def update_config(changes: Dict):
+    """스텁 설정 일부 변경 (seed를 바꾸면 난수 순서도 다시 시작)"""
+    config = StubConfig(**{**app.state.config.model_dump(), **changes})
+    app.state.config = config
+    if "seed" in changes:
+        app.state.random = random.Random(config.seed)
+    logger.info(f"Stub config updated: {config.model_dump()}")
+    return config
+
+
+@app.get("/stub/stats")
+async def get_stats():
+    """누적 통계"""
+    return app.state.stats.to_dict()
+
+
+@app.post("/stub/stats/reset")
+async def reset_stats():
+    """누적 통계 초기화"""
+    app.state.stats = StubStats()
+    return app.state.stats.to_dict()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호환 채팅 완성 스텁 서버")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8001)
+    defaults = app.state.config
+    for name, field in StubConfig.model_fields.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", dest=name, default=getattr(defaults, name),
+                            help=field.description)
+    args = parser.parse_args()
+
+    app.state.config = StubConfig(**{name: getattr(args, name) for name in StubConfig.model_fields})
+    app.state.random = random.Random(app.state.config.seed)
+    logger.info(f"Stub config: {app.state.config.model_dump()}")
+
+    import uvicorn
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,518 @@
+# utils/async_mysql_connector.py
+import asyncio
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import List, Dict, Optional, Union, Any, AsyncIterator
+
+import aiomysql
+from pymysql.err import MySQLError
+
+from configs.mysql_setting import MYSQL_CONFIG, MYSQL_POOL_CONFIG
+
+logger = logging.getLogger(__name__)
+
+Params = Union[tuple, dict, list, None]
+
+
+def _to_db_value(value: Any) -> Any:
+    """PyMySQL이 직접 변환하지 못하는 값(Enum 등) 정규화"""
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _normalize_params(params: Params) -> Params:
+    if isinstance(params, dict):
+        return {key: _to_db_value(value) for key, value in params.items()}
+    if isinstance(params, (list, tuple)):
+        return type(params)(_to_db_value(value) for value in params)
+    return params
+
+
+class AsyncMySQLPool:
+    """
+    이벤트 루프 전용 aiomysql 커넥션 풀 래퍼
+
+    동기 풀(utils.mysql_pool)과 같은 설정(MYSQL_POOL_CONFIG)을 공유하며,
+    체크아웃 대기 시간 제한과 pre-ping, 사용 통계를 제공한다.
+    """
+
+    def __init__(
+            self,
+            config: Dict,
+            pool_size: int = 10,
+            timeout: float = 30.0,
+            pre_ping: bool = True,
+            recycle: int = 3600
+    ):
+        self.config = config
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.pre_ping = pre_ping
+        self.recycle = recycle
+        self._pool: Optional[aiomysql.Pool] = None
+        self._lock = asyncio.Lock()
+
+        # 통계
+        self._checkouts = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._ping_failures = 0
+
+    async def _get_pool(self) -> aiomysql.Pool:
+        if self._pool is None:
+            async with self._lock:
+                if self._pool is None:
+                    self._pool = await aiomysql.create_pool(
+                        host=self.config['host'],
+                        port=self.config['port'],
+                        user=self.config['user'],
+                        password=self.config['password'],
+                        db=self.config['database'],
+                        charset='utf8mb4',
+                        autocommit=True,
+                        minsize=1,
+                        maxsize=self.pool_size,
+                        pool_recycle=self.recycle if self.recycle > 0 else -1,
+                        cursorclass=aiomysql.DictCursor
+                    )
+                    logger.info(
+                        f"MySQL 비동기 커넥션 풀 생성: size={self.pool_size}, timeout={self.timeout}s, "
+                        f"pre_ping={self.pre_ping}, recycle={self.recycle}s"
+                    )
+        return self._pool
+
+    async def acquire(self) -> aiomysql.Connection:
+        """
+        풀에서 연결을 빌린다
+
+        Raises:
+            asyncio.TimeoutError: timeout 내에 연결을 얻지 못한 경우
+        """
+        pool = await self._get_pool()
+        started = time.monotonic()
+        try:
+            connection = await asyncio.wait_for(pool.acquire(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            logger.error(f"MySQL 비동기 커넥션 풀 대기 시간 초과 ({self.timeout}초, pool_size={self.pool_size})")
+            raise
+
+        wait_time = time.monotonic() - started
+        self._checkouts += 1
+        self._total_wait += wait_time
+        self._max_wait = max(self._max_wait, wait_time)
+
+        if self.pre_ping:
+            try:
+                await connection.ping(reconnect=True)
+            except MySQLError:
+                self._ping_failures += 1
+                pool.release(connection)
+                raise
+        return connection
+
+    async def release(self, connection: aiomysql.Connection) -> None:
+        """빌린 연결을 풀에 반환"""
+        if self._pool is not None and connection is not None:
+            await self._pool.release(connection)
+
+    async def close(self) -> None:
+        """풀의 모든 연결 종료"""
+        if self._pool is not None:
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
+            logger.info("MySQL 비동기 커넥션 풀 종료")
+
+    def stats(self) -> Dict:
+        """풀 사용 통계"""
+        size = self._pool.size if self._pool else 0
+        idle = self._pool.freesize if self._pool else 0
+        return {
+            "pool_size": self.pool_size,
+            "opened": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "checkouts": self._checkouts,
+            "timeouts": self._timeouts,
+            "avg_wait_ms": round(self._total_wait / self._checkouts * 1000, 3) if self._checkouts else 0.0,
+            "max_wait_ms": round(self._max_wait * 1000, 3),
+            "ping_failures": self._ping_failures
+        }
+
+
+# 이벤트 루프 -> 풀 (id(loop)는 닫힌 루프의 id가 재사용될 수 있어 루프 객체를 약한 참조 키로 쓴다)
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncMySQLPool]" = weakref.WeakKeyDictionary()
+
+
+def _prune_closed_loops(pools: weakref.WeakKeyDictionary) -> None:
+    """
+    닫힌 이벤트 루프의 항목 제거
+
+    풀의 연결이 루프를 참조하므로 약한 참조만으로는 항목이 풀리지 않는다.
+    닫힌 루프에서는 연결을 정상 종료할 수 없으므로 참조만 버린다.
+    """
+    for loop in [loop for loop in list(pools.keys()) if loop.is_closed()]:
+        pools.pop(loop, None)
+
+
+def get_async_pool() -> AsyncMySQLPool:
+    """현재 이벤트 루프의 비동기 커넥션 풀 반환 (루프마다 하나)"""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        _prune_closed_loops(_pools)
+        pool = _pools.setdefault(loop, AsyncMySQLPool(MYSQL_CONFIG, **MYSQL_POOL_CONFIG))
+    return pool
+
+
+def get_async_pool_stats() -> Optional[Dict]:
+    """현재 이벤트 루프의 비동기 풀 통계 (풀이 없으면 None)"""
+    try:
+        pool = _pools.get(asyncio.get_running_loop())
+    except RuntimeError:
+        return None
+    return pool.stats() if pool else None
+
+
+async def close_async_pool() -> None:
+    """현재 이벤트 루프의 비동기 커넥션 풀 종료"""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool:
+        await pool.close()
+
+
+class AsyncMySQLConnector:
+    """
+    MySQLConnector의 비동기 버전
+
+    이벤트 루프를 막지 않도록 aiomysql 풀을 사용한다. 트랜잭션 밖에서는 쿼리마다
+    연결을 빌렸다가 바로 반환하고, transaction() 또는 begin_transaction() 이후에는
+    하나의 연결을 점유한다.
+    """
+
+    def __init__(self, connection: Optional[aiomysql.Connection] = None):
+        self._connection = connection  # 트랜잭션 동안 점유하는 연결
+        self.is_transaction_active = connection is not None
+
+    @property
+    def pool(self) -> AsyncMySQLPool:
+        return get_async_pool()
+
+    @asynccontextmanager
+    async def _borrow(self):
+        """쿼리 실행용 연결 대여 (트랜잭션 중이면 트랜잭션 연결 사용)"""
+        if self._connection is not None and self.is_transaction_active:
+            yield self._connection
+            return
+
+        pool = self.pool
+        connection = await pool.acquire()
+        try:
+            yield connection
+        finally:
+            await pool.release(connection)
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        트랜잭션 컨텍스트
+
+        블록이 정상 종료되면 커밋, 예외가 발생하면 롤백한다.
+
+        Yields:
+            AsyncMySQLConnector: 트랜잭션 연결에 바인딩된 커넥터
+        """
+        if self.is_transaction_active:
+            # 중첩 트랜잭션은 바깥 트랜잭션에 합류
+            yield self
+            return
+
+        pool = self.pool
+        connection = await pool.acquire()
+        try:
+            await connection.begin()
+            tx = AsyncMySQLConnector(connection)
+            try:
+                yield tx
+            except BaseException:
+                await connection.rollback()
+                raise
+            else:
+                await connection.commit()
+            finally:
+                tx.is_transaction_active = False
+        finally:
+            await pool.release(connection)
+
+    async def begin_transaction(self):
+        """트랜잭션 시작"""
+        if self.is_transaction_active:
+            logger.debug("Transaction already in progress, skipping new transaction")
+            return
+        self._connection = await self.pool.acquire()
+        await self._connection.begin()
+        self.is_transaction_active = True
+
+    async def commit_transaction(self):
+        """트랜잭션 커밋"""
+        if self._connection is not None and self.is_transaction_active:
+            try:
+                await self._connection.commit()
+            finally:
+                await self._end_transaction()
+
+    async def rollback_transaction(self):
+        """트랜잭션 롤백"""
+        if self._connection is not None and self.is_transaction_active:
+            try:
+                await self._connection.rollback()
+            finally:
+                await self._end_transaction()
+
+    async def _end_transaction(self):
+        self.is_transaction_active = False
+        connection, self._connection = self._connection, None
+        await self.pool.release(connection)
+
+    async def close(self):
+        """미완료 트랜잭션이 있으면 롤백하고 연결 반환"""
+        if self.is_transaction_active:
+            logger.warning("Closing connector with an open transaction, rolling back")
+            await self.rollback_transaction()
+
+    async def fetch_all(self, query: str, params: Params = None) -> List[Dict]:
+        """SELECT 쿼리 실행 후 전체 결과 반환"""
+        async with self._borrow() as connection:
+            async with connection.cursor() as cursor:
+                try:
+                    await cursor.execute(query, _normalize_params(params))
+                    return list(await cursor.fetchall())
+                except MySQLError as e:
+                    logger.error(f"쿼리 실행 오류: {e}")
+                    raise
+
+    async def fetch_one(self, query: str, params: Params = None) -> Optional[Dict]:
+        """SELECT 쿼리 실행 후 첫 행 반환"""
+        async with self._borrow() as connection:
+            async with connection.cursor() as cursor:
+                try:
+                    await cursor.execute(query, _normalize_params(params))
+                    return await cursor.fetchone()
+                except MySQLError as e:
+                    logger.error(f"쿼리 실행 오류: {e}")
+                    raise
+
+    async def execute(self, query: str, params: Params = None) -> Dict:
+        """
+        INSERT/UPDATE/DELETE 등 변경 쿼리 실행
+
+        Returns:
+            Dict: 영향받은 행 수와 마지막 삽입된 ID
+        """
+        async with self._borrow() as connection:
+            async with connection.cursor() as cursor:
+                try:
+                    await cursor.execute(query, _normalize_params(params))
+                    return {
+                        'id': cursor.lastrowid,
+                        'affected_rows': cursor.rowcount
+                    }
+                except MySQLError as e:
+                    logger.error(f"쿼리 실행 오류: {e}")
+                    raise
+
+    async def stream_query(self,
+                           query: str,
+                           params: Params = None,
+                           batch_size: int = 1000,
+                           as_tuples: bool = False,
+                           yield_batches: bool = False) -> AsyncIterator[Any]:
+        """
+        대용량 SELECT 결과를 서버 측(unbuffered) 커서로 스트리밍
+
+        MySQLConnector.stream_query의 비동기 버전. async for 루프를 중간에 빠져나오면
+        aclose()를 호출해야 연결이 즉시 풀로 반환된다.
+
+        Yields:
+            행(dict 또는 tuple) 또는 행 리스트
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size는 1 이상이어야 합니다.")
+
+        cursor_class = aiomysql.SSCursor if as_tuples else aiomysql.SSDictCursor
+        async with self._borrow() as connection:
+            async with connection.cursor(cursor_class) as cursor:
+                try:
+                    await cursor.execute(query, _normalize_params(params))
+                    while True:
+                        rows = await cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        if yield_batches:
+                            yield list(rows)
+                        else:
+                            for row in rows:
+                                yield row
+                except MySQLError as e:
+                    logger.error(f"스트리밍 쿼리 실행 오류: {e}")
+                    raise
+
+    async def select(self,
+                     table: str,
+                     columns: List[str] = None,
+                     where: Dict = None,
+                     order_by: str = None,
+                     limit: int = None) -> List[Dict]:
+        """SELECT 쿼리 실행 (MySQLConnector.select와 동일한 규칙)"""
+        columns_str = ", ".join(columns) if columns else "*"
+        query = f"SELECT {columns_str} FROM {table}"
+        params = {}
+
+        if where:
+            conditions = []
+            for key, value in where.items():
+                conditions.append(f"{key} = %({key})s")
+                params[key] = value
+            query += " WHERE " + " AND ".join(conditions)
+
+        if order_by:
+            query += f" ORDER BY {order_by}"
+
+        if limit:
+            query += f" LIMIT {int(limit)}"
+
+        return await self.fetch_all(query, params)
+
+    @staticmethod
+    def _build_insert_query(table: str,
+                            columns: List[str],
+                            row_count: int,
+                            on_duplicate_update: Optional[List[str]] = None) -> str:
+        """다중 행 INSERT 쿼리 생성 (MySQLConnector._build_insert_query와 동일)"""
+        row_placeholder = "(" + ", ".join(["%s"] * len(columns)) + ")"
+        query = (f"INSERT INTO {table} ({', '.join(columns)}) "
+                 f"VALUES {', '.join([row_placeholder] * row_count)}")
+
+        if on_duplicate_update:
+            updates = ", ".join(f"{col} = new.{col}" for col in on_duplicate_update)
+            query += f" AS new ON DUPLICATE KEY UPDATE {updates}"
+        return query
+
+    async def insert(self,
+                     table: str,
+                     data: Union[Dict[str, Any], List[Dict[str, Any]]],
+                     chunk_size: int = 500,
+                     on_duplicate_update: Optional[List[str]] = None) -> Dict:
+        """
+        INSERT 쿼리 실행
+
+        여러 행은 chunk_size 단위의 다중 행 INSERT로 나누어 전송한다.
+        청크가 여러 개면 하나의 트랜잭션으로 묶는다 (진행 중인 트랜잭션이 있으면 합류).
+
+        Args:
+            table (str): 테이블 이름
+            data (Union[Dict, List[Dict]]): 삽입할 데이터 (모든 행의 컬럼이 같아야 함)
+            chunk_size (int): 한 번의 INSERT 문에 담을 최대 행 수
+            on_duplicate_update (List[str]): 키 중복 시 갱신할 컬럼 (ON DUPLICATE KEY UPDATE)
+
+        Returns:
+            Dict: 마지막 삽입된 ID, 생성된 ID 목록, 영향받은 행 수
+                  (upsert 모드에서는 갱신된 행의 ID를 알 수 없으므로 ids가 비어있음)
+        """
+        if not data:
+            raise ValueError("데이터가 비어있습니다.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size는 1 이상이어야 합니다.")
+
+        if isinstance(data, dict):
+            data = [data]
+
+        columns = list(data[0].keys())
+        for row in data:
+            if row.keys() != data[0].keys():
+                raise ValueError("모든 행의 컬럼 구성이 같아야 합니다.")
+
+        chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+        if len(chunks) == 1:
+            return await self._insert_chunks(self, table, columns, chunks, on_duplicate_update)
+
+        async with self.transaction() as tx:
+            return await self._insert_chunks(tx, table, columns, chunks, on_duplicate_update)
+
+    @staticmethod
+    async def _insert_chunks(db: 'AsyncMySQLConnector',
+                             table: str,
+                             columns: List[str],
+                             chunks: List[List[Dict[str, Any]]],
+                             on_duplicate_update: Optional[List[str]]) -> Dict:
+        ids = []
+        last_id = None
+        affected_rows = 0
+
+        for chunk in chunks:
+            query = db._build_insert_query(table, columns, len(chunk), on_duplicate_update)
+            params = [row[col] for row in chunk for col in columns]
+            result = await db.execute(query, params)
+            affected_rows += result['affected_rows']
+
+            if result['id']:
+                if on_duplicate_update:
+                    last_id = result['id']
+                else:
+                    # 다중 행 INSERT의 lastrowid는 첫 행의 ID이며, 한 문장 안의 ID는 연속으로 할당된다
+                    ids.extend(range(result['id'], result['id'] + len(chunk)))
+                    last_id = ids[-1]
+
+        return {
+            'id': last_id,
+            'ids': ids,
+            'affected_rows': affected_rows
+        }
+
+    async def update(self, table: str, data: Dict, where: Dict) -> Dict:
+        """
+        UPDATE 쿼리 실행
+
+        Returns:
+            Dict: 영향받은 행 수
+        """
+        if not data or not where:
+            raise ValueError("데이터와 조건이 모두 필요합니다.")
+
+        set_clauses = []
+        params = {}
+
+        for key, value in data.items():
+            set_clauses.append(f"{key} = %({key})s")
+            params[key] = value
+
+        where_clauses = []
+        for key, value in where.items():
+            where_key = f"where_{key}"  # 파라미터 이름 충돌 방지
+            where_clauses.append(f"{key} = %({where_key})s")
+            params[where_key] = value
+
+        query = f"UPDATE {table} SET {', '.join(set_clauses)} WHERE {' AND '.join(where_clauses)}"
+        result = await self.execute(query, params)
+        return {'affected_rows': result['affected_rows']}
+
+    async def delete(self, table: str, where: Dict) -> Dict:
+        """
+        DELETE 쿼리 실행
+
+        Returns:
+            Dict: 영향받은 행 수
+        """
+        if not where:
+            raise ValueError("삭제 조건이 필요합니다.")
+
+        where_clause = " AND ".join([f"{key} = %({key})s" for key in where.keys()])
+        query = f"DELETE FROM {table} WHERE {where_clause}"
+        result = await self.execute(query, where)
+        return {'affected_rows': result['affected_rows']}
@@ -6,9 +6,9 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from pydantic import BaseModel
 
-from apis.deps import get_db
+from apis.deps import get_async_db
 from configs.jwt_setting import JWT_CONFIG
-from utils.mysql_connector import MySQLConnector
+from utils.async_mysql_connector import AsyncMySQLConnector
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=True)
 
@@ -48,7 +48,7 @@ async def verify_token(token: str = Depends(oauth2_scheme)) -> dict:
 
 async def get_current_user(
         token: str = Depends(oauth2_scheme),
-        db: MySQLConnector = Depends(get_db)
+        db: AsyncMySQLConnector = Depends(get_async_db)
 ) -> User:
     """현재 사용자 정보 조회"""
     credentials_exception = HTTPException(
@@ -76,12 +76,12 @@ async def get_current_user(
                    AND email = %(email)s
                    AND is_active = 'Y'
                """
-        result = db.execute_raw_query(query, {"user_id": user_id, "email": email})
+        result = await db.fetch_one(query, {"user_id": user_id, "email": email})
 
         if not result:
             raise credentials_exception
 
-        return User(**result[0])
+        return User(**result)
 
     except JWTError:
         raise credentials_exception
@@ -0,0 +1,168 @@
+# utils/cache_codec.py
+import json
+import logging
+import zlib
+from datetime import datetime
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# 저장 형식: MAGIC + 코덱 ID(1바이트) + 압축 ID(1바이트) + 본문
+# 태그가 없는 값은 이전 버전이 저장한 JSON 문자열로 보고 그대로 읽는다.
+MAGIC = b"\x01"
+
+CODEC_JSON = b"j"
+CODEC_MSGPACK = b"m"
+
+COMPRESSION_NONE = b"-"
+COMPRESSION_ZLIB = b"z"
+COMPRESSION_ZSTD = b"s"
+
+
+class CodecError(Exception):
+    """캐시 값 인코딩/디코딩 실패"""
+    pass
+
+
+def _default(obj: Any) -> Any:
+    """기본 직렬화가 지원하지 않는 타입 처리"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def _json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=_default).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class CacheCodec:
+    """
+    캐시 값 직렬화/압축 코덱
+
+    JSON(orjson이 있으면 orjson) 또는 msgpack으로 직렬화하고,
+    본문이 compress_threshold 바이트 이상이면 zstd(없으면 zlib)로 압축한다.
+    저장 값 앞에 형식 태그를 붙이므로 코덱 설정을 바꿔도 기존 값을 읽을 수 있다.
+    """
+
+    def __init__(self, codec: str = "json", compress_threshold: int = 1024, compression: str = "zstd",
+                 compression_level: Optional[int] = None):
+        """
+        코덱 초기화
+
+        Args:
+            codec: 직렬화 형식 ("json" 또는 "msgpack")
+            compress_threshold: 압축을 적용할 최소 본문 크기(바이트), 0 이하면 압축하지 않음
+            compression: 압축 방식 ("zstd" 또는 "zlib")
+            compression_level: 압축 레벨 (None이면 방식별 기본값)
+        """
+        if codec not in ("json", "msgpack"):
+            raise ValueError(f"지원하지 않는 코덱입니다: {codec}")
+        if compression not in ("zstd", "zlib"):
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+
+        if codec == "msgpack" and msgpack is None:
+            logger.warning("msgpack이 설치되어 있지 않아 JSON 코덱을 사용합니다.")
+            codec = "json"
+        if compression == "zstd" and zstandard is None:
+            logger.warning("zstandard가 설치되어 있지 않아 zlib 압축을 사용합니다.")
+            compression = "zlib"
+
+        self.codec = codec
+        self.compress_threshold = compress_threshold
+        self.compression = compression
+        self.compression_level = compression_level
+
+        self._codec_id = CODEC_MSGPACK if codec == "msgpack" else CODEC_JSON
+        if compression == "zstd":
+            self._compression_id = COMPRESSION_ZSTD
+            self._zstd_compressor = zstandard.ZstdCompressor(level=compression_level or 3)
+        else:
+            self._compression_id = COMPRESSION_ZLIB
+            self._zstd_compressor = None
+
+    def encode(self, value: Any) -> bytes:
+        """
+        값을 태그가 붙은 바이트로 인코딩
+
+        Raises:
+            CodecError: 직렬화할 수 없는 값인 경우
+        """
+        try:
+            if self._codec_id == CODEC_MSGPACK:
+                body = msgpack.packb(value, default=_default, use_bin_type=True)
+            else:
+                body = _json_dumps(value)
+        except (TypeError, ValueError) as e:
+            raise CodecError(str(e)) from e
+
+        if 0 < self.compress_threshold <= len(body):
+            compressed = self._compress(body)
+            if len(compressed) < len(body):
+                return MAGIC + self._codec_id + self._compression_id + compressed
+
+        return MAGIC + self._codec_id + COMPRESSION_NONE + body
+
+    def _compress(self, body: bytes) -> bytes:
+        if self._zstd_compressor is not None:
+            return self._zstd_compressor.compress(body)
+        level = self.compression_level if self.compression_level is not None else 6
+        return zlib.compress(body, level)
+
+    @staticmethod
+    def decode(data: bytes) -> Any:
+        """
+        저장된 바이트를 값으로 디코딩 (태그 없는 이전 JSON 값도 지원)
+
+        Raises:
+            CodecError: 형식이 잘못되었거나 필요한 라이브러리가 없는 경우
+        """
+        try:
+            if not data.startswith(MAGIC) or len(data) < 3:
+                return _json_loads(data)
+
+            codec_id, compression_id, body = data[1:2], data[2:3], data[3:]
+
+            if compression_id == COMPRESSION_ZLIB:
+                body = zlib.decompress(body)
+            elif compression_id == COMPRESSION_ZSTD:
+                if zstandard is None:
+                    raise CodecError("zstd로 압축된 값이지만 zstandard가 설치되어 있지 않습니다.")
+                body = zstandard.ZstdDecompressor().decompress(body)
+            elif compression_id != COMPRESSION_NONE:
+                raise CodecError(f"알 수 없는 압축 형식: {compression_id!r}")
+
+            if codec_id == CODEC_JSON:
+                return _json_loads(body)
+            if codec_id == CODEC_MSGPACK:
+                if msgpack is None:
+                    raise CodecError("msgpack으로 저장된 값이지만 msgpack이 설치되어 있지 않습니다.")
+                return msgpack.unpackb(body, raw=False)
+            raise CodecError(f"알 수 없는 코덱 형식: {codec_id!r}")
+
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(str(e)) from e
@@ -1,21 +1,84 @@
 # utils/cache_manager.py
+import asyncio
 import json
 import logging
-from datetime import datetime
-from typing import Optional, Any, Dict, List, Union
+import math
+import random
+import threading
+import time
+import uuid
+import weakref
+from typing import Optional, Any, Awaitable, Callable, Dict, List, Union, Tuple
 
 import redis
+import redis.asyncio as aioredis
 from redis.client import Pipeline
 from redis.exceptions import RedisError
 
+from chat.constants import CACHE_KEY_FAMILIES, LOCAL_CACHE_KEY_PREFIXES
+from configs.openai_setting import OpenAISettings
+from utils.cache_codec import CacheCodec, CodecError
+from utils.cache_metrics import CacheMetrics
+from utils.local_cache import LocalCache
+
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# get_or_compute로 저장한 값의 봉투 표시 (값과 함께 재계산 소요 시간/만료 시각을 보관)
+_ENVELOPE_MARKER = "__xfetch__"
+
+# 토큰이 일치할 때만 락 해제
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# KEYS[1]: 태그를 붙일 키, KEYS[2..]: 태그 집합 키, ARGV[1]: 키 TTL(초)
+# 태그 집합 TTL은 멤버 중 가장 긴 TTL 이상으로만 늘린다
+_TAG_SCRIPT = """
+local ttl = tonumber(ARGV[1])
+for i = 2, #KEYS do
+    redis.call('sadd', KEYS[i], KEYS[1])
+    if redis.call('ttl', KEYS[i]) < ttl then
+        redis.call('expire', KEYS[i], ttl)
+    end
+end
+return #KEYS - 1
+"""
+
+# 태그 무효화 시 한 번에 지우는 멤버 키 수
+_TAG_BATCH_SIZE = 500
+
+# KEYS[1]: 리스트 키, KEYS[2]: 버전 키, ARGV[1]: 조회 시작 시점의 버전, ARGV[2]: TTL(초), ARGV[3..]: 원소
+# 조회하는 동안 list_append로 원소가 추가되었으면(버전 변경) 오래된 내용으로 덮어쓰지 않는다
+_LIST_FILL_SCRIPT = """
+local current = redis.call('get', KEYS[2]) or ''
+if current ~= ARGV[1] then
+    return 0
+end
+redis.call('del', KEYS[1])
+if #ARGV > 2 then
+    redis.call('rpush', KEYS[1], unpack(ARGV, 3))
+    redis.call('expire', KEYS[1], ARGV[2])
+end
+return 1
+"""
+
 
 class CacheManager:
     """
     Redis 캐시 관리를 위한 통합 클래스
 
     다양한 데이터 유형을 지원하고 성능 최적화 및 확장성을 고려한 설계
+    local_cache를 주면 Redis 앞에 프로세스 내 L1 계층을 두고 read-through/write-through로 동작한다.
+    list_* 메서드는 최근 N개만 유지하는 Redis 리스트(RPUSH + LTRIM)로 대화 기록처럼 뒤에 덧붙는 값을 다룬다.
+    set에 tags를 주면 태그별 Redis 집합(tag:{태그})에 키를 기록하고, invalidate_tag로 멤버 키만 정확히 지운다.
+    delete/delete_many/delete_pattern/invalidate_tag는 무효화 채널로 발행되어 다른 워커의 L1에서도 제거된다.
+    a로 시작하는 메서드(aget, aset, adelete ...)는 redis.asyncio 클라이언트를 쓰는 비동기 버전으로,
+    같은 설정/L1/코덱을 공유하고 이벤트 루프마다 별도 연결 풀을 가진다.
     """
 
     def __init__(
@@ -24,7 +87,12 @@ class CacheManager:
             ttl: int = 3600,
             connection_pool_kwargs: Optional[Dict] = None,
             reconnect_attempts: int = 3,
-            reconnect_delay: int = 1
+            reconnect_delay: int = 1,
+            local_cache: Optional[LocalCache] = None,
+            local_key_prefixes: Optional[Tuple[str, ...]] = None,
+            invalidation_channel: str = "cache:invalidate",
+            codec: Optional[CacheCodec] = None,
+            key_families: Optional[Dict[str, str]] = None
     ):
         """
         캐시 매니저 초기화
@@ -35,6 +103,11 @@ class CacheManager:
             connection_pool_kwargs: Redis 연결 풀 설정
             reconnect_attempts: 연결 재시도 횟수
             reconnect_delay: 재시도 간 딜레이(초)
+            local_cache: 프로세스 내 L1 캐시 (None이면 Redis만 사용)
+            local_key_prefixes: L1에 보관할 키 접두사 (None이면 모든 키)
+            invalidation_channel: 워커 간 무효화 이벤트를 주고받을 pub/sub 채널
+            codec: 값 직렬화/압축 코덱 (None이면 JSON, 1KB 이상 압축)
+            key_families: 지표 집계용 {계열 이름: 키 템플릿} (없으면 키 접두사로 계열 구분)
         """
         self.redis_url = redis_url
         self.ttl = ttl
@@ -43,9 +116,29 @@ class CacheManager:
         self._connection_pool_kwargs = connection_pool_kwargs or {}
         self._reconnect_attempts = reconnect_attempts
         self._reconnect_delay = reconnect_delay
+        self._local = local_cache
+        self._local_key_prefixes = tuple(local_key_prefixes) if local_key_prefixes else None
+        self._codec = codec or CacheCodec()
+        self._invalidation_channel = invalidation_channel
+        self._instance_id = uuid.uuid4().hex
+        self._listener = None
+
+        # get_or_compute 단일 비행(single-flight) 상태
+        self._flight_locks: Dict[str, List] = {}  # key -> [lock, 대기 스레드 수]
+        self._flight_guard = threading.Lock()
+        self._async_flights: Dict[str, asyncio.Future] = {}
+
+        # 키 계열별 적중/미스, 지연, 직렬화 지표
+        self.metrics = CacheMetrics(key_families)
+
+        # 이벤트 루프별 redis.asyncio 클라이언트 (연결이 루프에 묶이므로 루프마다 분리)
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aioredis.Redis]" = \
+            weakref.WeakKeyDictionary()
 
         if self.redis_url:
             self._initialize_connection()
+            if self._is_available and self._local is not None:
+                self._start_invalidation_listener()
 
     def _initialize_connection(self) -> None:
         """Redis 연결 초기화 및 재시도 로직"""
@@ -70,7 +163,6 @@ class CacheManager:
                 )
 
                 if attempts < self._reconnect_attempts:
-                    import time
                     time.sleep(self._reconnect_delay)
                 else:
                     logger.error("Failed to initialize Redis cache after multiple attempts")
@@ -86,24 +178,197 @@ class CacheManager:
         """Redis 클라이언트 인스턴스 반환"""
         return self._redis if self._is_available else None
 
-    def _serialize(self, value: Any) -> str:
+    @property
+    def async_client(self) -> Optional[aioredis.Redis]:
+        """현재 이벤트 루프용 비동기 Redis 클라이언트 반환 (이벤트 루프 안에서만 호출)"""
+        return self._async_client() if self._is_available else None
+
+    @property
+    def local_cache(self) -> Optional[LocalCache]:
+        """L1 로컬 캐시 인스턴스 반환"""
+        return self._local
+
+    def _is_local_key(self, key: str) -> bool:
+        """L1에 보관할 키인지 확인"""
+        if self._local is None:
+            return False
+        return self._local_key_prefixes is None or key.startswith(self._local_key_prefixes)
+
+    def _local_get(self, key: str) -> Any:
+        if not self._is_local_key(key):
+            return _MISSING
+        return self._local.get(key, _MISSING)
+
+    def _local_set(self, key: str, data: bytes, ttl: Optional[float], value: Any = _MISSING) -> None:
+        """
+        L1에 저장
+
+        호출자가 넘긴 객체를 그대로 보관하면 이후 호출자의 수정이 L1에 새어 들고,
+        L1 적중 값의 타입이 Redis 적중 값(역직렬화 결과)과 달라지므로
+        value를 주지 않으면 직렬화된 data를 되읽은 값을 보관한다.
+        """
+        if not self._is_local_key(key):
+            return
+        if value is _MISSING:
+            value = self._deserialize(data)
+            if value is None:
+                return
+        self._local.set(key, value, len(data), ttl)
+
+    @staticmethod
+    def _remaining_ttl(pttl: Optional[int]) -> Optional[float]:
+        """
+        Redis PTTL 응답을 L1 보관 시간(초)으로 변환
+
+        Returns:
+            남은 시간(초), 만료가 없으면 None(L1 기본값), 키가 사라졌으면 0(보관하지 않음)
+        """
+        if pttl is None or pttl == -1:
+            return None
+        if pttl < 0:
+            return 0
+        return pttl / 1000
+
+    def _local_evict(self, *keys: str) -> None:
+        if self._local is not None:
+            self._local.delete_many(keys)
+
+    def _record_deletes(self, keys) -> None:
+        for key in keys:
+            self.metrics.record_delete(key)
+
+    def _record_redis(self, key: str, started: float) -> None:
+        """Redis 왕복 지연 기록 (started는 time.perf_counter() 값)"""
+        self.metrics.record_redis(key, time.perf_counter() - started)
+
+    def hit_rates(self) -> Dict[str, Dict]:
         """
-        값을 JSON 문자열로 직렬화
+        키 계열별 조회 적중률
+
+        Returns:
+            {계열: {'hits', 'misses', 'hit_rate'}} 딕셔너리
+        """
+        return {
+            family: {
+                'hits': stats['hits'],
+                'misses': stats['misses'],
+                'hit_rate': stats['hit_rate']
+            }
+            for family, stats in self.metrics.snapshot().items()
+            if stats['lookups']
+        }
+
+    def stats(self) -> Dict:
+        """
+        캐시 사용 통계
+
+        Returns:
+            Redis/L1 상태와 키 계열별 지표(적중률, Redis 지연, 직렬화 시간, 값 크기)
+        """
+        return {
+            'redis_available': self.is_available,
+            'codec': self._codec.codec,
+            'local_cache': self._local.stats() if self._local is not None else None,
+            'families': self.metrics.snapshot()
+        }
+
+    def log_hit_rates(self) -> None:
+        """키 계열별 적중률을 로그로 남긴다"""
+        rates = self.hit_rates()
+        if not rates:
+            logger.info("Cache hit rates: no lookups yet")
+            return
+        for family, counts in rates.items():
+            logger.info(
+                f"Cache hit rate [{family}]: {counts['hit_rate']:.2%} "
+                f"(hits={counts['hits']}, misses={counts['misses']})"
+            )
+        if self._local is not None:
+            logger.info(f"Local cache stats: {self._local.stats()}")
+
+    def _start_invalidation_listener(self) -> None:
+        """무효화 채널을 구독하는 백그라운드 스레드 시작"""
+        try:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self._invalidation_channel: self._handle_invalidation})
+            self._listener = pubsub.run_in_thread(
+                sleep_time=1.0,
+                daemon=True,
+                exception_handler=self._handle_listener_error
+            )
+            logger.info(f"Cache invalidation listener started on '{self._invalidation_channel}'")
+        except RedisError as e:
+            logger.error(f"Failed to start cache invalidation listener: {str(e)}")
+
+    def _handle_invalidation(self, message: Dict) -> None:
+        """다른 워커가 발행한 무효화 이벤트를 받아 L1에서 제거"""
+        try:
+            event = json.loads(message['data'])
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Invalid cache invalidation message: {str(e)}")
+            return
+
+        if event.get('origin') == self._instance_id or self._local is None:
+            return
+        if event.get('keys'):
+            self._local.delete_many(event['keys'])
+        if event.get('pattern'):
+            self._local.delete_pattern(event['pattern'])
+
+    def _handle_listener_error(self, error: Exception, pubsub, thread) -> None:
+        """구독 연결 오류 시 놓친 이벤트가 있을 수 있으므로 L1 전체를 비운다 (재구독은 재연결 시 자동)"""
+        logger.warning(f"Cache invalidation listener error: {str(error)}")
+        if self._local is not None:
+            self._local.clear()
+        time.sleep(self._reconnect_delay)
+
+    def _publish_invalidation(self, keys: Optional[List[str]] = None, pattern: Optional[str] = None) -> None:
+        """다른 워커에 무효화 이벤트 발행"""
+        try:
+            self._redis.publish(self._invalidation_channel, json.dumps({
+                'origin': self._instance_id,
+                'keys': keys,
+                'pattern': pattern
+            }))
+        except RedisError as e:
+            logger.error(f"Cache invalidation publish error: {str(e)}")
+
+    def close(self) -> None:
+        """무효화 구독 스레드 종료"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def _serialize(self, value: Any, key: Optional[str] = None) -> bytes:
+        """
+        값을 코덱 형식 태그가 붙은 바이트로 직렬화
 
         Args:
             value: 직렬화할 값
+            key: 지표를 기록할 키 (None이면 기록하지 않음)
 
         Returns:
-            직렬화된 JSON 문자열
-        """
-        return json.dumps(value, default=self._json_serializer)
+            직렬화된 바이트
 
-    def _deserialize(self, data: Optional[bytes]) -> Optional[Any]:
+        Raises:
+            TypeError: 직렬화할 수 없는 값인 경우
+        """
+        started = time.perf_counter()
+        try:
+            data = self._codec.encode(value)
+        except CodecError as e:
+            raise TypeError(str(e)) from e
+        if key is not None:
+            self.metrics.record_serialize(key, time.perf_counter() - started, len(data))
+        return data
+
+    def _deserialize(self, data: Optional[bytes], key: Optional[str] = None) -> Optional[Any]:
         """
-        바이트 데이터를 파이썬 객체로 역직렬화
+        바이트 데이터를 파이썬 객체로 역직렬화 (태그 없는 이전 JSON 값도 읽음)
 
         Args:
             data: 역직렬화할 바이트 데이터
+            key: 지표를 기록할 키 (None이면 기록하지 않음)
 
         Returns:
             역직렬화된 파이썬 객체 또는 None
@@ -111,25 +376,24 @@ class CacheManager:
         if data is None:
             return None
 
+        started = time.perf_counter()
         try:
-            return json.loads(data)
-        except json.JSONDecodeError as e:
+            value = self._codec.decode(data)
+        except CodecError as e:
             logger.warning(f"Failed to deserialize data: {str(e)}")
+            if key is not None:
+                self.metrics.record_error(key)
             return None
+        if key is not None:
+            self.metrics.record_deserialize(key, time.perf_counter() - started, len(data))
+        return value
 
-    def _json_serializer(self, obj: Any) -> str:
-        """
-        기본 JSON 직렬화가 지원하지 않는 타입 처리
-
-        Args:
-            obj: 직렬화할 객체
-
-        Returns:
-            직렬화된 문자열
-        """
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"Type {type(obj)} not serializable")
+    @staticmethod
+    def _unwrap(value: Any) -> Any:
+        """get_or_compute 봉투라면 실제 값만 꺼낸다"""
+        if isinstance(value, dict) and value.get(_ENVELOPE_MARKER):
+            return value.get('value')
+        return value
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -141,14 +405,37 @@ class CacheManager:
         Returns:
             저장된 값 또는 None
         """
+        return self._unwrap(self._get_entry(key))
+
+    def _get_entry(self, key: str) -> Optional[Any]:
+        """L1 → Redis 순으로 저장된 값을 조회 (봉투를 벗기지 않음)"""
         if not self.is_available:
             return None
 
+        value = self._local_get(key)
+        if value is not _MISSING:
+            self.metrics.record_lookup(key, True, l1=True)
+            return value
+
         try:
-            data = self._redis.get(key)
-            return self._deserialize(data)
+            started = time.perf_counter()
+            if self._is_local_key(key):
+                # L1에는 Redis에 남은 만료 시간까지만 보관
+                with self._redis.pipeline(transaction=False) as pipe:
+                    pipe.get(key)
+                    pipe.pttl(key)
+                    data, pttl = pipe.execute()
+            else:
+                data, pttl = self._redis.get(key), None
+            self._record_redis(key, started)
+            value = self._deserialize(data, key)
+            self.metrics.record_lookup(key, value is not None)
+            if value is not None:
+                self._local_set(key, data, self._remaining_ttl(pttl), value)
+            return value
         except RedisError as e:
             logger.error(f"Cache get error for key '{key}': {str(e)}")
+            self.metrics.record_error(key)
             return None
 
     def mget(self, keys: List[str]) -> Dict[str, Any]:
@@ -164,13 +451,38 @@ class CacheManager:
         if not self.is_available or not keys:
             return {}
 
+        values = {}
+        missing = []
+        for key in keys:
+            value = self._local_get(key)
+            if value is _MISSING:
+                missing.append(key)
+            else:
+                self.metrics.record_lookup(key, True, l1=True)
+                values[key] = self._unwrap(value)
+
+        if not missing:
+            return values
+
         try:
-            result = self._redis.mget(keys)
-            return {
-                key: self._deserialize(value)
-                for key, value in zip(keys, result)
-                if value is not None
-            }
+            local_keys = [key for key in missing if self._is_local_key(key)]
+            started = time.perf_counter()
+            with self._redis.pipeline(transaction=False) as pipe:
+                pipe.mget(missing)
+                for key in local_keys:
+                    pipe.pttl(key)
+                result, *pttls = pipe.execute()
+            self._record_redis(missing[0], started)
+            remaining = dict(zip(local_keys, pttls))
+            for key, data in zip(missing, result):
+                self.metrics.record_lookup(key, data is not None)
+                if data is None:
+                    continue
+                value = self._deserialize(data, key)
+                values[key] = self._unwrap(value)
+                if value is not None:
+                    self._local_set(key, data, self._remaining_ttl(remaining.get(key)), value)
+            return values
         except RedisError as e:
             logger.error(f"Cache mget error: {str(e)}")
             return {}
@@ -180,7 +492,8 @@ class CacheManager:
             key: str,
             value: Any,
             ttl: Optional[int] = None,
-            nx: bool = False
+            nx: bool = False,
+            tags: Optional[List[str]] = None
     ) -> bool:
         """
         캐시에 값을 저장
@@ -190,6 +503,7 @@ class CacheManager:
             value: 저장할 값
             ttl: 만료 시간(초), None이면 기본값 사용
             nx: True면 키가 없을 때만 저장
+            tags: 키를 등록할 태그 목록 (invalidate_tag로 함께 무효화)
 
         Returns:
             저장 성공 여부
@@ -199,14 +513,26 @@ class CacheManager:
 
         try:
             ttl_value = ttl if ttl is not None else self.ttl
-            serialized = self._serialize(value)
+            serialized = self._serialize(value, key)
 
-            if nx:
-                return bool(self._redis.set(key, serialized, ex=ttl_value, nx=True))
-            else:
-                return bool(self._redis.setex(key, ttl_value, serialized))
+            # 값 저장과 태그 등록을 한 번의 왕복으로 처리
+            with self._redis.pipeline(transaction=False) as pipe:
+                if nx:
+                    pipe.set(key, serialized, ex=ttl_value, nx=True)
+                else:
+                    pipe.setex(key, ttl_value, serialized)
+                if tags:
+                    self._queue_tags(pipe, key, tags, ttl_value)
+                started = time.perf_counter()
+                stored = bool(pipe.execute()[0])
+                self._record_redis(key, started)
+
+            if stored:
+                self._local_set(key, serialized, ttl_value)
+            return stored
         except (RedisError, TypeError) as e:
             logger.error(f"Cache set error for key '{key}': {str(e)}")
+            self.metrics.record_error(key)
             return False
 
     def mset(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
@@ -228,15 +554,206 @@ class CacheManager:
 
             # Pipeline 사용하여 원자적 작업 수행
             with self._redis.pipeline() as pipe:
+                encoded = {}
                 for key, value in mapping.items():
-                    serialized = self._serialize(value)
-                    pipe.setex(key, ttl_value, serialized)
+                    encoded[key] = self._serialize(value, key)
+                    pipe.setex(key, ttl_value, encoded[key])
                 pipe.execute()
+
+            for key, serialized in encoded.items():
+                self._local_set(key, serialized, ttl_value)
             return True
         except (RedisError, TypeError) as e:
             logger.error(f"Cache mset error: {str(e)}")
             return False
 
+    def _is_fresh(self, entry: Optional[Any], beta: float) -> bool:
+        """
+        확률적 조기 재계산(XFetch) 판정
+
+        만료가 가까울수록, 재계산이 오래 걸리는 값일수록 높은 확률로 만료 전에 재계산한다.
+        봉투가 아닌 값(get_or_compute 이전에 저장된 값)은 만료 전까지 신선한 것으로 본다.
+        """
+        if entry is None:
+            return False
+        if not (isinstance(entry, dict) and entry.get(_ENVELOPE_MARKER)):
+            return True
+        jitter = entry['delta'] * beta * -math.log(1.0 - random.random())
+        return time.time() + jitter < entry['expiry']
+
+    @staticmethod
+    def _envelope(value: Any, delta: float, ttl: int) -> Dict:
+        return {
+            _ENVELOPE_MARKER: True,
+            'value': value,
+            'delta': delta,
+            'expiry': time.time() + ttl
+        }
+
+    def _store_computed(self, key: str, value: Any, delta: float, ttl: int,
+                        tags: Optional[List[str]] = None) -> None:
+        if value is not None:
+            self.set(key, self._envelope(value, delta, ttl), ttl=ttl, tags=tags)
+
+    def _acquire_lock(self, key: str, lock_timeout: float) -> Optional[str]:
+        """다른 프로세스와 재계산이 겹치지 않도록 짧은 Redis 락 획득 (SET NX PX)"""
+        token = uuid.uuid4().hex
+        try:
+            if self._redis.set(f"lock:{key}", token, nx=True, px=int(lock_timeout * 1000)):
+                return token
+        except RedisError as e:
+            logger.error(f"Cache lock error for key '{key}': {str(e)}")
+            # Redis 오류 시에는 락 없이 재계산
+            return token
+        return None
+
+    def _release_lock(self, key: str, token: str) -> None:
+        try:
+            self._redis.eval(_RELEASE_LOCK_SCRIPT, 1, f"lock:{key}", token)
+        except RedisError as e:
+            logger.error(f"Cache unlock error for key '{key}': {str(e)}")
+
+    def get_or_compute(
+            self,
+            key: str,
+            loader: Callable[[], Any],
+            ttl: Optional[int] = None,
+            beta: float = 1.0,
+            lock_timeout: float = 10.0,
+            tags: Optional[List[str]] = None
+    ) -> Any:
+        """
+        캐시에서 값을 조회하고, 없거나 곧 만료될 값이면 loader로 재계산해 저장
+
+        같은 키의 동시 미스는 프로세스 안에서 하나로 합치고(single-flight),
+        프로세스 간에는 Redis 락으로 한 곳에서만 loader를 실행한다.
+        락을 얻지 못한 쪽은 기존 값이 있으면 그대로 쓰고, 없으면 저장될 때까지 기다린다.
+
+        Args:
+            key: 캐시 키
+            loader: 값을 계산하는 함수
+            ttl: 만료 시간(초), None이면 기본값 사용
+            beta: 조기 재계산 강도 (클수록 일찍 재계산, 0이면 만료 시에만)
+            lock_timeout: 재계산 락 유지 시간 및 최대 대기 시간(초)
+            tags: 새로 저장할 때 키를 등록할 태그 목록
+
+        Returns:
+            캐시된 값 또는 새로 계산한 값
+        """
+        if not self.is_available:
+            return loader()
+
+        ttl_value = ttl if ttl is not None else self.ttl
+        entry = self._get_entry(key)
+        if self._is_fresh(entry, beta):
+            return self._unwrap(entry)
+
+        with self._flight_guard:
+            flight = self._flight_locks.setdefault(key, [threading.Lock(), 0])
+            flight[1] += 1
+
+        try:
+            with flight[0]:
+                # 대기하는 동안 다른 스레드가 채웠을 수 있음
+                entry = self._get_entry(key)
+                if self._is_fresh(entry, beta):
+                    return self._unwrap(entry)
+
+                deadline = time.monotonic() + lock_timeout
+                token = self._acquire_lock(key, lock_timeout)
+                while token is None:
+                    if entry is not None:
+                        return self._unwrap(entry)
+                    if time.monotonic() >= deadline:
+                        break
+                    time.sleep(0.05)
+                    entry = self._get_entry(key)
+                    token = self._acquire_lock(key, lock_timeout) if entry is None else None
+
+                try:
+                    started = time.monotonic()
+                    value = loader()
+                    self._store_computed(key, value, time.monotonic() - started, ttl_value, tags)
+                    return value
+                finally:
+                    if token is not None:
+                        self._release_lock(key, token)
+        finally:
+            with self._flight_guard:
+                flight[1] -= 1
+                if flight[1] == 0:
+                    del self._flight_locks[key]
+
+    async def aget_or_compute(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[Any]],
+            ttl: Optional[int] = None,
+            beta: float = 1.0,
+            lock_timeout: float = 10.0,
+            tags: Optional[List[str]] = None
+    ) -> Any:
+        """
+        get_or_compute의 비동기 버전 (loader는 코루틴 함수)
+
+        같은 이벤트 루프 안의 동시 미스는 하나의 Future를 함께 기다린다.
+        """
+        if not self.is_available:
+            return await loader()
+
+        entry = await self._aget_entry(key)
+        if self._is_fresh(entry, beta):
+            return self._unwrap(entry)
+
+        loop = asyncio.get_running_loop()
+        flight = self._async_flights.get(key)
+        if flight is not None and flight.get_loop() is loop:
+            return await asyncio.shield(flight)
+
+        flight = loop.create_future()
+        self._async_flights[key] = flight
+        try:
+            value = await self._compute_async(key, loader, ttl, beta, lock_timeout, entry, tags)
+            flight.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            # 기다리는 쪽이 없으면 "Future exception was never retrieved" 경고 방지
+            flight.exception()
+            raise
+        finally:
+            if self._async_flights.get(key) is flight:
+                del self._async_flights[key]
+
+    async def _compute_async(self, key: str, loader: Callable[[], Awaitable[Any]], ttl: Optional[int],
+                             beta: float, lock_timeout: float, entry: Optional[Any],
+                             tags: Optional[List[str]] = None) -> Any:
+        ttl_value = ttl if ttl is not None else self.ttl
+        deadline = time.monotonic() + lock_timeout
+        token = await self._aacquire_lock(key, lock_timeout)
+        while token is None:
+            if entry is not None:
+                return self._unwrap(entry)
+            if time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(0.05)
+            entry = await self._aget_entry(key)
+            token = await self._aacquire_lock(key, lock_timeout) if entry is None else None
+
+        try:
+            started = time.monotonic()
+            value = await loader()
+            if value is not None:
+                await self.aset(key, self._envelope(value, time.monotonic() - started, ttl_value),
+                                ttl=ttl_value, tags=tags)
+            return value
+        finally:
+            if token is not None:
+                await self._arelease_lock(key, token)
+
     def delete(self, key: str) -> bool:
         """
         캐시에서 값을 삭제
@@ -247,11 +764,14 @@ class CacheManager:
         Returns:
             삭제 성공 여부
         """
+        self._local_evict(key)
         if not self.is_available:
             return False
 
         try:
             self._redis.delete(key)
+            self.metrics.record_delete(key)
+            self._publish_invalidation(keys=[key])
             return True
         except RedisError as e:
             logger.error(f"Cache delete error for key '{key}': {str(e)}")
@@ -267,11 +787,17 @@ class CacheManager:
         Returns:
             삭제 성공 여부
         """
-        if not self.is_available or not keys:
+        if not keys:
+            return False
+
+        self._local_evict(*keys)
+        if not self.is_available:
             return False
 
         try:
             self._redis.delete(*keys)
+            self._record_deletes(keys)
+            self._publish_invalidation(keys=list(keys))
             return True
         except RedisError as e:
             logger.error(f"Cache delete_many error: {str(e)}")
@@ -287,23 +813,193 @@ class CacheManager:
         Returns:
             삭제 성공 여부
         """
+        if self._local is not None:
+            self._local.delete_pattern(pattern)
         if not self.is_available:
             return False
 
         try:
-            # scan_iter 사용하여 메모리 효율적으로 처리
-            keys = list(self._redis.scan_iter(match=pattern))
-            if keys:
-                # 청크 단위로 나누어 대량의 키 처리
-                chunk_size = 1000
-                for i in range(0, len(keys), chunk_size):
-                    chunk = keys[i:i + chunk_size]
+            # 전체 키를 모으지 않고 SCAN 결과를 청크 단위로 바로 삭제
+            chunk = []
+            for key in self._redis.scan_iter(match=pattern, count=1000):
+                chunk.append(key)
+                if len(chunk) >= 1000:
                     self._redis.delete(*chunk)
+                    chunk = []
+            if chunk:
+                self._redis.delete(*chunk)
+            self._publish_invalidation(pattern=pattern)
             return True
         except RedisError as e:
             logger.error(f"Cache delete_pattern error for pattern '{pattern}': {str(e)}")
             return False
 
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"tag:{tag}"
+
+    def _queue_tags(self, pipe, key: str, tags: List[str], ttl: int) -> None:
+        """파이프라인에 태그 등록 명령 추가 (동기/비동기 파이프라인 공용)"""
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        pipe.eval(_TAG_SCRIPT, 1 + len(tag_keys), key, *tag_keys, ttl)
+
+    @staticmethod
+    def _decode_keys(keys: List[Union[bytes, str]]) -> List[str]:
+        return [key.decode() if isinstance(key, bytes) else key for key in keys]
+
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        태그에 등록된 키를 모두 삭제 (멤버 수에 비례, 키스페이스 전체를 SCAN하지 않음)
+
+        Args:
+            tag: 무효화할 태그 (예: 'user:12')
+
+        Returns:
+            삭제 요청한 멤버 키 수
+        """
+        if not self.is_available:
+            return 0
+
+        tag_key = self._tag_key(tag)
+        count = 0
+        try:
+            batch = []
+            for member in self._redis.sscan_iter(tag_key, count=_TAG_BATCH_SIZE):
+                batch.append(member)
+                if len(batch) >= _TAG_BATCH_SIZE:
+                    count += self._delete_tag_batch(tag_key, batch)
+                    batch = []
+            if batch:
+                count += self._delete_tag_batch(tag_key, batch)
+            self._redis.delete(tag_key)
+            return count
+        except RedisError as e:
+            logger.error(f"Cache invalidate_tag error for tag '{tag}': {str(e)}")
+            return count
+
+    def _delete_tag_batch(self, tag_key: str, members: List[Union[bytes, str]]) -> int:
+        keys = self._decode_keys(members)
+        self._local_evict(*keys)
+        with self._redis.pipeline(transaction=False) as pipe:
+            pipe.delete(*members)
+            pipe.srem(tag_key, *members)
+            pipe.execute()
+        self._record_deletes(keys)
+        self._publish_invalidation(keys=keys)
+        return len(keys)
+
+    @staticmethod
+    def _list_version_key(key: str) -> str:
+        return f"{key}:version"
+
+    def _decode_items(self, key: str, items: List[bytes]) -> List[Any]:
+        return [self._deserialize(item, key) for item in items]
+
+    def list_append(self, key: str, values: List[Any], max_len: int, ttl: Optional[int] = None,
+                    only_if_exists: bool = False) -> bool:
+        """
+        리스트 끝에 값을 덧붙이고 최근 max_len개만 남긴다 (RPUSH + LTRIM + EXPIRE를 한 번의 왕복으로)
+
+        Args:
+            key: 리스트 키
+            values: 덧붙일 값 목록
+            max_len: 유지할 최대 원소 수
+            ttl: 만료 시간(초), None이면 기본값 사용
+            only_if_exists: True면 리스트가 이미 있을 때만 덧붙임 (일부만 담긴 리스트가 생기지 않도록)
+
+        Returns:
+            성공 여부
+        """
+        if not self.is_available or not values:
+            return False
+
+        try:
+            ttl_value = ttl if ttl is not None else self.ttl
+            items = [self._serialize(value, key) for value in values]
+            version_key = self._list_version_key(key)
+
+            with self._redis.pipeline(transaction=True) as pipe:
+                if only_if_exists:
+                    pipe.rpushx(key, *items)
+                else:
+                    pipe.rpush(key, *items)
+                pipe.ltrim(key, -max_len, -1)
+                pipe.expire(key, ttl_value)
+                pipe.incr(version_key)
+                pipe.expire(version_key, ttl_value)
+                started = time.perf_counter()
+                pipe.execute()
+                self._record_redis(key, started)
+            return True
+        except (RedisError, TypeError) as e:
+            logger.error(f"Cache list_append error for key '{key}': {str(e)}")
+            self.metrics.record_error(key)
+            return False
+
+    def list_range(self, key: str, start: int = 0, end: int = -1) -> Optional[List[Any]]:
+        """
+        리스트 범위 조회 (LRANGE, 음수 인덱스는 끝에서부터)
+
+        Returns:
+            값 목록 또는 None(리스트가 없을 때)
+        """
+        if not self.is_available:
+            return None
+
+        try:
+            with self._redis.pipeline(transaction=False) as pipe:
+                pipe.llen(key)
+                pipe.lrange(key, start, end)
+                started = time.perf_counter()
+                length, items = pipe.execute()
+                self._record_redis(key, started)
+        except RedisError as e:
+            logger.error(f"Cache list_range error for key '{key}': {str(e)}")
+            self.metrics.record_error(key)
+            return None
+
+        self.metrics.record_lookup(key, bool(length))
+        if not length:
+            return None
+        return self._decode_items(key, items)
+
+    def list_version(self, key: str) -> str:
+        """리스트 변경 버전 (list_fill 전에 조회해 두고 전달)"""
+        if not self.is_available:
+            return ''
+
+        try:
+            version = self._redis.get(self._list_version_key(key))
+            return version.decode() if isinstance(version, bytes) else (version or '')
+        except RedisError as e:
+            logger.error(f"Cache list_version error for key '{key}': {str(e)}")
+            return ''
+
+    def list_fill(self, key: str, values: List[Any], max_len: int, version: str,
+                  ttl: Optional[int] = None) -> bool:
+        """
+        DB에서 읽은 값으로 리스트 전체를 채운다
+
+        version(조회 전에 list_version으로 얻은 값) 이후 list_append가 있었다면
+        방금 읽은 값이 이미 오래된 것이므로 채우지 않는다.
+
+        Returns:
+            채웠는지 여부
+        """
+        if not self.is_available or not values:
+            return False
+
+        try:
+            ttl_value = ttl if ttl is not None else self.ttl
+            items = [self._serialize(value, key) for value in values[-max_len:]]
+            return bool(self._redis.eval(
+                _LIST_FILL_SCRIPT, 2, key, self._list_version_key(key), version, ttl_value, *items
+            ))
+        except (RedisError, TypeError) as e:
+            logger.error(f"Cache list_fill error for key '{key}': {str(e)}")
+            self.metrics.record_error(key)
+            return False
+
     def exists(self, key: str) -> bool:
         """
         키가 존재하는지 확인
@@ -337,6 +1033,7 @@ class CacheManager:
         if not self.is_available:
             return None
 
+        self._local_evict(key)
         try:
             return self._redis.incrby(key, amount)
         except RedisError as e:
@@ -357,6 +1054,7 @@ class CacheManager:
         if not self.is_available:
             return False
 
+        self._local_evict(key)
         try:
             return bool(self._redis.expire(key, ttl))
         except RedisError as e:
@@ -408,6 +1106,8 @@ class CacheManager:
         if not self.is_available:
             return False
 
+        if self._local is not None:
+            self._local.clear()
         try:
             self._redis.flushdb()
             return True
@@ -429,4 +1129,557 @@ class CacheManager:
             return bool(self._redis.ping())
         except RedisError:
             self._is_available = False
-            return False
\ No newline at end of file
+            return False
+
+    # ------------------------------------------------------------------
+    # 비동기 API (redis.asyncio)
+    # ------------------------------------------------------------------
+
+    def _async_client(self) -> aioredis.Redis:
+        """현재 이벤트 루프용 비동기 Redis 클라이언트 반환 (최초 호출 시 생성)"""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            # 연결이 루프를 참조해 약한 참조만으로는 풀리지 않으므로 닫힌 루프의 클라이언트는 여기서 버린다
+            for stale in [stale for stale in list(self._async_clients.keys()) if stale.is_closed()]:
+                self._async_clients.pop(stale, None)
+            client = aioredis.from_url(self.redis_url, **self._connection_pool_kwargs)
+            self._async_clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 비동기 클라이언트와 무효화 구독 스레드 정리"""
+        self.close()
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def _aget_entry(self, key: str) -> Optional[Any]:
+        """_get_entry의 비동기 버전"""
+        if not self.is_available:
+            return None
+
+        value = self._local_get(key)
+        if value is not _MISSING:
+            self.metrics.record_lookup(key, True, l1=True)
+            return value
+
+        try:
+            started = time.perf_counter()
+            if self._is_local_key(key):
+                async with self._async_client().pipeline(transaction=False) as pipe:
+                    pipe.get(key)
+                    pipe.pttl(key)
+                    data, pttl = await pipe.execute()
+            else:
+                data, pttl = await self._async_client().get(key), None
+            self._record_redis(key, started)
+            value = self._deserialize(data, key)
+            self.metrics.record_lookup(key, value is not None)
+            if value is not None:
+                self._local_set(key, data, self._remaining_ttl(pttl), value)
+            return value
+        except RedisError as e:
+            logger.error(f"Cache aget error for key '{key}': {str(e)}")
+            self.metrics.record_error(key)
+            return None
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """get의 비동기 버전"""
+        return self._unwrap(await self._aget_entry(key))
+
+    async def amget(self, keys: List[str]) -> Dict[str, Any]:
+        """mget의 비동기 버전"""
+        if not self.is_available or not keys:
+            return {}
+
+        values = {}
+        missing = []
+        for key in keys:
+            value = self._local_get(key)
+            if value is _MISSING:
+                missing.append(key)
+            else:
+                self.metrics.record_lookup(key, True, l1=True)
+                values[key] = self._unwrap(value)
+
+        if not missing:
+            return values
+
+        try:
+            local_keys = [key for key in missing if self._is_local_key(key)]
+            started = time.perf_counter()
+            async with self._async_client().pipeline(transaction=False) as pipe:
+                pipe.mget(missing)
+                for key in local_keys:
+                    pipe.pttl(key)
+                result, *pttls = await pipe.execute()
+            self._record_redis(missing[0], started)
+            remaining = dict(zip(local_keys, pttls))
+            for key, data in zip(missing, result):
+                self.metrics.record_lookup(key, data is not None)
+                if data is None:
+                    continue
+                value = self._deserialize(data, key)
+                values[key] = self._unwrap(value)
+                if value is not None:
+                    self._local_set(key, data, self._remaining_ttl(remaining.get(key)), value)
+            return values
+        except RedisError as e:
+            logger.error(f"Cache amget error: {str(e)}")
+            return {}
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None, nx: bool = False,
+                   tags: Optional[List[str]] = None) -> bool:
+        """set의 비동기 버전"""
+        if not self.is_available:
+            return False
+
+        try:
+            ttl_value = ttl if ttl is not None else self.ttl
+            serialized = self._serialize(value, key)
+
+            async with self._async_client().pipeline(transaction=False) as pipe:
+                if nx:
+                    pipe.set(key, serialized, ex=ttl_value, nx=True)
+                else:
+                    pipe.setex(key, ttl_value, serialized)
+                if tags:
+                    self._queue_tags(pipe, key, tags, ttl_value)
+                started = time.perf_counter()
+                stored = bool((await pipe.execute())[0])
+                self._record_redis(key, started)
+
+            if stored:
+                self._local_set(key, serialized, ttl_value)
+            return stored
+        except (RedisError, TypeError) as e:
+            logger.error(f"Cache aset error for key '{key}': {str(e)}")
+            self.metrics.record_error(key)
+            return False
+
+    async def amset(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """mset의 비동기 버전"""
+        if not self.is_available or not mapping:
+            return False
+
+        try:
+            ttl_value = ttl if ttl is not None else self.ttl
+
+            async with self._async_client().pipeline() as pipe:
+                encoded = {}
+                for key, value in mapping.items():
+                    encoded[key] = self._serialize(value, key)
+                    pipe.setex(key, ttl_value, encoded[key])
+                await pipe.execute()
+
+            for key, serialized in encoded.items():
+                self._local_set(key, serialized, ttl_value)
+            return True
+        except (RedisError, TypeError) as e:
+            logger.error(f"Cache amset error: {str(e)}")
+            return False
+
+    async def _apublish_invalidation(self, keys: Optional[List[str]] = None,
+                                     pattern: Optional[str] = None) -> None:
+        """_publish_invalidation의 비동기 버전"""
+        try:
+            await self._async_client().publish(self._invalidation_channel, json.dumps({
+                'origin': self._instance_id,
+                'keys': keys,
+                'pattern': pattern
+            }))
+        except RedisError as e:
+            logger.error(f"Cache invalidation publish error: {str(e)}")
+
+    async def adelete(self, key: str) -> bool:
+        """delete의 비동기 버전"""
+        self._local_evict(key)
+        if not self.is_available:
+            return False
+
+        try:
+            await self._async_client().delete(key)
+            self.metrics.record_delete(key)
+            await self._apublish_invalidation(keys=[key])
+            return True
+        except RedisError as e:
+            logger.error(f"Cache adelete error for key '{key}': {str(e)}")
+            return False
+
+    async def adelete_many(self, keys: List[str]) -> bool:
+        """delete_many의 비동기 버전"""
+        if not keys:
+            return False
+
+        self._local_evict(*keys)
+        if not self.is_available:
+            return False
+
+        try:
+            await self._async_client().delete(*keys)
+            self._record_deletes(keys)
+            await self._apublish_invalidation(keys=list(keys))
+            return True
+        except RedisError as e:
+            logger.error(f"Cache adelete_many error: {str(e)}")
+            return False
+
+    async def adelete_pattern(self, pattern: str) -> bool:
+        """delete_pattern의 비동기 버전 (SCAN 결과를 청크 단위로 바로 삭제)"""
+        if self._local is not None:
+            self._local.delete_pattern(pattern)
+        if not self.is_available:
+            return False
+
+        try:
+            client = self._async_client()
+            chunk = []
+            async for key in client.scan_iter(match=pattern, count=1000):
+                chunk.append(key)
+                if len(chunk) >= 1000:
+                    await client.delete(*chunk)
+                    chunk = []
+            if chunk:
+                await client.delete(*chunk)
+            await self._apublish_invalidation(pattern=pattern)
+            return True
+        except RedisError as e:
+            logger.error(f"Cache adelete_pattern error for pattern '{pattern}': {str(e)}")
+            return False
+
+    async def ainvalidate_tag(self, tag: str) -> int:
+        """invalidate_tag의 비동기 버전"""
+        if not self.is_available:
+            return 0
+
+        tag_key = self._tag_key(tag)
+        count = 0
+        try:
+            client = self._async_client()
+            batch = []
+            async for member in client.sscan_iter(tag_key, count=_TAG_BATCH_SIZE):
+                batch.append(member)
+                if len(batch) >= _TAG_BATCH_SIZE:
+                    count += await self._adelete_tag_batch(tag_key, batch)
+                    batch = []
+            if batch:
+                count += await self._adelete_tag_batch(tag_key, batch)
+            await client.delete(tag_key)
+            return count
+        except RedisError as e:
+            logger.error(f"Cache ainvalidate_tag error for tag '{tag}': {str(e)}")
+            return count
+
+    async def _adelete_tag_batch(self, tag_key: str, members: List[Union[bytes, str]]) -> int:
+        keys = self._decode_keys(members)
+        self._local_evict(*keys)
+        async with self._async_client().pipeline(transaction=False) as pipe:
+            pipe.delete(*members)
+            pipe.srem(tag_key, *members)
+            await pipe.execute()
+        self._record_deletes(keys)
+        await self._apublish_invalidation(keys=keys)
+        return len(keys)
+
+    async def alist_append(self, key: str, values: List[Any], max_len: int, ttl: Optional[int] = None,
+                           only_if_exists: bool = False) -> bool:
+        """list_append의 비동기 버전"""
+        if not self.is_available or not values:
+            return False
+
+        try:
+            ttl_value = ttl if ttl is not None else self.ttl
+            items = [self._serialize(value, key) for value in values]
+            version_key = self._list_version_key(key)
+
+            async with self._async_client().pipeline(transaction=True) as pipe:
+                if only_if_exists:
+                    pipe.rpushx(key, *items)
+                else:
+                    pipe.rpush(key, *items)
+                pipe.ltrim(key, -max_len, -1)
+                pipe.expire(key, ttl_value)
+                pipe.incr(version_key)
+                pipe.expire(version_key, ttl_value)
+                started = time.perf_counter()
+                await pipe.execute()
+                self._record_redis(key, started)
+            return True
+        except (RedisError, TypeError) as e:
+            logger.error(f"Cache alist_append error for key '{key}': {str(e)}")
+            self.metrics.record_error(key)
+            return False
+
+    async def alist_range(self, key: str, start: int = 0, end: int = -1) -> Optional[List[Any]]:
+        """list_range의 비동기 버전"""
+        if not self.is_available:
+            return None
+
+        try:
+            async with self._async_client().pipeline(transaction=False) as pipe:
+                pipe.llen(key)
+                pipe.lrange(key, start, end)
+                started = time.perf_counter()
+                length, items = await pipe.execute()
+                self._record_redis(key, started)
+        except RedisError as e:
+            logger.error(f"Cache alist_range error for key '{key}': {str(e)}")
+            self.metrics.record_error(key)
+            return None
+
+        self.metrics.record_lookup(key, bool(length))
+        if not length:
+            return None
+        return self._decode_items(key, items)
+
+    async def alist_version(self, key: str) -> str:
+        """list_version의 비동기 버전"""
+        if not self.is_available:
+            return ''
+
+        try:
+            version = await self._async_client().get(self._list_version_key(key))
+            return version.decode() if isinstance(version, bytes) else (version or '')
+        except RedisError as e:
+            logger.error(f"Cache alist_version error for key '{key}': {str(e)}")
+            return ''
+
+    async def alist_fill(self, key: str, values: List[Any], max_len: int, version: str,
+                         ttl: Optional[int] = None) -> bool:
+        """list_fill의 비동기 버전"""
+        if not self.is_available or not values:
+            return False
+
+        try:
+            ttl_value = ttl if ttl is not None else self.ttl
+            items = [self._serialize(value, key) for value in values[-max_len:]]
+            return bool(await self._async_client().eval(
+                _LIST_FILL_SCRIPT, 2, key, self._list_version_key(key), version, ttl_value, *items
+            ))
+        except (RedisError, TypeError) as e:
+            logger.error(f"Cache alist_fill error for key '{key}': {str(e)}")
+            self.metrics.record_error(key)
+            return False
+
+    async def aexists(self, key: str) -> bool:
+        """exists의 비동기 버전"""
+        if not self.is_available:
+            return False
+
+        try:
+            return bool(await self._async_client().exists(key))
+        except RedisError as e:
+            logger.error(f"Cache aexists error for key '{key}': {str(e)}")
+            return False
+
+    async def aincr(self, key: str, amount: int = 1) -> Optional[int]:
+        """incr의 비동기 버전"""
+        if not self.is_available:
+            return None
+
+        self._local_evict(key)
+        try:
+            return await self._async_client().incrby(key, amount)
+        except RedisError as e:
+            logger.error(f"Cache aincr error for key '{key}': {str(e)}")
+            return None
+
+    async def aexpire(self, key: str, ttl: int) -> bool:
+        """expire의 비동기 버전"""
+        if not self.is_available:
+            return False
+
+        self._local_evict(key)
+        try:
+            return bool(await self._async_client().expire(key, ttl))
+        except RedisError as e:
+            logger.error(f"Cache aexpire error for key '{key}': {str(e)}")
+            return False
+
+    async def attl(self, key: str) -> Optional[int]:
+        """ttl의 비동기 버전"""
+        if not self.is_available:
+            return None
+
+        try:
+            return await self._async_client().ttl(key)
+        except RedisError as e:
+            logger.error(f"Cache attl error for key '{key}': {str(e)}")
+            return None
+
+    def apipeline(self) -> Optional[aioredis.client.Pipeline]:
+        """
+        비동기 Redis 파이프라인 객체 반환 (async with로 사용)
+
+        Returns:
+            비동기 파이프라인 또는 None(연결 불가 시)
+        """
+        if not self.is_available:
+            return None
+        return self._async_client().pipeline()
+
+    async def _aacquire_lock(self, key: str, lock_timeout: float) -> Optional[str]:
+        """_acquire_lock의 비동기 버전"""
+        token = uuid.uuid4().hex
+        try:
+            if await self._async_client().set(f"lock:{key}", token, nx=True, px=int(lock_timeout * 1000)):
+                return token
+        except RedisError as e:
+            logger.error(f"Cache lock error for key '{key}': {str(e)}")
+            return token
+        return None
+
+    async def _arelease_lock(self, key: str, token: str) -> None:
+        try:
+            await self._async_client().eval(_RELEASE_LOCK_SCRIPT, 1, f"lock:{key}", token)
+        except RedisError as e:
+            logger.error(f"Cache unlock error for key '{key}': {str(e)}")
+
+    async def aacquire_lock(self, key: str, lock_timeout: float) -> Optional[str]:
+        """
+        키 단위 분산 락 획득 (여러 워커가 같은 작업을 동시에 하지 않도록 할 때)
+
+        Args:
+            key: 락을 걸 키 (실제 Redis 키는 lock:{key})
+            lock_timeout: 락 자동 만료 시간(초)
+
+        Returns:
+            arelease_lock에 넘길 토큰, 다른 곳에서 이미 잡고 있으면 None
+            (Redis를 쓸 수 없으면 락 없이 진행하도록 토큰을 반환)
+        """
+        if not self.is_available:
+            return uuid.uuid4().hex
+        return await self._aacquire_lock(key, lock_timeout)
+
+    async def arelease_lock(self, key: str, token: str) -> None:
+        """aacquire_lock으로 얻은 락 해제 (토큰이 일치할 때만)"""
+        if self.is_available:
+            await self._arelease_lock(key, token)
+
+    async def ahash_set(self, key: str, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        해시 필드 저장 (HSET + EXPIRE를 한 번의 왕복으로)
+
+        Args:
+            key: 해시 키
+            mapping: {필드: 값}
+            ttl: 해시 전체 만료 시간(초), None이면 기본값 사용
+
+        Returns:
+            저장 성공 여부
+        """
+        if not self.is_available or not mapping:
+            return False
+
+        try:
+            encoded = {field: self._serialize(value, key) for field, value in mapping.items()}
+            async with self._async_client().pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping=encoded)
+                pipe.expire(key, ttl if ttl is not None else self.ttl)
+                started = time.perf_counter()
+                await pipe.execute()
+                self._record_redis(key, started)
+            return True
+        except (RedisError, TypeError) as e:
+            logger.error(f"Cache ahash_set error for key '{key}': {str(e)}")
+            self.metrics.record_error(key)
+            return False
+
+    async def ahash_values(self, key: str) -> Dict[str, Any]:
+        """해시의 모든 {필드: 값} (없거나 Redis를 쓸 수 없으면 빈 딕셔너리)"""
+        if not self.is_available:
+            return {}
+
+        try:
+            started = time.perf_counter()
+            items = await self._async_client().hgetall(key)
+            self._record_redis(key, started)
+        except RedisError as e:
+            logger.error(f"Cache ahash_values error for key '{key}': {str(e)}")
+            self.metrics.record_error(key)
+            return {}
+
+        self.metrics.record_lookup(key, bool(items))
+        return {
+            (field.decode() if isinstance(field, bytes) else field): self._deserialize(value, key)
+            for field, value in items.items()
+        }
+
+    async def ahash_delete(self, key: str, fields: List[str]) -> int:
+        """해시 필드 삭제, 삭제된 필드 수 반환"""
+        if not self.is_available or not fields:
+            return 0
+
+        try:
+            started = time.perf_counter()
+            deleted = await self._async_client().hdel(key, *fields)
+            self._record_redis(key, started)
+            return deleted
+        except RedisError as e:
+            logger.error(f"Cache ahash_delete error for key '{key}': {str(e)}")
+            self.metrics.record_error(key)
+            return 0
+
+    async def ahealth_check(self) -> bool:
+        """health_check의 비동기 버전"""
+        if not self.redis_url:
+            return False
+
+        try:
+            return bool(await self._async_client().ping())
+        except RedisError:
+            self._is_available = False
+            return False
+
+
+_cache_manager: Optional[CacheManager] = None
+_cache_manager_lock = threading.Lock()
+
+
+def get_cache_manager() -> CacheManager:
+    """
+    프로세스 전역 캐시 매니저 반환 (최초 호출 시 REDIS_URL 등 설정으로 생성)
+
+    모든 매니저/봇이 같은 Redis 연결, L1 캐시, 무효화 구독을 공유한다.
+    REDIS_URL이 없으면 캐시 없이 동작하는 매니저를 돌려준다.
+    """
+    global _cache_manager
+    if _cache_manager is None:
+        with _cache_manager_lock:
+            if _cache_manager is None:
+                settings = OpenAISettings()
+                if not settings.REDIS_URL:
+                    logger.warning("REDIS_URL is not set; caching is disabled")
+
+                _cache_manager = CacheManager(
+                    redis_url=settings.REDIS_URL,
+                    ttl=settings.REDIS_TTL,
+                    local_cache=LocalCache(
+                        max_entries=settings.LOCAL_CACHE_MAX_ENTRIES,
+                        max_bytes=settings.LOCAL_CACHE_MAX_BYTES,
+                        ttl=settings.LOCAL_CACHE_TTL
+                    ) if settings.LOCAL_CACHE_TTL > 0 else None,
+                    local_key_prefixes=LOCAL_CACHE_KEY_PREFIXES,
+                    codec=CacheCodec(
+                        codec=settings.CACHE_CODEC,
+                        compress_threshold=settings.CACHE_COMPRESS_THRESHOLD,
+                        compression=settings.CACHE_COMPRESSION
+                    ),
+                    key_families=CACHE_KEY_FAMILIES
+                )
+                logger.info(
+                    f"Shared cache manager created: redis={'on' if _cache_manager.is_available else 'off'}, "
+                    f"l1={'on' if _cache_manager.local_cache is not None else 'off'}, "
+                    f"codec={settings.CACHE_CODEC}"
+                )
+    return _cache_manager
+
+
+async def close_cache_manager() -> None:
+    """전역 캐시 매니저 정리 (적중률 로그 후 연결 종료)"""
+    global _cache_manager
+    if _cache_manager is not None:
+        _cache_manager.log_hit_rates()
+        await _cache_manager.aclose()
+        _cache_manager = None
@@ -0,0 +1,211 @@
+# utils/cache_metrics.py
+import re
+import threading
+from bisect import bisect_left
+from typing import Dict, Optional
+
+# Redis 왕복 지연 히스토그램 구간 상한(ms), 마지막 구간은 그 이상
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250)
+
+
+class _FamilyStats:
+    """키 계열 하나의 누적 지표"""
+
+    __slots__ = (
+        "l1_hits", "redis_hits", "misses", "sets", "deletes", "errors",
+        "redis_calls", "redis_time", "redis_max", "latency_buckets",
+        "serialize_calls", "serialize_time", "deserialize_calls", "deserialize_time",
+        "bytes_written", "bytes_read", "max_payload"
+    )
+
+    def __init__(self):
+        self.l1_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.deletes = 0
+        self.errors = 0
+        self.redis_calls = 0
+        self.redis_time = 0.0
+        self.redis_max = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.serialize_calls = 0
+        self.serialize_time = 0.0
+        self.deserialize_calls = 0
+        self.deserialize_time = 0.0
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.max_payload = 0
+
+    def to_dict(self) -> Dict:
+        lookups = self.l1_hits + self.redis_hits + self.misses
+        hits = self.l1_hits + self.redis_hits
+        buckets = {
+            f"le_{bound}ms": count
+            for bound, count in zip(LATENCY_BUCKETS_MS, self.latency_buckets)
+        }
+        buckets[f"gt_{LATENCY_BUCKETS_MS[-1]}ms"] = self.latency_buckets[-1]
+        return {
+            "lookups": lookups,
+            "hits": hits,
+            "l1_hits": self.l1_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "sets": self.sets,
+            "deletes": self.deletes,
+            "errors": self.errors,
+            "redis": {
+                "calls": self.redis_calls,
+                "avg_ms": round(self.redis_time / self.redis_calls * 1000, 3) if self.redis_calls else 0.0,
+                "max_ms": round(self.redis_max * 1000, 3),
+                "latency_histogram": buckets
+            },
+            "serialize": {
+                "calls": self.serialize_calls,
+                "avg_ms": round(self.serialize_time / self.serialize_calls * 1000, 3) if self.serialize_calls else 0.0
+            },
+            "deserialize": {
+                "calls": self.deserialize_calls,
+                "avg_ms": round(self.deserialize_time / self.deserialize_calls * 1000, 3)
+                if self.deserialize_calls else 0.0
+            },
+            "payload": {
+                "bytes_written": self.bytes_written,
+                "bytes_read": self.bytes_read,
+                "avg_write_bytes": round(self.bytes_written / self.sets) if self.sets else 0,
+                "max_bytes": self.max_payload
+            }
+        }
+
+
+class CacheMetrics:
+    """
+    키 계열별 캐시 지표 (적중/미스, Redis 왕복 지연, 직렬화 시간, 값 크기)
+
+    계열은 CACHE_KEYS 같은 키 템플릿("conversation:{conversation_id}:info")으로 정하고,
+    템플릿에 맞지 않는 키는 첫 ':' 앞부분을 계열 이름으로 쓴다.
+    """
+
+    def __init__(self, key_templates: Optional[Dict[str, str]] = None):
+        """
+        지표 초기화
+
+        Args:
+            key_templates: {계열 이름: 키 템플릿} (str.format 형식의 자리표시자 사용)
+        """
+        key_templates = key_templates or {}
+        self._names = list(key_templates.keys())
+        self._pattern = self._compile(key_templates)
+        self._families: Dict[str, _FamilyStats] = {}
+        self._family_cache: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _compile(key_templates: Dict[str, str]) -> Optional[re.Pattern]:
+        """키 템플릿들을 하나의 정규식으로 합침 (그룹 이름으로 계열 식별)"""
+        if not key_templates:
+            return None
+
+        alternatives = []
+        for index, template in enumerate(key_templates.values()):
+            parts = re.split(r"\{[^}]*\}", template)
+            body = ".+?".join(re.escape(part) for part in parts)
+            alternatives.append(f"(?P<f{index}>{body})")
+
+        return re.compile(f"^(?:{'|'.join(alternatives)})$")
+
+    def family(self, key: str) -> str:
+        """키가 속한 계열 이름"""
+        family = self._family_cache.get(key)
+        if family is not None:
+            return family
+
+        family = None
+        if self._pattern is not None:
+            match = self._pattern.match(key)
+            if match:
+                family = self._names[int(match.lastgroup[1:])]
+        if family is None:
+            family = key.split(":", 1)[0]
+
+        # 키 수가 무한히 늘 수 있으므로 계열 캐시는 크기를 제한
+        if len(self._family_cache) >= 10000:
+            self._family_cache.clear()
+        self._family_cache[key] = family
+        return family
+
+    def _stats(self, family: str) -> _FamilyStats:
+        stats = self._families.get(family)
+        if stats is None:
+            stats = self._families[family] = _FamilyStats()
+        return stats
+
+    def record_lookup(self, key: str, hit: bool, l1: bool = False) -> None:
+        """조회 결과 기록 (l1=True면 L1 적중)"""
+        family = self.family(key)
+        with self._lock:
+            stats = self._stats(family)
+            if not hit:
+                stats.misses += 1
+            elif l1:
+                stats.l1_hits += 1
+            else:
+                stats.redis_hits += 1
+
+    def record_redis(self, key: str, elapsed: float) -> None:
+        """Redis 왕복 지연 기록 (초)"""
+        family = self.family(key)
+        bucket = bisect_left(LATENCY_BUCKETS_MS, elapsed * 1000)
+        with self._lock:
+            stats = self._stats(family)
+            stats.redis_calls += 1
+            stats.redis_time += elapsed
+            stats.redis_max = max(stats.redis_max, elapsed)
+            stats.latency_buckets[bucket] += 1
+
+    def record_serialize(self, key: str, elapsed: float, size: int) -> None:
+        """직렬화 시간과 저장 크기 기록"""
+        family = self.family(key)
+        with self._lock:
+            stats = self._stats(family)
+            stats.sets += 1
+            stats.serialize_calls += 1
+            stats.serialize_time += elapsed
+            stats.bytes_written += size
+            stats.max_payload = max(stats.max_payload, size)
+
+    def record_deserialize(self, key: str, elapsed: float, size: int) -> None:
+        """역직렬화 시간과 읽은 크기 기록"""
+        family = self.family(key)
+        with self._lock:
+            stats = self._stats(family)
+            stats.deserialize_calls += 1
+            stats.deserialize_time += elapsed
+            stats.bytes_read += size
+            stats.max_payload = max(stats.max_payload, size)
+
+    def record_delete(self, key: str) -> None:
+        family = self.family(key)
+        with self._lock:
+            self._stats(family).deletes += 1
+
+    def record_error(self, key: str) -> None:
+        family = self.family(key)
+        with self._lock:
+            self._stats(family).errors += 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        계열별 지표 스냅샷
+
+        Returns:
+            {계열 이름: 지표 딕셔너리}
+        """
+        with self._lock:
+            return {family: stats.to_dict() for family, stats in sorted(self._families.items())}
+
+    def reset(self) -> None:
+        """누적 지표 초기화"""
+        with self._lock:
+            self._families.clear()
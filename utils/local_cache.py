@@ -0,0 +1,161 @@
+# utils/local_cache.py
+import fnmatch
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LocalCache:
+    """
+    프로세스 내 LRU 캐시 (CacheManager의 L1 계층)
+
+    항목별 만료 시간, 항목 수/바이트 크기 제한, 적중/미스 카운터를 지원한다.
+    값은 역직렬화된 객체를 그대로 보관하므로 꺼낸 값을 직접 수정하면 안 된다.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024, ttl: int = 60):
+        """
+        로컬 캐시 초기화
+
+        Args:
+            max_entries: 최대 항목 수
+            max_bytes: 보관할 값들의 최대 크기 합(바이트, 직렬화 크기 기준)
+            ttl: 항목 최대 보관 시간(초)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries는 1 이상이어야 합니다.")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()  # key -> (value, expires_at, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # 통계
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[2]
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        키 조회 (만료된 항목은 제거하고 미스로 처리)
+
+        Args:
+            key: 조회할 키
+            default: 미스 시 반환할 값
+
+        Returns:
+            저장된 값 또는 default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: Any, size: int, ttl: Optional[int] = None) -> bool:
+        """
+        값 저장 (한도를 넘으면 가장 오래 쓰이지 않은 항목부터 제거)
+
+        Args:
+            key: 저장할 키
+            value: 저장할 값
+            size: 값의 크기(바이트)
+            ttl: 만료 시간(초), 로컬 캐시 최대 보관 시간보다 길면 잘라냄
+
+        Returns:
+            저장 여부 (단일 값이 max_bytes보다 크면 저장하지 않음)
+        """
+        ttl_value = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            self._remove(key)
+            if ttl_value <= 0 or size > self.max_bytes:
+                return False
+
+            self._entries[key] = (value, time.monotonic() + ttl_value, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+            return True
+
+    def delete(self, key: str) -> bool:
+        """키 제거"""
+        with self._lock:
+            return self._remove(key)
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """여러 키 제거, 제거된 항목 수 반환"""
+        with self._lock:
+            return sum(1 for key in keys if self._remove(key))
+
+    def delete_pattern(self, pattern: str) -> int:
+        """glob 패턴(Redis SCAN MATCH와 같은 형식)에 맞는 키 제거"""
+        with self._lock:
+            keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[1] > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """
+        로컬 캐시 사용 통계
+
+        Returns:
+            항목 수, 사용 바이트, 적중률 등의 통계
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations
+            }
@@ -1,47 +1,76 @@
 # modules/mysql_connector.py
 import logging
-from typing import List, Dict, Optional, Union
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Union, Iterator, Any
 
-import mysql.connector
 from mysql.connector import Error
 
 from configs.mysql_setting import MYSQL_CONFIG
+from utils.mysql_pool import get_pool
 
 logger = logging.getLogger(__name__)
 
 
 class MySQLConnector:
     def __init__(self):
-        self._connection = None  # 프라이빗 변수로 변경
+        self._connection = None  # 트랜잭션 동안 점유하는 풀 연결
         self.config = MYSQL_CONFIG
+        self.pool = get_pool()
         self.is_transaction_active = False  # 트랜잭션 상태 추적
 
     def connect(self):
-        """데이터베이스 연결"""
+        """풀에서 연결을 빌려 점유"""
         try:
-            if not self._connection or not self._connection.is_connected():
-                self._connection = mysql.connector.connect(**self.config)
-                print("MySQL 데이터베이스 연결 성공")
+            if not self._connection:
+                self._connection = self.pool.acquire()
+                logger.debug("MySQL 풀 연결 획득")
         except Error as e:
             print(f"MySQL 연결 오류: {e}")
             raise
 
     def get_connection(self):
         """현재 연결 반환"""
-        self.connect()  # 연결이 없으면 새로 생성
+        self.connect()  # 연결이 없으면 풀에서 획득
         return self._connection
 
     def close(self):
-        """데이터베이스 연결 종료"""
+        """점유 중인 연결을 풀에 반환"""
         try:
-            if self._connection and self._connection.is_connected():
-                if not self.is_transaction_active:  # 트랜잭션 중이 아닐 때만 닫기
-                    self._connection.close()
+            if self._connection:
+                if not self.is_transaction_active:  # 트랜잭션 중이 아닐 때만 반환
+                    self.pool.release(self._connection)
                     self._connection = None
-                    print("MySQL 연결이 종료되었습니다.")
+                    logger.debug("MySQL 풀 연결 반환")
         except Error as e:
             print(f"연결 종료 오류: {e}")
 
+    @contextmanager
+    def _borrow(self):
+        """
+        쿼리 실행용 연결 대여
+
+        트랜잭션 중이면 트랜잭션 연결을, 아니면 풀에서 연결을 빌렸다가 즉시 반환한다.
+        """
+        if self._connection and self.is_transaction_active:
+            yield self._connection
+            return
+
+        connection = self.pool.acquire()
+        try:
+            yield connection
+        finally:
+            self.pool.release(connection)
+
+    def _commit(self, connection) -> None:
+        """트랜잭션 중이 아닐 때만 커밋 (트랜잭션은 commit_transaction에서 커밋)"""
+        if not self.is_transaction_active:
+            connection.commit()
+
+    def _rollback(self, connection) -> None:
+        """트랜잭션 중이 아닐 때만 롤백 (트랜잭션은 rollback_transaction에서 롤백)"""
+        if connection is not None and not self.is_transaction_active:
+            connection.rollback()
+
     def begin_transaction(self):
         """트랜잭션 시작"""
         self.connect()
@@ -85,29 +114,28 @@ class MySQLConnector:
     def execute_query(self, query: str, params: Union[tuple, dict, None] = None, fetch: bool = True) -> Optional[
         List[Dict]]:
         """SQL 쿼리 실행을 위한 공통 메서드"""
-        try:
-            connection = self.get_connection()
+        with self._borrow() as connection:
             cursor = connection.cursor(dictionary=True)
-
-            # 파라미터의 큰따옴표 이스케이프 처리
-            escaped_params = self.escape_quotes(params)
-
-            cursor.execute(query, escaped_params)
-
-            if fetch:
-                result = cursor.fetchall()
-                return result
-            else:
-                connection.commit()
-                return {"affected_rows": cursor.rowcount}
-
-        except Error as e:
-            print(f"쿼리 실행 오류: {e}")
-            if not fetch:
-                connection.rollback()
-            raise
-        finally:
-            cursor.close()
+            try:
+                # 파라미터의 큰따옴표 이스케이프 처리
+                escaped_params = self.escape_quotes(params)
+
+                cursor.execute(query, escaped_params)
+
+                if fetch:
+                    result = cursor.fetchall()
+                    return result
+                else:
+                    self._commit(connection)
+                    return {"affected_rows": cursor.rowcount}
+
+            except Error as e:
+                print(f"쿼리 실행 오류: {e}")
+                if not fetch:
+                    self._rollback(connection)
+                raise
+            finally:
+                cursor.close()
 
     def select(self,
                table: str,
@@ -147,53 +175,93 @@ class MySQLConnector:
 
         return self.execute_query(query, params)
 
-    # utils/mysql_connector.py의 insert 메서드 부분
-
-    def insert(self, table: str, data: Union[Dict, List[Dict]]) -> Dict:
+    @staticmethod
+    def _build_insert_query(table: str,
+                            columns: List[str],
+                            row_count: int,
+                            on_duplicate_update: Optional[List[str]] = None) -> str:
+        """다중 행 INSERT 쿼리 생성 (위치 기반 파라미터)"""
+        row_placeholder = "(" + ", ".join(["%s"] * len(columns)) + ")"
+        query = (f"INSERT INTO {table} ({', '.join(columns)}) "
+                 f"VALUES {', '.join([row_placeholder] * row_count)}")
+
+        if on_duplicate_update:
+            # VALUES(col)는 MySQL 8.0.20부터 폐기 예정이므로 행 별칭(new.col)으로 새 값을 참조
+            updates = ", ".join(f"{col} = new.{col}" for col in on_duplicate_update)
+            query += f" AS new ON DUPLICATE KEY UPDATE {updates}"
+        return query
+
+    def insert(self,
+               table: str,
+               data: Union[Dict, List[Dict]],
+               chunk_size: int = 500,
+               on_duplicate_update: Optional[List[str]] = None) -> Dict:
         """
         INSERT 쿼리 실행
 
+        여러 행은 chunk_size 단위의 다중 행 INSERT로 나누어 전송하고, 모든 청크가 성공한 뒤 한 번만 커밋한다.
+
         Args:
             table (str): 테이블 이름
-            data (Union[Dict, List[Dict]]): 삽입할 데이터
+            data (Union[Dict, List[Dict]]): 삽입할 데이터 (모든 행의 컬럼이 같아야 함)
+            chunk_size (int): 한 번의 INSERT 문에 담을 최대 행 수
+            on_duplicate_update (List[str]): 키 중복 시 갱신할 컬럼 (ON DUPLICATE KEY UPDATE)
 
         Returns:
-            Dict: 영향받은 행 수와 마지막 삽입된 ID
+            Dict: 마지막 삽입된 ID, 생성된 ID 목록, 영향받은 행 수
+                  (upsert 모드에서는 갱신된 행의 ID를 알 수 없으므로 ids가 비어있음)
         """
         if not data:
             raise ValueError("데이터가 비어있습니다.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size는 1 이상이어야 합니다.")
 
         # 단일 딕셔너리를 리스트로 변환
         if isinstance(data, dict):
             data = [data]
 
         columns = list(data[0].keys())
-        placeholders = ', '.join([f'%({col})s' for col in columns])
-        columns_str = ', '.join(columns)
-
-        query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
+        for row in data:
+            if row.keys() != data[0].keys():
+                raise ValueError("모든 행의 컬럼 구성이 같아야 합니다.")
 
-        try:
-            connection = self.get_connection()
+        with self._borrow() as connection:
             cursor = connection.cursor(dictionary=True)
-
-            cursor.execute(query, data[0])  # 현재는 단일 레코드만 처리
-            connection.commit()
-
-            last_id = cursor.lastrowid
-            affected_rows = cursor.rowcount
-
-            return {
-                'id': last_id,
-                'affected_rows': affected_rows
-            }
-
-        except Error as e:
-            print(f"INSERT 쿼리 실행 오류: {e}")
-            connection.rollback()
-            raise
-        finally:
-            cursor.close()
+            try:
+                ids = []
+                last_id = None
+                affected_rows = 0
+
+                for start in range(0, len(data), chunk_size):
+                    chunk = data[start:start + chunk_size]
+                    query = self._build_insert_query(table, columns, len(chunk), on_duplicate_update)
+                    params = [row[col] for row in chunk for col in columns]
+
+                    cursor.execute(query, params)
+                    affected_rows += cursor.rowcount
+
+                    if cursor.lastrowid:
+                        if on_duplicate_update:
+                            last_id = cursor.lastrowid
+                        else:
+                            # 다중 행 INSERT의 lastrowid는 첫 행의 ID이며, 한 문장 안의 ID는 연속으로 할당된다
+                            ids.extend(range(cursor.lastrowid, cursor.lastrowid + len(chunk)))
+                            last_id = ids[-1]
+
+                self._commit(connection)
+
+                return {
+                    'id': last_id,
+                    'ids': ids,
+                    'affected_rows': affected_rows
+                }
+
+            except Error as e:
+                print(f"INSERT 쿼리 실행 오류: {e}")
+                self._rollback(connection)
+                raise
+            finally:
+                cursor.close()
 
     def update(self, table: str, data: Dict, where: Dict) -> Dict:
         """
@@ -210,43 +278,42 @@ class MySQLConnector:
         if not data or not where:
             raise ValueError("데이터와 조건이 모두 필요합니다.")
 
-        try:
-            # SET 절 생성 (using named parameters)
-            set_clauses = []
-            params = {}
+        # SET 절 생성 (using named parameters)
+        set_clauses = []
+        params = {}
 
-            for key, value in data.items():
-                set_clauses.append(f"{key} = %({key})s")
-                params[key] = value
+        for key, value in data.items():
+            set_clauses.append(f"{key} = %({key})s")
+            params[key] = value
 
-            # WHERE 절 생성
-            where_clauses = []
-            for key, value in where.items():
-                where_key = f"where_{key}"  # 파라미터 이름 충돌 방지
-                where_clauses.append(f"{key} = %({where_key})s")
-                params[where_key] = value
+        # WHERE 절 생성
+        where_clauses = []
+        for key, value in where.items():
+            where_key = f"where_{key}"  # 파라미터 이름 충돌 방지
+            where_clauses.append(f"{key} = %({where_key})s")
+            params[where_key] = value
 
-            set_clause = ", ".join(set_clauses)
-            where_clause = " AND ".join(where_clauses)
+        set_clause = ", ".join(set_clauses)
+        where_clause = " AND ".join(where_clauses)
 
-            query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
+        query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
 
-            connection = self.get_connection()
+        with self._borrow() as connection:
             cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(query, params)
+                self._commit(connection)
 
-            cursor.execute(query, params)
-            connection.commit()
-
-            return {
-                'affected_rows': cursor.rowcount
-            }
+                return {
+                    'affected_rows': cursor.rowcount
+                }
 
-        except Error as e:
-            print(f"UPDATE 쿼리 실행 오류: {e}")
-            connection.rollback()
-            raise
-        finally:
-            cursor.close()
+            except Error as e:
+                print(f"UPDATE 쿼리 실행 오류: {e}")
+                self._rollback(connection)
+                raise
+            finally:
+                cursor.close()
 
     def delete(self, table: str, where: Dict) -> Dict:
         """
@@ -269,34 +336,83 @@ class MySQLConnector:
 
     def execute_raw_query(self, query: str, params: Union[tuple, dict, list, None] = None) -> Optional[List[Dict]]:
         """직접 작성한 SQL 쿼리 실행"""
-        connection = None
-        cursor = None
-        try:
-            # 새로운 연결 생성
-            connection = mysql.connector.connect(**self.config)
-            cursor = connection.cursor(dictionary=True, buffered=True)  # buffered=True 추가
+        is_read = query.strip().upper().startswith(('SELECT', 'SHOW', 'DESC'))
+
+        with self._borrow() as connection:
+            cursor = None
+            try:
+                cursor = connection.cursor(dictionary=True, buffered=True)  # buffered=True 추가
+
+                if isinstance(params, (list, tuple)):
+                    cursor.execute(query, params)
+                elif isinstance(params, dict):
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+
+                if is_read:
+                    result = cursor.fetchall()
+                    return result
+                else:
+                    self._commit(connection)
+                    return {"affected_rows": cursor.rowcount}
+
+            except Error as e:
+                print(f"쿼리 실행 오류: {e}")
+                if not is_read:
+                    self._rollback(connection)
+                raise
+            finally:
+                if cursor:
+                    cursor.close()
+
+    def stream_query(self,
+                     query: str,
+                     params: Union[tuple, dict, list, None] = None,
+                     batch_size: int = 1000,
+                     as_tuples: bool = False,
+                     yield_batches: bool = False) -> Iterator[Any]:
+        """
+        대용량 SELECT 결과를 서버 측(unbuffered) 커서로 스트리밍
 
-            if isinstance(params, (list, tuple)):
-                cursor.execute(query, params)
-            elif isinstance(params, dict):
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
+        전체 결과를 메모리에 올리지 않고 batch_size 단위로 읽어 지연 반환한다.
+        스트리밍 중에는 해당 연결에서 다른 쿼리를 실행할 수 없으므로, 트랜잭션 중이라면
+        반복이 끝난 뒤에 다음 쿼리를 실행해야 한다.
 
-            if query.strip().upper().startswith(('SELECT', 'SHOW', 'DESC')):
-                result = cursor.fetchall()
-                return result
-            else:
-                connection.commit()
-                return {"affected_rows": cursor.rowcount}
+        Args:
+            query (str): SELECT 쿼리
+            params: 쿼리 파라미터
+            batch_size (int): 한 번에 읽어올 행 수
+            as_tuples (bool): True면 dict 대신 tuple로 반환 (행당 할당 감소)
+            yield_batches (bool): True면 행 대신 batch_size 크기의 리스트를 반환
+
+        Yields:
+            행(dict 또는 tuple) 또는 행 리스트
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size는 1 이상이어야 합니다.")
 
-        except Error as e:
-            print(f"쿼리 실행 오류: {e}")
-            if connection and not query.strip().upper().startswith(('SELECT', 'SHOW', 'DESC')):
-                connection.rollback()
-            raise
-        finally:
-            if cursor:
-                cursor.close()
-            if connection:
-                connection.close()
+        with self._borrow() as connection:
+            cursor = connection.cursor(dictionary=not as_tuples, buffered=False)
+            try:
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    if yield_batches:
+                        yield rows
+                    else:
+                        yield from rows
+
+            except Error as e:
+                print(f"스트리밍 쿼리 실행 오류: {e}")
+                raise
+            finally:
+                # 중간에 반복을 멈춘 경우 남은 결과를 비워야 연결을 재사용할 수 있다
+                try:
+                    if connection.unread_result:
+                        connection.consume_results()
+                    cursor.close()
+                except Error as e:
+                    logger.warning(f"스트리밍 커서 정리 실패: {e}")
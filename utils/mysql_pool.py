@@ -0,0 +1,246 @@
+# utils/mysql_pool.py
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import mysql.connector
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
+
+from configs.mysql_setting import MYSQL_CONFIG, MYSQL_POOL_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class MySQLConnectionPool:
+    """
+    프로세스 전역 MySQL 커넥션 풀
+
+    요청마다 새 연결을 맺는 대신 미리 맺어둔 연결을 빌려주고 돌려받는다.
+    체크아웃 대기 시간 제한, 사용 전 ping(pre-ping), 오래된 연결 재생성(recycle)을 지원한다.
+    """
+
+    def __init__(
+            self,
+            config: Dict,
+            pool_size: int = 10,
+            timeout: float = 30.0,
+            pre_ping: bool = True,
+            recycle: int = 3600
+    ):
+        """
+        커넥션 풀 초기화
+
+        Args:
+            config: mysql.connector.connect()에 전달할 연결 설정
+            pool_size: 최대 연결 수
+            timeout: 연결 체크아웃 최대 대기 시간(초)
+            pre_ping: 체크아웃 시 연결 상태 확인 여부
+            recycle: 연결 최대 수명(초), 0 이하면 재생성하지 않음
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size는 1 이상이어야 합니다.")
+
+        self.config = config
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.pre_ping = pre_ping
+        self.recycle = recycle
+
+        self._idle = deque()  # (connection, created_at)
+        self._created_at: Dict[int, float] = {}
+        self._opened = 0  # 현재 열려있는 연결 수 (사용 중 + 유휴)
+        self._cond = threading.Condition(threading.Lock())
+
+        # 통계
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._recycled = 0
+        self._ping_failures = 0
+
+    def _open(self):
+        """새 연결 생성"""
+        connection = mysql.connector.connect(**self.config)
+        self._created_at[id(connection)] = time.monotonic()
+        return connection
+
+    def _discard(self, connection) -> None:
+        """연결을 풀에서 제거하고 닫기"""
+        self._created_at.pop(id(connection), None)
+        try:
+            connection.close()
+        except Error as e:
+            logger.debug(f"연결 종료 중 오류 (무시): {e}")
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.recycle > 0 and time.monotonic() - created_at > self.recycle
+
+    def _is_alive(self, connection) -> bool:
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Error:
+            return False
+
+    def acquire(self):
+        """
+        풀에서 연결을 빌린다
+
+        Returns:
+            MySQL 연결 객체
+
+        Raises:
+            PoolError: timeout 내에 연결을 얻지 못한 경우
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout
+        waited = False
+        connection = None
+        created_at = None
+
+        with self._cond:
+            while True:
+                if self._idle:
+                    connection, created_at = self._idle.pop()
+                    break
+                if self._opened < self.pool_size:
+                    self._opened += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolError(
+                        f"MySQL 커넥션 풀 대기 시간 초과 ({self.timeout}초, pool_size={self.pool_size})"
+                    )
+                waited = True
+                self._cond.wait(remaining)
+
+            wait_time = time.monotonic() - started
+            self._checkouts += 1
+            if waited:
+                self._waits += 1
+            self._total_wait += wait_time
+            self._max_wait = max(self._max_wait, wait_time)
+
+        try:
+            if connection is not None:
+                if self._is_expired(created_at):
+                    self._recycled += 1
+                    self._discard(connection)
+                    connection = None
+                elif self.pre_ping and not self._is_alive(connection):
+                    self._ping_failures += 1
+                    self._discard(connection)
+                    connection = None
+
+            if connection is None:
+                connection = self._open()
+            return connection
+
+        except Exception:
+            # 슬롯 반환
+            with self._cond:
+                self._opened -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, connection) -> None:
+        """
+        빌린 연결을 풀에 반환
+
+        Args:
+            connection: acquire()로 얻은 연결
+        """
+        if connection is None:
+            return
+
+        reusable = True
+        try:
+            # 트랜잭션/읽기 스냅샷이 남아있으면 정리 후 반환
+            if connection.is_connected():
+                if connection.in_transaction:
+                    connection.rollback()
+            else:
+                reusable = False
+        except Error as e:
+            logger.warning(f"반환된 연결 정리 실패, 연결을 폐기합니다: {e}")
+            reusable = False
+
+        created_at = self._created_at.get(id(connection))
+        if created_at is None or self._is_expired(created_at):
+            reusable = False
+
+        with self._cond:
+            if reusable:
+                self._idle.append((connection, created_at))
+            else:
+                self._opened -= 1
+            self._cond.notify()
+
+        if not reusable:
+            self._discard(connection)
+
+    def dispose(self) -> None:
+        """유휴 연결을 모두 닫는다 (사용 중인 연결은 반환 시점에 정리)"""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._opened -= len(idle)
+            self._cond.notify_all()
+
+        for connection, _ in idle:
+            self._discard(connection)
+        logger.info(f"MySQL 커넥션 풀 정리 완료: {len(idle)}개 연결 종료")
+
+    def stats(self) -> Dict:
+        """
+        풀 사용 통계
+
+        Returns:
+            크기, 사용 중/유휴 연결 수, 대기 시간 등의 통계
+        """
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                "pool_size": self.pool_size,
+                "opened": self._opened,
+                "in_use": self._opened - idle,
+                "idle": idle,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": round(self._total_wait / self._checkouts * 1000, 3) if self._checkouts else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 3),
+                "recycled": self._recycled,
+                "ping_failures": self._ping_failures
+            }
+
+
+_pool: Optional[MySQLConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> MySQLConnectionPool:
+    """프로세스 전역 커넥션 풀 반환 (최초 호출 시 생성)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = MySQLConnectionPool(MYSQL_CONFIG, **MYSQL_POOL_CONFIG)
+                logger.info(
+                    f"MySQL 커넥션 풀 생성: size={_pool.pool_size}, timeout={_pool.timeout}s, "
+                    f"pre_ping={_pool.pre_ping}, recycle={_pool.recycle}s"
+                )
+    return _pool
+
+
+def dispose_pool() -> None:
+    """전역 커넥션 풀 정리"""
+    if _pool is not None:
+        _pool.dispose()
@@ -1,6 +1,8 @@
 # utils/pagination.py
+import base64
+import json
 from dataclasses import dataclass
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, List, Any
 
 T = TypeVar('T')
 
@@ -23,3 +25,35 @@ class PageResponse(Generic[T]):
     @property
     def has_prev(self) -> bool:
         return self.page > 1
+
+
+def encode_cursor(*values) -> str:
+    """
+    키셋 페이지네이션용 불투명 커서 생성
+
+    Args:
+        values: 마지막 행의 정렬 키 값들 (datetime은 문자열로 변환)
+
+    Returns:
+        URL-safe base64 문자열
+    """
+    payload = json.dumps(values, default=str, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, length: int) -> List[Any]:
+    """
+    encode_cursor로 만든 커서 해석
+
+    Raises:
+        ValueError: 커서 형식이 잘못되었거나 값 개수가 length와 다른 경우
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError:
+        raise ValueError("잘못된 커서입니다.")
+
+    if not isinstance(values, list) or len(values) != length:
+        raise ValueError("잘못된 커서입니다.")
+    return values